@@ -1,3 +1,34 @@
 # Afterhours Lead Engine
 # Processes leads, detects decision-makers, manages queue with SAFE MODE
+#
+# Public classes are loaded lazily on first attribute access (PEP 562), so
+# `import lead_engine` stays cheap and never pulls in optional integrations
+# such as sync_to_queue (Google client libraries).
 
+import importlib
+
+_LAZY_ATTRS = {
+    "Lead": "lead_engine.lead_processor",
+    "LeadProcessor": "lead_engine.lead_processor",
+    "LeadSourceLoader": "lead_engine.lead_sources",
+    "DecisionMakerDetector": "lead_engine.decision_maker_detector",
+    "LeadRanker": "lead_engine.lead_ranker",
+    "LeadSegmenter": "lead_engine.lead_segmenter",
+    "QueueManager": "lead_engine.queue_manager",
+    "LeadEngineConfig": "lead_engine.config",
+}
+
+__all__ = sorted(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'lead_engine' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
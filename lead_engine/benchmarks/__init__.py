@@ -0,0 +1,2 @@
+# Lead Engine benchmarks
+# Startup-time and pipeline throughput measurements
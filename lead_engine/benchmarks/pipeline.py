@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+End-to-end Lead Pipeline Benchmark
+
+Generates a synthetic lead CSV, runs it through cli.process_leads and times
+every stage (load, deduplicate, validate, detect, rank, filter, segment,
+export) separately. Reports rows/sec per stage and the process's peak RSS,
+and writes the results as JSON so runs can be compared over time. Peak RSS
+is a process-wide high-water mark, so it is reported once for the whole run;
+`--trace-memory` adds each stage's own Python heap peak (tracemalloc, which
+slows every stage down).
+
+Usage:
+    python -m lead_engine.benchmarks.pipeline --rows 100000
+    python -m lead_engine.benchmarks.pipeline --rows 1000000 --output bench/pipeline_1m.json
+    python -m lead_engine.benchmarks.pipeline --input existing_leads.csv
+    python -m lead_engine.benchmarks.pipeline --rows 100000 --trace-memory
+
+Note: process_leads holds all leads in memory, so peak RSS grows with --rows.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from lead_engine.benchmarks.synthetic_leads import write_csv
+from lead_engine.cli import process_leads
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    if sys.platform == "darwin":
+        return round(peak / (1024 * 1024), 1)
+    return round(peak / 1024, 1)
+
+
+def run_benchmark(
+    rows: int = 100000,
+    seed: int = 42,
+    schema: str = "mixed",
+    duplicate_rate: float = 0.05,
+    input_file: Optional[str] = None,
+    config_file: Optional[str] = None,
+    workdir: Optional[str] = None,
+    trace_memory: bool = False
+) -> Dict:
+    """
+    Run the pipeline benchmark
+
+    Args:
+        rows: Synthetic rows to generate (ignored with input_file)
+        seed: Generator seed
+        schema: Generator header schema
+        duplicate_rate: Generator duplicate rate
+        input_file: Benchmark an existing CSV/JSON instead of generating one
+        config_file: Lead engine config file
+        workdir: Directory for generated input/output (default: temp dir)
+        trace_memory: Record each stage's Python heap peak (slower)
+
+    Returns:
+        Benchmark result dict (JSON-serializable)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = workdir or tmp
+        result: Dict = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "stages": [],
+        }
+
+        if input_file is None:
+            input_file = os.path.join(workdir, f"synthetic_{rows}.csv")
+            start = time.perf_counter()
+            generator = write_csv(input_file, rows, seed=seed, schema=schema, duplicate_rate=duplicate_rate)
+            result["generate"] = {
+                "rows": rows,
+                "schema": generator.schema_name,
+                "duplicate_rate": duplicate_rate,
+                "seconds": round(time.perf_counter() - start, 4),
+            }
+        result["input_file"] = input_file
+        result["input_bytes"] = os.path.getsize(input_file)
+
+        stages: List[Dict] = result["stages"]
+
+        def record_stage(name: str, rows_in: int, seconds: float):
+            stage = {
+                "stage": name,
+                "rows": rows_in,
+                "seconds": round(seconds, 6),
+                "rows_per_sec": round(rows_in / seconds, 1) if seconds > 0 else None,
+            }
+            if trace_memory:
+                # Peak since the previous stage ended, i.e. during this stage
+                stage["heap_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 1)
+                tracemalloc.reset_peak()
+            stages.append(stage)
+
+        output_file = os.path.join(workdir, "processed.csv")
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                process_leads(
+                    input_file,
+                    output_file,
+                    safe_mode=True,
+                    config_file=config_file,
+                    stage_hook=record_stage
+                )
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+        total = time.perf_counter() - start
+
+        rows_in = stages[0]["rows"] if stages else 0
+        result["total"] = {
+            "rows": rows_in,
+            "seconds": round(total, 4),
+            "rows_per_sec": round(rows_in / total, 1) if total > 0 else None,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        return result
+
+
+def format_report(result: Dict) -> str:
+    """Human-readable table for a benchmark result"""
+    lines = [f"{'stage':<12} {'rows':>10} {'seconds':>10} {'rows/sec':>12} {'heap peak MB':>12}"]
+    for stage in result["stages"] + [dict(result["total"], stage="TOTAL")]:
+        rps = stage["rows_per_sec"]
+        heap = stage.get("heap_peak_mb")
+        lines.append(
+            f"{stage['stage']:<12} {stage['rows']:>10} {stage['seconds']:>10.4f} "
+            f"{(f'{rps:.0f}' if rps else '-'):>12} {(f'{heap:.1f}' if heap is not None else '-'):>12}"
+        )
+    rss = result["total"]["peak_rss_mb"]
+    lines.append(f"Peak RSS (whole process): {f'{rss:.1f} MB' if rss is not None else 'unavailable'}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the lead processing pipeline")
+    parser.add_argument("--rows", type=int, default=100000, help="Synthetic rows (default: 100000)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--schema", default="mixed")
+    parser.add_argument("--duplicate-rate", type=float, default=0.05)
+    parser.add_argument("--input", help="Benchmark an existing CSV/JSON file instead")
+    parser.add_argument("--config", "-c", help="Config file path")
+    parser.add_argument("--output", "-o", help="Write JSON results to this file")
+    parser.add_argument("--trace-memory", action="store_true", help="Per-stage Python heap peaks (slower)")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(
+        rows=args.rows,
+        seed=args.seed,
+        schema=args.schema,
+        duplicate_rate=args.duplicate_rate,
+        input_file=args.input,
+        config_file=args.config,
+        trace_memory=args.trace_memory
+    )
+    print(format_report(result))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
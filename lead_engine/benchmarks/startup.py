@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+CLI cold-start benchmark
+
+Runs a fresh interpreter with `python -X importtime` and parses the per-module
+import timings, so startup regressions (and accidental imports of heavy
+optional dependencies) show up as numbers instead of a vague "feels slow".
+
+Usage:
+    python -m lead_engine.benchmarks.startup
+    python -m lead_engine.benchmarks.startup --module lead_engine.cli --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Modules that must never be imported by `cli process` on a CSV
+HEAVY_MODULE_PREFIXES = ("gspread", "google", "googleapiclient")
+
+
+@dataclass
+class ImportTiming:
+    """Single row of -X importtime output"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    """Parsed import timings for one cold start"""
+    code: str
+    timings: List[ImportTiming]
+
+    @property
+    def modules(self) -> List[str]:
+        return [t.module for t in self.timings]
+
+    @property
+    def total_us(self) -> int:
+        """Sum of self time over all imported modules"""
+        return sum(t.self_us for t in self.timings)
+
+    def cumulative_us(self, module: str) -> Optional[int]:
+        """Cumulative import time of a module (None if not imported)"""
+        for t in self.timings:
+            if t.module == module:
+                return t.cumulative_us
+        return None
+
+    def heavy_modules(self, prefixes=HEAVY_MODULE_PREFIXES) -> List[str]:
+        """Imported modules matching any of the heavy-module prefixes"""
+        return [m for m in self.modules if m.split('.')[0] in prefixes]
+
+    def slowest(self, n: int = 10) -> List[ImportTiming]:
+        return sorted(self.timings, key=lambda t: t.self_us, reverse=True)[:n]
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    """Parse `-X importtime` stderr lines"""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ImportTiming(
+            module=stripped,
+            self_us=int(parts[0]),
+            cumulative_us=int(parts[1]),
+            depth=(len(name) - len(stripped)) // 2
+        ))
+    return timings
+
+
+def measure_startup(code: str = "import lead_engine.cli", env: Optional[Dict[str, str]] = None) -> StartupReport:
+    """
+    Run `code` in a fresh interpreter with -X importtime
+
+    Args:
+        code: Python source to run (typically an import or a CLI invocation)
+        env: Extra environment variables
+    """
+    run_env = dict(os.environ)
+    run_env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), run_env.get("PYTHONPATH")]))
+    run_env.pop("PYTHONPROFILEIMPORTTIME", None)
+    if env:
+        run_env.update(env)
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=run_env,
+        cwd=str(REPO_ROOT)
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Startup run failed ({proc.returncode}): {proc.stderr[-2000:]}")
+    return StartupReport(code=code, timings=parse_importtime(proc.stderr))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure lead_engine cold-start import time")
+    parser.add_argument("--module", default="lead_engine.cli", help="Module to import")
+    parser.add_argument("--top", type=int, default=10, help="Show N slowest modules")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Exit non-zero if over budget")
+    args = parser.parse_args()
+
+    report = measure_startup(f"import {args.module}")
+    cumulative_ms = (report.cumulative_us(args.module) or 0) / 1000
+
+    print(f"{args.module}: {cumulative_ms:.1f} ms cumulative, {len(report.timings)} modules imported")
+    print(f"Slowest {args.top} modules (self time):")
+    for t in report.slowest(args.top):
+        print(f"  {t.self_us / 1000:8.2f} ms  {t.module}")
+
+    heavy = report.heavy_modules()
+    if heavy:
+        print(f"Heavy optional modules imported: {', '.join(heavy)}")
+
+    if args.budget_ms is not None and cumulative_ms > args.budget_ms:
+        print(f"Over budget: {cumulative_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Synthetic Lead Generator
+
+Generates realistic-looking lead CSVs for benchmarks and load tests:
+- Column-name variety (the header variants LeadProcessor._extract_field accepts)
+- Email patterns that exercise DecisionMakerDetector (first.last@, owner@,
+  info@, generic123@, ...) plus a small share of invalid emails
+- Free-text industries and sizes that go through normalization
+- Exact and near duplicates at a configurable rate
+
+Rows are streamed, so memory stays flat up to 10M+ rows.
+
+Usage:
+    python -m lead_engine.benchmarks.synthetic_leads leads.csv --rows 1000000
+    python -m lead_engine.benchmarks.synthetic_leads leads.csv --rows 10000000 --schema crm --duplicate-rate 0.1
+"""
+
+import argparse
+import csv
+import random
+import sys
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional
+
+
+# Header variants seen in real exports, keyed by logical field
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "canonical": {
+        "business_name": "business_name", "email": "contact_email", "contact_name": "contact_name",
+        "phone": "contact_phone", "website": "website", "industry": "industry",
+        "city": "location_city", "state": "location_state", "size": "size",
+    },
+    "crm": {
+        "business_name": "Company", "email": "Email", "contact_name": "Name",
+        "phone": "Phone", "website": "Website", "industry": "Category",
+        "city": "City", "state": "State", "size": "Employees",
+    },
+    "scraper": {
+        "business_name": "organization", "email": "e-mail", "contact_name": "owner",
+        "phone": "telephone", "website": "url", "industry": "business_type",
+        "city": "town", "state": "region", "size": "team_size",
+    },
+    "sheet": {
+        "business_name": "Business", "email": "Email_Address", "contact_name": "Decision_Maker",
+        "phone": "Phone_Number", "website": "Domain", "industry": "Sector",
+        "city": "City", "state": "Province", "size": "Employee_Count",
+    },
+}
+
+FIRST_NAMES = [
+    "john", "maria", "david", "sarah", "michael", "jennifer", "james", "linda", "robert",
+    "patricia", "carlos", "aisha", "wei", "priya", "tom", "emily", "daniel", "grace",
+]
+LAST_NAMES = [
+    "smith", "garcia", "johnson", "lee", "brown", "nguyen", "martinez", "davis", "patel",
+    "wilson", "anderson", "thomas", "clark", "lopez", "walker", "young", "king", "hill",
+]
+BUSINESS_WORDS = [
+    "Summit", "Coastal", "Pioneer", "Blue Ridge", "Evergreen", "Harbor", "Liberty", "Golden",
+    "Northside", "Redwood", "Keystone", "Silverline", "Oakwood", "Bright", "Cornerstone",
+]
+# (business suffix, raw industry text) - raw text goes through _normalize_industry
+INDUSTRIES = [
+    ("Law", "Law Firm"), ("Legal Group", "attorney"), ("Family Dental", "dental clinic"),
+    ("Medical", "Medical Practice"), ("Realty", "Real Estate"), ("Properties", "realtor"),
+    ("Consulting", "consulting"), ("Advisors", "Professional Services"),
+    ("Plumbing", "plumber"), ("Electric", "Electrician"), ("HVAC", "home services"),
+    ("CPA", "accounting"), ("Tax Services", "tax"), ("Marketing", "digital marketing"),
+    ("Software", "SaaS"), ("Outfitters", "online store"), ("Bakery", "bakery"), ("Salon", ""),
+]
+BUSINESS_SUFFIXES = ["", " LLC", " Inc", " & Co", " Group"]
+SIZES = ["solo", "just me", "2-10", "3-5", "small", "15 employees", "11-50", "growing", "50+",
+         "enterprise", "120", "", ""]
+LOCATIONS = [
+    ("Austin", "TX"), ("Irvine", "CA"), ("Denver", "CO"), ("Phoenix", "AZ"), ("Tampa", "FL"),
+    ("Portland", "OR"), ("Columbus", "OH"), ("Raleigh", "NC"), ("Boise", "id"), ("Reno", "nv"),
+]
+ROLE_INBOXES = ["info", "contact", "hello", "support", "sales", "office", "team", "admin"]
+DM_INBOXES = ["owner", "founder", "ceo", "president", "director", "partner"]
+
+
+class SyntheticLeadGenerator:
+    """Deterministic (seeded) generator of raw lead rows"""
+
+    def __init__(
+        self,
+        seed: int = 42,
+        schema: str = "mixed",
+        duplicate_rate: float = 0.05,
+        invalid_rate: float = 0.02,
+        duplicate_pool_size: int = 10000
+    ):
+        """
+        Args:
+            seed: Random seed (same seed = same file)
+            schema: Header variant name from SCHEMAS, or "mixed" to pick one per file
+            duplicate_rate: Share of rows that repeat an earlier lead (exact or near)
+            invalid_rate: Share of rows with an invalid/missing email
+            duplicate_pool_size: How many recent rows duplicates are drawn from
+        """
+        self.rng = random.Random(seed)
+        if schema == "mixed":
+            schema = self.rng.choice(sorted(SCHEMAS))
+        if schema not in SCHEMAS:
+            raise ValueError(f"Unknown schema '{schema}'. Available: mixed, {', '.join(sorted(SCHEMAS))}")
+        self.schema_name = schema
+        self.columns = SCHEMAS[schema]
+        self.duplicate_rate = duplicate_rate
+        self.invalid_rate = invalid_rate
+        self._recent: deque = deque(maxlen=duplicate_pool_size)
+        self._counter = 0
+
+    @property
+    def fieldnames(self) -> List[str]:
+        return list(self.columns.values())
+
+    def rows(self, n: int) -> Iterator[Dict[str, str]]:
+        """Yield n raw rows keyed by this generator's header names"""
+        rng = self.rng
+        for _ in range(n):
+            if self._recent and rng.random() < self.duplicate_rate:
+                yield self._duplicate(rng.choice(self._recent))
+                continue
+            row = self._new_row()
+            self._recent.append(row)
+            yield row
+
+    def _new_row(self) -> Dict[str, str]:
+        rng = self.rng
+        self._counter += 1
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        suffix, industry = rng.choice(INDUSTRIES)
+        word = rng.choice(BUSINESS_WORDS)
+        business = f"{word} {suffix}{rng.choice(BUSINESS_SUFFIXES)} {self._counter}"
+        domain = f"{word.lower().replace(' ', '')}{suffix.lower().replace(' ', '').replace('&', '')}{self._counter}.com"
+        city, state = rng.choice(LOCATIONS)
+
+        email = self._email(first, last, domain)
+        contact_name = f"{first.title()} {last.title()}" if rng.random() < 0.7 else ""
+        if contact_name and rng.random() < 0.1:
+            contact_name += rng.choice([", Owner", " (Founder)", " - CEO"])
+
+        phone = ""
+        if rng.random() < 0.8:
+            digits = f"{rng.randint(200, 999)}{rng.randint(200, 999)}{rng.randint(0, 9999):04d}"
+            phone = rng.choice([
+                f"({digits[:3]}) {digits[3:6]}-{digits[6:]}",
+                f"{digits[:3]}-{digits[3:6]}-{digits[6:]}",
+                f"+1{digits}",
+                digits,
+            ])
+
+        c = self.columns
+        return {
+            c["business_name"]: business,
+            c["email"]: email,
+            c["contact_name"]: contact_name,
+            c["phone"]: phone,
+            c["website"]: domain if rng.random() < 0.6 else "",
+            c["industry"]: industry,
+            c["city"]: city,
+            c["state"]: state,
+            c["size"]: rng.choice(SIZES),
+        }
+
+    def _email(self, first: str, last: str, domain: str) -> str:
+        rng = self.rng
+        if rng.random() < self.invalid_rate:
+            return rng.choice(["", f"{first}.{last}", f"{first}@", f"{first} at {domain}"])
+        pattern = rng.random()
+        if pattern < 0.30:
+            local = f"{first}.{last}"
+        elif pattern < 0.50:
+            local = first
+        elif pattern < 0.75:
+            local = rng.choice(ROLE_INBOXES)
+        elif pattern < 0.85:
+            local = rng.choice(DM_INBOXES)
+        elif pattern < 0.95:
+            local = f"{first}{rng.randint(1, 999)}"
+        else:
+            local = f"{first[0]}{last}"
+        email = f"{local}@{domain}"
+        return email.upper() if rng.random() < 0.03 else email
+
+    def _duplicate(self, row: Dict[str, str]) -> Dict[str, str]:
+        """Exact duplicate, or near duplicate that dedup should still catch"""
+        rng = self.rng
+        dup = dict(row)
+        variant = rng.random()
+        c = self.columns
+        if variant < 0.4:
+            dup[c["email"]] = dup[c["email"]].upper()
+        elif variant < 0.6:
+            # Same business + city, different inbox
+            dup[c["email"]] = "info@" + dup[c["email"]].split("@")[-1]
+        elif variant < 0.7:
+            dup[c["phone"]] = ""
+        return dup
+
+
+def write_csv(
+    path: str,
+    rows: int,
+    seed: int = 42,
+    schema: str = "mixed",
+    duplicate_rate: float = 0.05,
+    invalid_rate: float = 0.02
+) -> SyntheticLeadGenerator:
+    """Stream `rows` synthetic leads to a CSV file; returns the generator used"""
+    generator = SyntheticLeadGenerator(
+        seed=seed,
+        schema=schema,
+        duplicate_rate=duplicate_rate,
+        invalid_rate=invalid_rate
+    )
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=generator.fieldnames)
+        writer.writeheader()
+        writer.writerows(generator.rows(rows))
+    return generator
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic lead CSVs")
+    parser.add_argument("output", help="Output CSV path")
+    parser.add_argument("--rows", type=int, default=10000, help="Number of rows (default: 10000)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--schema", default="mixed", choices=["mixed"] + sorted(SCHEMAS))
+    parser.add_argument("--duplicate-rate", type=float, default=0.05)
+    parser.add_argument("--invalid-rate", type=float, default=0.02)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    generator = write_csv(
+        args.output,
+        args.rows,
+        seed=args.seed,
+        schema=args.schema,
+        duplicate_rate=args.duplicate_rate,
+        invalid_rate=args.invalid_rate
+    )
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {args.rows} rows ({generator.schema_name} schema) to {args.output} "
+          f"in {elapsed:.1f}s ({args.rows / elapsed:.0f} rows/sec)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,27 +6,54 @@ Usage:
     python -m lead_engine.cli process leads.csv --output processed_leads.csv
     python -m lead_engine.cli process leads.csv --output processed_leads.csv --safe-mode
     python -m lead_engine.cli process leads.csv --output processed_leads.csv --no-safe-mode
+    python -m lead_engine.cli process leads.csv --output processed_leads.csv --profile legal_push
+    python -m lead_engine.cli watch inbox/ --output-dir processed/
 """
 
 import argparse
 import csv
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Optional
 
-from lead_engine.lead_sources import LeadSourceLoader
-from lead_engine.lead_processor import LeadProcessor
-from lead_engine.decision_maker_detector import DecisionMakerDetector
-from lead_engine.lead_ranker import LeadRanker
-from lead_engine.lead_segmenter import LeadSegmenter
-from lead_engine.queue_manager import QueueManager, EmailType
 from lead_engine.config import LeadEngineConfig
 
+# Pipeline stages are imported inside the commands that use them so CLI startup
+# (and `--help`) only pays for what the chosen command needs.
+
+# stage_hook(stage_name, rows_in, seconds) - used by benchmarks
+StageHook = Callable[[str, int, float], None]
+
+
+class _Stage:
+    """Row count for a timed pipeline stage"""
+    __slots__ = ('rows',)
+    
+    def __init__(self, rows: int = 0):
+        self.rows = rows
+
+
+@contextmanager
+def _timed_stage(stage_hook: Optional[StageHook], name: str, rows: int = 0):
+    """Time a pipeline stage and report it to stage_hook (no-op without a hook)"""
+    stage = _Stage(rows)
+    if stage_hook is None:
+        yield stage
+        return
+    start = time.perf_counter()
+    yield stage
+    stage_hook(name, stage.rows, time.perf_counter() - start)
+
 
 def process_leads(
     input_file: str,
     output_file: str,
     safe_mode: bool = True,
-    config_file: str = None
+    config_file: str = None,
+    profile: str = None,
+    stage_hook: Optional[StageHook] = None
 ):
     """
     Process leads from input file and output processed CSV
@@ -36,26 +63,39 @@ def process_leads(
         output_file: Path to output CSV file
         safe_mode: Whether to enable SAFE_MODE
         config_file: Path to config file
+        profile: Scoring profile for all leads (default: route by segment)
+        stage_hook: Called as stage_hook(name, rows_in, seconds) after each stage
     """
+    from lead_engine.lead_sources import LeadSourceLoader
+    from lead_engine.lead_processor import LeadProcessor
+    from lead_engine.decision_maker_detector import DecisionMakerDetector
+    from lead_engine.lead_ranker import LeadRanker
+    from lead_engine.lead_segmenter import LeadSegmenter
+    
     # Load config
     config = LeadEngineConfig(config_file)
     if safe_mode is not None:
         config.safe_mode = safe_mode
+    settings = config.snapshot
     
     print(f"Loading leads from {input_file}...")
     
     # Load leads
-    loader = LeadSourceLoader()
-    leads = loader.load_from_file(input_file)
+    with _timed_stage(stage_hook, "load") as stage:
+        loader = LeadSourceLoader()
+        leads = loader.load_from_file(input_file)
+        stage.rows = len(leads)
     print(f"Loaded {len(leads)} leads")
     
     # Deduplicate
-    processor = LeadProcessor()
-    unique_leads = processor.deduplicate(leads)
+    with _timed_stage(stage_hook, "deduplicate", len(leads)):
+        processor = LeadProcessor()
+        unique_leads = processor.deduplicate(leads)
     print(f"Found {len(unique_leads)} unique leads, {len(processor.duplicates)} duplicates")
     
     # Validate
-    valid_leads, invalid_leads = processor.validate_leads(unique_leads)
+    with _timed_stage(stage_hook, "validate", len(unique_leads)):
+        valid_leads, invalid_leads = processor.validate_leads(unique_leads)
     print(f"Valid: {len(valid_leads)}, Invalid: {len(invalid_leads)}")
     
     if invalid_leads:
@@ -65,42 +105,53 @@ def process_leads(
     
     # Detect decision-makers
     print("\nDetecting decision-makers...")
-    detector = DecisionMakerDetector()
-    scored_leads = detector.batch_detect(valid_leads)
+    with _timed_stage(stage_hook, "detect", len(valid_leads)):
+        detector = DecisionMakerDetector(settings.ranking.decision_maker_threshold)
+        scored_leads = detector.batch_detect(valid_leads)
     
     decision_makers = [l for l in scored_leads if l.is_decision_maker_likely]
     print(f"Decision-makers: {len(decision_makers)}/{len(scored_leads)}")
     
     # Rank leads
     print("\nRanking leads...")
-    ranker = LeadRanker()
-    ranked_leads = ranker.rank_leads(scored_leads)
+    with _timed_stage(stage_hook, "rank", len(scored_leads)):
+        ranker = LeadRanker(config, profile=profile)
+        ranked_leads = ranker.rank_leads(scored_leads)
     
     # Filter by minimum score
-    min_score = config.get("ranking.min_score", 0.3)
-    filtered_leads = ranker.filter_by_rank(ranked_leads, min_score)
+    min_score = settings.ranking.min_score
+    # ranked_leads is already scored, so filter directly instead of re-ranking
+    with _timed_stage(stage_hook, "filter", len(ranked_leads)):
+        filtered_leads = [l for l in ranked_leads if l.raw_data.get('rank_score', 0) >= min_score]
     print(f"Leads above threshold ({min_score}): {len(filtered_leads)}")
+    for metrics in ranker.get_profile_metrics():
+        print(f"  Profile {metrics['profile']}: {metrics['leads_scored']} scored, "
+              f"{metrics['leads_per_second']:.0f} leads/sec")
     
     # Segment leads
     print("\nSegmenting leads...")
-    segmenter = LeadSegmenter()
-    segments = segmenter.segment_by_industry(filtered_leads)
-    summary = segmenter.get_segment_summary(segments)
+    with _timed_stage(stage_hook, "segment", len(filtered_leads)):
+        segmenter = LeadSegmenter()
+        segments = segmenter.segment_by_industry(filtered_leads)
+        summary = segmenter.get_segment_summary(segments)
     print("Segments by industry:")
     for industry, count in sorted(summary.items(), key=lambda x: x[1], reverse=True):
         print(f"  {industry}: {count}")
     
     # Export to CSV
     print(f"\nExporting to {output_file}...")
-    export_leads_to_csv(filtered_leads, output_file)
+    with _timed_stage(stage_hook, "export", len(filtered_leads)):
+        export_leads_to_csv(filtered_leads, output_file)
     print(f"Exported {len(filtered_leads)} leads")
     
     # Optionally add to queue
-    if config.get("queue.auto_add", False):
+    if settings.queue.auto_add:
+        from lead_engine.queue_manager import QueueManager, EmailType
+        
         print("\nAdding to queue...")
         queue_manager = QueueManager(
-            safe_mode=config.safe_mode,
-            test_email=config.test_email
+            safe_mode=settings.safe_mode,
+            test_email=settings.test_email
         )
         
         # Load email templates (would come from config or file)
@@ -122,8 +173,56 @@ def process_leads(
         print(f"Exported queue to {queue_file}")
 
 
-def export_leads_to_csv(leads, output_file: str):
-    """Export leads to CSV file"""
+def watch_inbox(
+    inbox_dir: str,
+    output_dir: str,
+    config_file: str = None,
+    safe_mode: bool = None,
+    poll_interval: float = 1.0,
+    profile: str = None
+):
+    """
+    Watch an inbox directory and process new/appended lead files until interrupted
+    
+    Args:
+        inbox_dir: Directory to watch for .csv/.json files
+        output_dir: Directory for processed CSV outputs
+        config_file: Path to config file (reloaded when it changes)
+        safe_mode: Whether to enable SAFE_MODE
+        poll_interval: Seconds between inbox scans
+        profile: Scoring profile for all leads (default: route by segment)
+    """
+    import logging
+    from lead_engine.watcher import LeadWatcher
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    
+    config = LeadEngineConfig(config_file, reload_interval=poll_interval)
+    if safe_mode is not None:
+        config.safe_mode = safe_mode
+    
+    watcher = LeadWatcher(
+        inbox_dir,
+        output_dir,
+        config=config,
+        poll_interval=poll_interval,
+        profile=profile
+    )
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def export_leads_to_csv(leads, output_file: str, append: bool = False):
+    """
+    Export leads to CSV file
+    
+    Args:
+        leads: Leads to export
+        output_file: Path to output CSV file
+        append: Append to an existing file (header written only if file is new/empty)
+    """
     if not leads:
         return
     
@@ -134,9 +233,12 @@ def export_leads_to_csv(leads, output_file: str):
         'rank_score', 'source'
     ]
     
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+    write_header = not append or not Path(output_file).exists() or Path(output_file).stat().st_size == 0
+    
+    with open(output_file, 'a' if append else 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        if write_header:
+            writer.writeheader()
         
         for lead in leads:
             row = {
@@ -157,7 +259,7 @@ def export_leads_to_csv(leads, output_file: str):
             writer.writerow(row)
 
 
-def export_queue_to_csv(queue_manager: QueueManager, output_file: str):
+def export_queue_to_csv(queue_manager: 'QueueManager', output_file: str):
     """Export queue to CSV file"""
     queue_data = queue_manager.export_to_sheets_format()
     
@@ -211,6 +313,34 @@ def main():
         dest='safe_mode',
         help='Disable SAFE_MODE'
     )
+    process_parser.add_argument(
+        '--profile', '-p',
+        help='Scoring profile from ranking.profiles (default: route by segment)'
+    )
+    
+    # Watch command (long-running)
+    watch_parser = subparsers.add_parser(
+        'watch',
+        aliases=['serve'],
+        help='Watch an inbox directory and process new leads incrementally'
+    )
+    watch_parser.add_argument('inbox_dir', help='Directory to watch for CSV/JSON files')
+    watch_parser.add_argument('--output-dir', '-o', required=True, help='Directory for processed CSV files')
+    watch_parser.add_argument('--config', '-c', help='Config file path (reloaded on change)')
+    watch_parser.add_argument('--interval', type=float, default=1.0, help='Seconds between inbox scans')
+    watch_parser.add_argument('--profile', '-p', help='Scoring profile from ranking.profiles')
+    watch_parser.add_argument(
+        '--safe-mode',
+        action='store_true',
+        default=None,
+        help='Enable SAFE_MODE (default: from config)'
+    )
+    watch_parser.add_argument(
+        '--no-safe-mode',
+        action='store_false',
+        dest='safe_mode',
+        help='Disable SAFE_MODE'
+    )
     
     args = parser.parse_args()
     
@@ -219,7 +349,17 @@ def main():
             args.input_file,
             args.output,
             safe_mode=args.safe_mode,
-            config_file=args.config
+            config_file=args.config,
+            profile=args.profile
+        )
+    elif args.command in ('watch', 'serve'):
+        watch_inbox(
+            args.inbox_dir,
+            args.output_dir,
+            config_file=args.config,
+            safe_mode=args.safe_mode,
+            poll_interval=args.interval,
+            profile=args.profile
         )
     else:
         parser.print_help()
@@ -2,26 +2,181 @@
 Configuration management for Lead Engine
 
 Handles SAFE_MODE and other settings via config file or environment variables.
+
+Hot paths should read from `config.snapshot` (a frozen, typed ConfigSnapshot
+built once per load) instead of calling `get()` per lead. Long-running workers
+call `config.reload_if_changed()` between batches to pick up edits to the
+config file without restarting.
 """
 
 import json
 import os
-from typing import Dict, Optional
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 from pathlib import Path
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists to read-only mappings/tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class GoogleSheetsSettings:
+    """Google Sheets settings"""
+    enabled: bool = False
+    credentials_file: str = "credentials.json"
+    spreadsheet_id: str = ""
+    worksheet_name: str = "Leads"
+
+
+@dataclass(frozen=True)
+class SegmentationSettings:
+    """Segmentation settings"""
+    enabled: bool = True
+    categories: Tuple[str, ...] = ("industry", "size", "location_state")
+
+
+@dataclass(frozen=True)
+class RankingSettings:
+    """Ranking settings (profiles are read-only mappings)"""
+    enabled: bool = True
+    decision_maker_threshold: float = 0.6
+    min_score: float = 0.3
+    default_profile: str = "default"
+    profiles: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    segment_profiles: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+
+@dataclass(frozen=True)
+class QueueSettings:
+    """Queue settings"""
+    auto_add: bool = False
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Frozen, typed view of LeadEngineConfig
+    
+    Built once per load/reload so processing code can use plain attribute
+    access (`snapshot.ranking.min_score`) instead of dotted-key lookups.
+    """
+    safe_mode: bool = True
+    test_email: str = "test@afterhours.com"
+    google_sheets: GoogleSheetsSettings = GoogleSheetsSettings()
+    segmentation: SegmentationSettings = SegmentationSettings()
+    ranking: RankingSettings = RankingSettings()
+    queue: QueueSettings = QueueSettings()
+    version: int = 0
+    
+    @classmethod
+    def from_dict(cls, config: Dict, version: int = 0) -> 'ConfigSnapshot':
+        """Build snapshot from raw config dict, using defaults for missing keys"""
+        sheets = config.get("google_sheets") or {}
+        segmentation = config.get("segmentation") or {}
+        ranking = config.get("ranking") or {}
+        queue = config.get("queue") or {}
+        
+        return cls(
+            safe_mode=bool(config.get("safe_mode", True)),
+            test_email=str(config.get("test_email") or "test@afterhours.com"),
+            google_sheets=GoogleSheetsSettings(
+                enabled=bool(sheets.get("enabled", False)),
+                credentials_file=str(sheets.get("credentials_file", "credentials.json")),
+                spreadsheet_id=str(sheets.get("spreadsheet_id", "")),
+                worksheet_name=str(sheets.get("worksheet_name", "Leads"))
+            ),
+            segmentation=SegmentationSettings(
+                enabled=bool(segmentation.get("enabled", True)),
+                categories=tuple(segmentation.get("categories", ("industry", "size", "location_state")))
+            ),
+            ranking=RankingSettings(
+                enabled=bool(ranking.get("enabled", True)),
+                decision_maker_threshold=float(ranking.get("decision_maker_threshold", 0.6)),
+                min_score=float(ranking.get("min_score", 0.3)),
+                default_profile=str(ranking.get("default_profile", "default")),
+                profiles=_freeze(ranking.get("profiles") or {}),
+                segment_profiles=_freeze(ranking.get("segment_profiles") or {})
+            ),
+            queue=QueueSettings(
+                auto_add=bool(queue.get("auto_add", False))
+            ),
+            version=version
+        )
+
+
 class LeadEngineConfig:
     """Configuration for Lead Engine"""
     
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(self, config_file: Optional[str] = None, reload_interval: float = 1.0):
         """
         Initialize config from file or environment
         
         Args:
             config_file: Path to config JSON file (default: config.json in current dir)
+            reload_interval: Minimum seconds between config file mtime checks
+                in reload_if_changed()
         """
         self.config_file = config_file or "config.json"
+        self.reload_interval = reload_interval
+        self._version = 0
+        self._overrides: Dict[str, Any] = {}
+        self._last_check = time.monotonic()
+        self._mtime = self._file_mtime()
         self.config = self._load_config()
+        self._rebuild()
+    
+    def _file_mtime(self) -> Optional[float]:
+        """Get config file mtime (None if missing)"""
+        try:
+            return os.stat(self.config_file).st_mtime
+        except OSError:
+            return None
+    
+    def _rebuild(self):
+        """Rebuild frozen snapshot and clear lookup cache"""
+        self._version += 1
+        self._get_cache: Dict[Tuple[str, Any], Any] = {}
+        self._snapshot = ConfigSnapshot.from_dict(self.config, self._version)
+    
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Frozen, typed config snapshot for hot paths"""
+        return self._snapshot
+    
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """
+        Reload config if the config file's mtime changed
+        
+        Checks the file at most once per `reload_interval` seconds, so it is
+        cheap enough to call once per batch or file. Values set via `set()`
+        are re-applied on top of the reloaded file.
+        
+        Returns:
+            True if config was reloaded
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < self.reload_interval:
+            return False
+        self._last_check = now
+        
+        mtime = self._file_mtime()
+        if not force and mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        
+        self.config = self._load_config()
+        for key, value in self._overrides.items():
+            self._set_path(key, value)
+        self._rebuild()
+        return True
     
     def _load_config(self) -> Dict:
         """Load config from file or use defaults"""
@@ -41,7 +196,10 @@ class LeadEngineConfig:
             "ranking": {
                 "enabled": True,
                 "decision_maker_threshold": 0.6,
-                "min_score": 0.3
+                "min_score": 0.3,
+                "default_profile": "default",
+                "profiles": {},
+                "segment_profiles": {}
             }
         }
         
@@ -65,7 +223,22 @@ class LeadEngineConfig:
         return default_config
     
     def get(self, key: str, default=None):
-        """Get config value by key (supports dot notation)"""
+        """Get config value by key (supports dot notation, cached per snapshot)"""
+        cache_key = (key, default)
+        try:
+            return self._get_cache[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable default - skip the cache
+            return self._lookup(key, default)
+        
+        value = self._lookup(key, default)
+        self._get_cache[cache_key] = value
+        return value
+    
+    def _lookup(self, key: str, default=None):
+        """Walk nested config dicts for a dotted key"""
         keys = key.split('.')
         value = self.config
         
@@ -79,6 +252,12 @@ class LeadEngineConfig:
     
     def set(self, key: str, value: any):
         """Set config value (supports dot notation)"""
+        self._overrides[key] = value
+        self._set_path(key, value)
+        self._rebuild()
+    
+    def _set_path(self, key: str, value: Any):
+        """Write value at dotted key path"""
         keys = key.split('.')
         config = self.config
         
@@ -94,11 +273,12 @@ class LeadEngineConfig:
         config_path = Path(self.config_file)
         with open(config_path, 'w') as f:
             json.dump(self.config, f, indent=2)
+        self._mtime = self._file_mtime()
     
     @property
     def safe_mode(self) -> bool:
         """Get SAFE_MODE setting"""
-        return self.get("safe_mode", True)
+        return self._snapshot.safe_mode
     
     @safe_mode.setter
     def safe_mode(self, value: bool):
@@ -108,5 +288,5 @@ class LeadEngineConfig:
     @property
     def test_email(self) -> str:
         """Get test email address"""
-        return self.get("test_email", "test@afterhours.com")
+        return self._snapshot.test_email
 
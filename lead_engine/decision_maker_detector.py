@@ -39,6 +39,17 @@ class DecisionMakerDetector:
     SMALL_THRESHOLD = 10  # Small = likely decision-maker
     MEDIUM_THRESHOLD = 50  # Medium = maybe decision-maker
     
+    # Default score at/above which a contact is a likely decision-maker
+    DEFAULT_DECISION_MAKER_THRESHOLD = 0.6
+    
+    def __init__(self, threshold: float = DEFAULT_DECISION_MAKER_THRESHOLD):
+        """
+        Args:
+            threshold: Score at/above which a contact is a likely decision-maker
+                (config: ranking.decision_maker_threshold)
+        """
+        self.threshold = threshold
+    
     def detect(self, lead: Lead) -> Dict[str, any]:
         """
         Detect if lead is likely a decision-maker
@@ -70,8 +81,8 @@ class DecisionMakerDetector:
         # Normalize score to 0.0-1.0
         score = min(1.0, score)
         
-        # Threshold: >= 0.6 = likely decision-maker
-        is_decision_maker_likely = score >= 0.6
+        # Threshold (default 0.6): at/above = likely decision-maker
+        is_decision_maker_likely = score >= self.threshold
         
         return {
             'is_decision_maker_likely': is_decision_maker_likely,
@@ -9,11 +9,14 @@ Handles:
 """
 
 import csv
+import io
 import re
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from voice_agent.keyword_matcher import compile_keywords
+
 
 class LeadSource(Enum):
     """Source of lead"""
@@ -114,6 +117,9 @@ class LeadProcessor:
     def __init__(self):
         self.processed_leads: List[Lead] = []
         self.duplicates: List[Lead] = []
+        self._seen_emails: set = set()
+        self._seen_businesses: set = set()
+        self._industry_matcher = compile_keywords(self.INDUSTRY_MAPPINGS)
     
     def load_from_csv(self, file_path: str) -> List[Lead]:
         """Load leads from CSV file"""
@@ -128,6 +134,17 @@ class LeadProcessor:
         
         return leads
     
+    def load_from_csv_text(self, text: str, fieldnames: List[str], source: str = LeadSource.CSV.value) -> List[Lead]:
+        """Load leads from CSV rows (no header line) using known column names"""
+        leads = []
+        # newline='' keeps newlines inside quoted fields part of the field
+        reader = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)
+        for row in reader:
+            lead = self._normalize_row(row, source)
+            if lead:
+                leads.append(lead)
+        return leads
+    
     def load_from_dict_list(self, data: List[Dict], source: str = "manual") -> List[Lead]:
         """Load leads from list of dictionaries (e.g., from Google Sheets API)"""
         leads = []
@@ -226,11 +243,12 @@ class LeadProcessor:
         """Normalize industry to standard categories"""
         industry_lower = industry.lower()
         
-        for category, keywords in self.INDUSTRY_MAPPINGS.items():
-            if any(keyword in industry_lower for keyword in keywords):
-                return category
+        # Shared compiled matcher (same engine the voice agent uses for entities)
+        category = self._industry_matcher.category(industry_lower)
+        if category:
+            return category
         
-        return industry.lower() if industry else None
+        return industry_lower if industry else None
     
     def _extract_business_size(self, row: Dict) -> Optional[str]:
         """Extract business size from row"""
@@ -295,16 +313,24 @@ class LeadProcessor:
             website = f"https://{website}"
         return website
     
-    def deduplicate(self, leads: List[Lead]) -> List[Lead]:
-        """Remove duplicate leads based on email or business name"""
-        seen_emails = set()
-        seen_businesses = set()
+    def deduplicate(self, leads: List[Lead], incremental: bool = False) -> List[Lead]:
+        """
+        Remove duplicate leads based on email or business name
+        
+        Args:
+            leads: Leads to deduplicate
+            incremental: Keep keys seen in previous calls (for streaming input)
+        """
+        if not incremental:
+            self._seen_emails = set()
+            self._seen_businesses = set()
+        seen_emails = self._seen_emails
+        seen_businesses = self._seen_businesses
         unique_leads = []
         duplicates = []
         
         for lead in leads:
-            email_key = lead.contact_email.lower()
-            business_key = f"{lead.business_name.lower()}_{lead.location_city or ''}"
+            email_key, business_key = self._dedup_keys(lead)
             
             if email_key in seen_emails or business_key in seen_businesses:
                 lead.status = LeadStatus.DUPLICATE
@@ -317,6 +343,17 @@ class LeadProcessor:
         self.duplicates = duplicates
         return unique_leads
     
+    def forget(self, leads: List[Lead]):
+        """Drop leads from the incremental dedup state (e.g. a batch that failed to export)"""
+        for lead in leads:
+            email_key, business_key = self._dedup_keys(lead)
+            self._seen_emails.discard(email_key)
+            self._seen_businesses.discard(business_key)
+    
+    @staticmethod
+    def _dedup_keys(lead: Lead) -> tuple:
+        return lead.contact_email.lower(), f"{lead.business_name.lower()}_{lead.location_city or ''}"
+    
     def validate_leads(self, leads: List[Lead]) -> tuple[List[Lead], List[Lead]]:
         """Validate leads and separate valid from invalid"""
         valid = []
@@ -0,0 +1,304 @@
+"""
+Scoring Profiles for Lead Ranking
+
+Scoring weights and preference tables are loaded from the `ranking` section of
+LeadEngineConfig and compiled once into flat lookup tables, so scoring a lead
+is a handful of dict lookups with no config access or nested dict walks.
+
+Config shape:
+
+    "ranking": {
+        "default_profile": "default",
+        "profiles": {
+            "legal_push": {
+                "weights": {"decision_maker": 0.3, "completeness": 0.1,
+                            "industry": 0.4, "size": 0.2},
+                "industry_scores": {"legal": 1.0, "healthcare": 0.6},
+                "size_scores": {"solo": 1.0, "small": 0.9},
+                "unknown_score": 0.5
+            }
+        },
+        "segment_profiles": {"legal": "legal_push", "unknown": "default"}
+    }
+
+Segments are lead industries; leads without one are in the "unknown"
+segment.
+"""
+
+import time
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
+
+from lead_engine.lead_processor import Lead
+
+
+DEFAULT_PROFILE_NAME = "default"
+
+# Segment of leads without an industry
+UNKNOWN_SEGMENT = "unknown"
+
+# Fields counted towards data completeness
+COMPLETENESS_FIELDS = (
+    'business_name', 'contact_email', 'contact_name',
+    'contact_phone', 'industry', 'location_city', 'location_state',
+    'business_website', 'business_size'
+)
+
+DEFAULT_WEIGHTS = {
+    'decision_maker': 0.4,
+    'completeness': 0.2,
+    'industry': 0.2,
+    'size': 0.2
+}
+
+# Higher scores for industries we have templates/expertise for
+DEFAULT_INDUSTRY_SCORES = {
+    'legal': 1.0,
+    'healthcare': 0.9,
+    'professional_services': 0.9,
+    'real_estate': 0.8,
+    'local_services': 0.7,
+    'accounting': 0.8,
+    'ecommerce': 0.6,
+    'technology': 0.7
+}
+
+# Prefer solo/small (easier to convert, decision-maker clearer)
+DEFAULT_SIZE_SCORES = {
+    'solo': 1.0,
+    'small': 0.9,
+    'medium': 0.7,
+    'large': 0.5
+}
+
+DEFAULT_UNKNOWN_SCORE = 0.5
+
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """Named set of scoring weights and preference tables"""
+    name: str
+    weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_WEIGHTS))
+    industry_scores: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_INDUSTRY_SCORES))
+    size_scores: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SIZE_SCORES))
+    unknown_score: float = DEFAULT_UNKNOWN_SCORE
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict) -> 'ScoringProfile':
+        """Create profile from config dict, falling back to defaults for missing keys"""
+        weights = dict(DEFAULT_WEIGHTS)
+        weights.update(data.get('weights', {}))
+
+        unknown_weights = set(weights) - set(DEFAULT_WEIGHTS)
+        if unknown_weights:
+            raise ValueError(
+                f"Unknown weight(s) in scoring profile '{name}': {sorted(unknown_weights)}. "
+                f"Supported: {sorted(DEFAULT_WEIGHTS)}"
+            )
+
+        return cls(
+            name=name,
+            weights=weights,
+            industry_scores=dict(data.get('industry_scores', DEFAULT_INDUSTRY_SCORES)),
+            size_scores=dict(data.get('size_scores', DEFAULT_SIZE_SCORES)),
+            unknown_score=float(data.get('unknown_score', DEFAULT_UNKNOWN_SCORE))
+        )
+
+    def compile(self) -> 'CompiledScorer':
+        """Compile profile into a flat lookup-table scorer"""
+        return CompiledScorer(self)
+
+
+class CompiledScorer:
+    """
+    Flat lookup-table scorer built from a ScoringProfile
+
+    Weights are folded into the industry and size tables up front, so a lead's
+    rank score is one multiply, one field count and two dict lookups.
+    """
+
+    _get_completeness_fields = attrgetter(*COMPLETENESS_FIELDS)
+
+    def __init__(self, profile: ScoringProfile):
+        self.profile = profile
+        weights = profile.weights
+        unknown = profile.unknown_score
+
+        self.dm_weight = weights['decision_maker']
+        self.per_field_weight = weights['completeness'] / len(COMPLETENESS_FIELDS)
+
+        industry_weight = weights['industry']
+        self.industry_table = {
+            industry: score * industry_weight
+            for industry, score in profile.industry_scores.items()
+        }
+        # Unknown/empty industry and unlisted industries both score neutral
+        self.industry_default = unknown * industry_weight
+
+        size_weight = weights['size']
+        self.size_table = {
+            size: score * size_weight
+            for size, score in profile.size_scores.items()
+        }
+        self.size_default = unknown * size_weight
+
+    def score(self, lead: Lead) -> float:
+        """Calculate overall rank score for a lead"""
+        completed = 0
+        for value in self._get_completeness_fields(lead):
+            if value:
+                completed += 1
+
+        score = (
+            lead.decision_maker_score * self.dm_weight
+            + completed * self.per_field_weight
+            + self.industry_table.get(lead.industry, self.industry_default)
+            + self.size_table.get(lead.business_size, self.size_default)
+        )
+        return round(score, 3)
+
+
+@dataclass
+class ProfileMetrics:
+    """Throughput counters for a single scoring profile"""
+    profile: str
+    leads_scored: int = 0
+    seconds: float = 0.0
+
+    @property
+    def leads_per_second(self) -> float:
+        return self.leads_scored / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'profile': self.profile,
+            'leads_scored': self.leads_scored,
+            'seconds': round(self.seconds, 6),
+            'leads_per_second': round(self.leads_per_second, 1)
+        }
+
+
+class ScoringProfileSet:
+    """
+    All compiled scorers for a run, plus the segment → scorer routing table
+
+    Segments are keyed by lead industry (UNKNOWN_SEGMENT for leads without
+    one); leads in a segment without an explicit profile use the default
+    scorer.
+    """
+
+    def __init__(
+        self,
+        profiles: Dict[str, ScoringProfile],
+        default_profile: str = DEFAULT_PROFILE_NAME,
+        segment_profiles: Optional[Dict[str, str]] = None
+    ):
+        if default_profile not in profiles:
+            raise ValueError(
+                f"Default scoring profile '{default_profile}' not defined. "
+                f"Available: {sorted(profiles)}"
+            )
+
+        self.scorers: Dict[str, CompiledScorer] = {
+            name: profile.compile() for name, profile in profiles.items()
+        }
+        self.default_profile = default_profile
+        self.default_scorer = self.scorers[default_profile]
+
+        self.segment_scorers: Dict[str, CompiledScorer] = {}
+        for segment, profile_name in (segment_profiles or {}).items():
+            if profile_name not in self.scorers:
+                raise ValueError(
+                    f"Segment '{segment}' references unknown scoring profile '{profile_name}'"
+                )
+            self.segment_scorers[segment] = self.scorers[profile_name]
+
+        self.metrics: Dict[str, ProfileMetrics] = {
+            name: ProfileMetrics(profile=name) for name in self.scorers
+        }
+
+    @classmethod
+    def from_config(cls, config=None) -> 'ScoringProfileSet':
+        """
+        Build profile set from the `ranking` section of LeadEngineConfig
+
+        Args:
+            config: LeadEngineConfig (or None for built-in defaults only)
+        """
+        ranking = (config.get("ranking", {}) if config is not None else {}) or {}
+
+        profiles = {DEFAULT_PROFILE_NAME: ScoringProfile(name=DEFAULT_PROFILE_NAME)}
+        for name, data in (ranking.get("profiles") or {}).items():
+            profiles[name] = ScoringProfile.from_dict(name, data or {})
+
+        return cls(
+            profiles,
+            default_profile=ranking.get("default_profile", DEFAULT_PROFILE_NAME),
+            segment_profiles=ranking.get("segment_profiles") or {}
+        )
+
+    def get_scorer(self, profile: Optional[str] = None) -> CompiledScorer:
+        """Get compiled scorer by profile name (default profile if None)"""
+        if profile is None:
+            return self.default_scorer
+        try:
+            return self.scorers[profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown scoring profile '{profile}'. Available: {sorted(self.scorers)}"
+            ) from None
+
+    def scorer_for(self, lead: Lead, profile: Optional[str] = None) -> CompiledScorer:
+        """
+        Scorer for one lead
+
+        Args:
+            lead: Lead to score
+            profile: Force this profile; if None, route by the lead's segment
+        """
+        if profile is not None:
+            return self.get_scorer(profile)
+        return self.segment_scorers.get(lead.industry or UNKNOWN_SEGMENT, self.default_scorer)
+
+    def score_leads(self, leads: List[Lead], profile: Optional[str] = None) -> None:
+        """
+        Score leads in place, storing the result in raw_data['rank_score']
+
+        Args:
+            leads: Leads to score (decision_maker_score must already be set)
+            profile: Force a single profile for all leads; if None, route each
+                lead by segment (industry) with the default profile as fallback
+        """
+        if profile is not None or not self.segment_scorers:
+            self._score_group(self.get_scorer(profile), leads)
+            return
+
+        groups: Dict[int, Tuple[CompiledScorer, List[Lead]]] = {}
+        segment_scorers = self.segment_scorers
+        default_scorer = self.default_scorer
+        for lead in leads:
+            scorer = segment_scorers.get(lead.industry or UNKNOWN_SEGMENT, default_scorer)
+            group = groups.get(id(scorer))
+            if group is None:
+                group = groups[id(scorer)] = (scorer, [])
+            group[1].append(lead)
+
+        for scorer, group_leads in groups.values():
+            self._score_group(scorer, group_leads)
+
+    def _score_group(self, scorer: CompiledScorer, leads: List[Lead]) -> None:
+        """Score a group of leads with one scorer and record throughput"""
+        score = scorer.score
+        start = time.perf_counter()
+        for lead in leads:
+            lead.raw_data['rank_score'] = score(lead)
+        elapsed = time.perf_counter() - start
+
+        metrics = self.metrics[scorer.profile.name]
+        metrics.leads_scored += len(leads)
+        metrics.seconds += elapsed
+
+    def get_metrics(self) -> List[Dict]:
+        """Get throughput metrics for profiles that have scored leads"""
+        return [m.to_dict() for m in self.metrics.values() if m.leads_scored]
@@ -12,10 +12,10 @@ import os
 import sys
 from pathlib import Path
 from typing import List, Dict, Optional
-import gspread
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+
+# gspread / google-auth / googleapiclient are slow to import, so they are
+# imported inside the functions that talk to Google. Reading and mapping the
+# CSV never loads them.
 
 
 # Configuration - will be loaded from config or env vars
@@ -28,6 +28,9 @@ EMAIL_TYPE = "INITIAL"
 
 def get_sheets_client():
     """Get authenticated Google Sheets client using service account"""
+    import gspread
+    from google.oauth2.service_account import Credentials
+    
     credentials_file = find_credentials_file()
     
     if not credentials_file:
@@ -47,6 +50,9 @@ def get_sheets_client():
 
 def get_apps_script_service(credentials_file_path: str):
     """Get Apps Script API service for executing functions"""
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+    
     scope = [
         "https://www.googleapis.com/auth/script.projects",
         "https://www.googleapis.com/auth/spreadsheets",
@@ -163,6 +169,8 @@ def call_apps_script_function(credentials_file: str, spreadsheet_id: str, functi
     Note: This requires the Apps Script to be deployed as an API executable
     or use the Apps Script API with the script ID
     """
+    from googleapiclient.errors import HttpError
+    
     try:
         # Use Apps Script Execution API
         # This requires the script to be deployed as an API executable with the script ID
@@ -237,6 +245,8 @@ def main():
         
         # Step 3: Connect to Google Sheets
         print("Step 3: Connecting to Google Sheets...")
+        import gspread
+        
         client, credentials_file = get_sheets_client()
         
         # Open spreadsheet
@@ -0,0 +1,2 @@
+# Tests for lead engine
+
@@ -0,0 +1,84 @@
+"""
+Unit tests for the synthetic lead generator and pipeline benchmark
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from lead_engine.benchmarks.pipeline import run_benchmark
+from lead_engine.benchmarks.synthetic_leads import SCHEMAS, SyntheticLeadGenerator
+from lead_engine.lead_processor import LeadProcessor
+
+
+class TestSyntheticLeads(unittest.TestCase):
+    """Test cases for SyntheticLeadGenerator"""
+    
+    def test_deterministic(self):
+        """Same seed produces the same rows"""
+        a = list(SyntheticLeadGenerator(seed=7).rows(200))
+        b = list(SyntheticLeadGenerator(seed=7).rows(200))
+        self.assertEqual(a, b)
+    
+    def test_every_schema_normalizes(self):
+        """Each header variant is understood by LeadProcessor"""
+        for schema in SCHEMAS:
+            generator = SyntheticLeadGenerator(seed=1, schema=schema, duplicate_rate=0, invalid_rate=0)
+            rows = list(generator.rows(100))
+            leads = LeadProcessor().load_from_dict_list(rows)
+            
+            self.assertEqual(len(leads), 100, schema)
+            self.assertTrue(any(l.industry == "legal" for l in leads), schema)
+            self.assertTrue(any(l.business_size for l in leads), schema)
+    
+    def test_duplicate_rate(self):
+        """Roughly duplicate_rate of rows are caught by deduplication"""
+        generator = SyntheticLeadGenerator(seed=3, schema="canonical", duplicate_rate=0.2, invalid_rate=0)
+        leads = LeadProcessor().load_from_dict_list(list(generator.rows(5000)))
+        processor = LeadProcessor()
+        processor.deduplicate(leads)
+        
+        self.assertAlmostEqual(len(processor.duplicates) / len(leads), 0.2, delta=0.03)
+    
+    def test_every_schema_loads_websites(self):
+        """Website columns of every schema are recognized by LeadProcessor"""
+        for schema in ("canonical", "crm", "scraper", "sheet"):
+            generator = SyntheticLeadGenerator(seed=3, schema=schema, invalid_rate=0)
+            leads = LeadProcessor().load_from_dict_list(list(generator.rows(200)))
+            self.assertGreater(sum(1 for lead in leads if lead.business_website), 0, schema)
+
+
+class TestPipelineBenchmark(unittest.TestCase):
+    """Test cases for the pipeline benchmark harness"""
+    
+    def test_reports_every_stage(self):
+        """Benchmark times each process_leads stage"""
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run_benchmark(rows=500, workdir=tmp)
+        
+        stages = [s["stage"] for s in result["stages"]]
+        self.assertEqual(
+            stages,
+            ["load", "deduplicate", "validate", "detect", "rank", "filter", "segment", "export"]
+        )
+        # Rows with invalid emails are dropped while loading
+        self.assertGreater(result["stages"][0]["rows"], 450)
+        self.assertLessEqual(result["stages"][0]["rows"], 500)
+        self.assertGreater(result["total"]["rows_per_sec"], 0)
+        self.assertIsNotNone(result["total"]["peak_rss_mb"])
+    
+    def test_trace_memory_per_stage(self):
+        """--trace-memory reports each stage's own heap peak"""
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run_benchmark(rows=200, workdir=tmp, trace_memory=True)
+        
+        self.assertTrue(all(stage["heap_peak_mb"] >= 0 for stage in result["stages"]))
+        self.assertNotIn("peak_rss_mb", result["stages"][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for LeadEngineConfig snapshot and hot reload
+"""
+
+import dataclasses
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from lead_engine.config import LeadEngineConfig
+
+
+class TestLeadEngineConfig(unittest.TestCase):
+    """Test cases for LeadEngineConfig"""
+    
+    def setUp(self):
+        """Set up a temporary config file"""
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self._write({"ranking": {"min_score": 0.5, "profiles": {"p": {"weights": {"size": 1.0}}}}})
+    
+    def tearDown(self):
+        os.remove(self.path)
+    
+    def _write(self, data, mtime_offset=0):
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+        if mtime_offset:
+            st = os.stat(self.path)
+            os.utime(self.path, (st.st_atime, st.st_mtime + mtime_offset))
+    
+    def test_snapshot_attribute_access(self):
+        """Snapshot exposes typed values with defaults"""
+        config = LeadEngineConfig(self.path)
+        snap = config.snapshot
+        
+        self.assertEqual(snap.ranking.min_score, 0.5)
+        self.assertEqual(snap.ranking.decision_maker_threshold, 0.6)
+        self.assertFalse(snap.queue.auto_add)
+        self.assertEqual(snap.segmentation.categories, ("industry", "size", "location_state"))
+        self.assertEqual(snap.ranking.profiles["p"]["weights"]["size"], 1.0)
+    
+    def test_snapshot_is_frozen(self):
+        """Snapshot and nested mappings are read-only"""
+        snap = LeadEngineConfig(self.path).snapshot
+        
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snap.safe_mode = False
+        with self.assertRaises(TypeError):
+            snap.ranking.profiles["p"] = {}
+    
+    def test_set_rebuilds_snapshot(self):
+        """set() produces a new snapshot and invalidates cached get()"""
+        config = LeadEngineConfig(self.path)
+        self.assertEqual(config.get("ranking.min_score"), 0.5)
+        before = config.snapshot
+        
+        config.set("ranking.min_score", 0.7)
+        
+        self.assertEqual(config.get("ranking.min_score"), 0.7)
+        self.assertEqual(config.snapshot.ranking.min_score, 0.7)
+        self.assertGreater(config.snapshot.version, before.version)
+        self.assertEqual(before.ranking.min_score, 0.5)
+    
+    def test_reload_if_changed(self):
+        """Config reloads when the file mtime changes, keeping set() overrides"""
+        config = LeadEngineConfig(self.path, reload_interval=0)
+        config.safe_mode = False
+        self.assertFalse(config.reload_if_changed())
+        
+        self._write({"ranking": {"min_score": 0.9}}, mtime_offset=5)
+        
+        self.assertTrue(config.reload_if_changed())
+        self.assertEqual(config.snapshot.ranking.min_score, 0.9)
+        self.assertEqual(config.get("ranking.min_score"), 0.9)
+        self.assertFalse(config.snapshot.safe_mode)
+        self.assertFalse(config.reload_if_changed())
+    
+    def test_reload_interval_throttles_checks(self):
+        """Mtime is not checked again within reload_interval"""
+        config = LeadEngineConfig(self.path, reload_interval=3600)
+        self._write({"ranking": {"min_score": 0.9}}, mtime_offset=5)
+        
+        self.assertFalse(config.reload_if_changed())
+        self.assertTrue(config.reload_if_changed(force=True))
+        self.assertEqual(config.snapshot.ranking.min_score, 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Unit tests for LeadRanker and scoring profiles
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from lead_engine.lead_processor import Lead
+from lead_engine.lead_ranker import LeadRanker
+from lead_engine.scoring import ScoringProfile, ScoringProfileSet
+
+
+class FakeConfig:
+    """Minimal stand-in for LeadEngineConfig"""
+    
+    def __init__(self, ranking):
+        self.ranking = ranking
+    
+    def get(self, key, default=None):
+        return self.ranking if key == "ranking" else default
+
+
+def legacy_rank_score(lead: Lead) -> float:
+    """Reference implementation of the original hard-coded scoring"""
+    fields = [
+        'business_name', 'contact_email', 'contact_name',
+        'contact_phone', 'industry', 'location_city', 'location_state',
+        'business_website', 'business_size'
+    ]
+    industries = {
+        'legal': 1.0, 'healthcare': 0.9, 'professional_services': 0.9,
+        'real_estate': 0.8, 'local_services': 0.7, 'accounting': 0.8,
+        'ecommerce': 0.6, 'technology': 0.7
+    }
+    sizes = {'solo': 1.0, 'small': 0.9, 'medium': 0.7, 'large': 0.5}
+    
+    score = lead.decision_maker_score * 0.4
+    score += sum(1 for f in fields if getattr(lead, f, None)) / len(fields) * 0.2
+    score += (industries.get(lead.industry, 0.5) if lead.industry else 0.5) * 0.2
+    score += (sizes.get(lead.business_size, 0.5) if lead.business_size else 0.5) * 0.2
+    return round(score, 3)
+
+
+class TestLeadRanker(unittest.TestCase):
+    """Test cases for LeadRanker"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.leads = [
+            Lead("Smith Law", "john.smith@smithlaw.com", contact_name="John Smith",
+                 industry="legal", business_size="solo", location_city="Austin"),
+            Lead("Acme Dental", "info@acmedental.com", industry="healthcare",
+                 business_size="medium", contact_phone="+15551234567"),
+            Lead("Widgets Inc", "sales1@widgets.com", industry="manufacturing"),
+            Lead("Mystery Co", "bob@mystery.com"),
+        ]
+    
+    def test_default_profile_matches_legacy_scoring(self):
+        """Default profile reproduces the original hard-coded weights"""
+        ranker = LeadRanker()
+        ranked = ranker.rank_leads(self.leads)
+        
+        for lead in ranked:
+            self.assertEqual(lead.raw_data['rank_score'], legacy_rank_score(lead))
+        
+        scores = [l.raw_data['rank_score'] for l in ranked]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+    
+    def test_profile_from_config(self):
+        """Profiles load from the ranking config and change scores"""
+        config = FakeConfig({
+            "profiles": {
+                "industry_only": {
+                    "weights": {"decision_maker": 0.0, "completeness": 0.0,
+                                "industry": 1.0, "size": 0.0},
+                    "industry_scores": {"healthcare": 1.0},
+                    "unknown_score": 0.0
+                }
+            }
+        })
+        ranker = LeadRanker(config, profile="industry_only")
+        ranked = ranker.rank_leads(self.leads)
+        
+        self.assertEqual(ranked[0].business_name, "Acme Dental")
+        self.assertEqual(ranked[0].raw_data['rank_score'], 1.0)
+        self.assertEqual(ranked[-1].raw_data['rank_score'], 0.0)
+    
+    def test_segment_profiles(self):
+        """Leads are routed to profiles by segment (industry)"""
+        config = FakeConfig({
+            "profiles": {
+                "zero": {
+                    "weights": {"decision_maker": 0.0, "completeness": 0.0,
+                                "industry": 0.0, "size": 0.0}
+                }
+            },
+            "segment_profiles": {"legal": "zero"}
+        })
+        ranker = LeadRanker(config)
+        ranker.rank_leads(self.leads)
+        
+        legal = self.leads[0]
+        self.assertEqual(legal.raw_data['rank_score'], 0.0)
+        self.assertEqual(self.leads[1].raw_data['rank_score'], legacy_rank_score(self.leads[1]))
+        
+        metrics = {m['profile']: m for m in ranker.get_profile_metrics()}
+        self.assertEqual(metrics['zero']['leads_scored'], 1)
+        self.assertEqual(metrics['default']['leads_scored'], 3)
+    
+    def test_unknown_industry_segment(self):
+        """Leads without an industry are routed through the "unknown" segment"""
+        config = FakeConfig({
+            "profiles": {
+                "zero": {
+                    "weights": {"decision_maker": 0.0, "completeness": 0.0,
+                                "industry": 0.0, "size": 0.0}
+                }
+            },
+            "segment_profiles": {"unknown": "zero"}
+        })
+        ranker = LeadRanker(config)
+        ranker.rank_leads(self.leads)
+        
+        mystery = self.leads[3]
+        self.assertEqual(mystery.raw_data['rank_score'], 0.0)
+        self.assertEqual(ranker._calculate_rank_score(mystery), 0.0)
+        self.assertEqual(ranker._calculate_rank_score(self.leads[0]), legacy_rank_score(self.leads[0]))
+    
+    def test_unknown_profile(self):
+        """Unknown profile names raise ValueError"""
+        with self.assertRaises(ValueError):
+            ScoringProfileSet.from_config(FakeConfig({"segment_profiles": {"legal": "missing"}}))
+        
+        with self.assertRaises(ValueError):
+            ScoringProfile.from_dict("bad", {"weights": {"typo": 1.0}})
+        
+        ranker = LeadRanker()
+        with self.assertRaises(ValueError):
+            ranker.rank_leads(self.leads, profile="missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Cold-start tests for the lead_engine CLI
+
+Each test runs a fresh interpreter under `python -X importtime`.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from lead_engine.benchmarks.startup import measure_startup
+
+
+# Generous default so slow CI machines don't flake; tighten locally via env var
+STARTUP_BUDGET_MS = float(os.getenv("LEAD_ENGINE_STARTUP_BUDGET_MS", "250"))
+
+
+class TestCliStartup(unittest.TestCase):
+    """Test cases for CLI startup cost"""
+    
+    def test_cli_import_is_lazy(self):
+        """Importing the CLI loads no pipeline stages or Google libraries"""
+        report = measure_startup("import lead_engine.cli")
+        
+        self.assertEqual(report.heavy_modules(), [])
+        for module in ("lead_engine.lead_processor", "lead_engine.queue_manager",
+                       "lead_engine.sync_to_queue"):
+            self.assertNotIn(module, report.modules)
+    
+    def test_cli_import_within_budget(self):
+        """CLI cold import stays within the startup budget"""
+        report = measure_startup("import lead_engine.cli")
+        cumulative_ms = report.cumulative_us("lead_engine.cli") / 1000
+        
+        self.assertLess(cumulative_ms, STARTUP_BUDGET_MS)
+    
+    def test_process_csv_never_imports_google(self):
+        """`cli process` on a CSV does not import Google client libraries"""
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = os.path.join(tmp, "leads.csv")
+            output_file = os.path.join(tmp, "out.csv")
+            with open(input_file, "w", encoding="utf-8") as f:
+                f.write("business_name,email\nSmith Law,john.smith@smithlaw.com\n")
+            
+            code = (
+                "import sys, io, contextlib\n"
+                "from lead_engine.cli import main\n"
+                f"sys.argv = ['cli', 'process', {input_file!r}, '-o', {output_file!r}]\n"
+                "with contextlib.redirect_stdout(io.StringIO()):\n"
+                "    main()\n"
+            )
+            report = measure_startup(code)
+            
+            self.assertTrue(os.path.exists(output_file))
+        
+        self.assertEqual(report.heavy_modules(), [])
+        self.assertNotIn("lead_engine.sync_to_queue", report.modules)
+    
+    def test_sync_to_queue_import_is_lazy(self):
+        """sync_to_queue can be imported without loading Google libraries"""
+        report = measure_startup("import lead_engine.sync_to_queue")
+        
+        self.assertEqual(report.heavy_modules(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
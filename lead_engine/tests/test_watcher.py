@@ -0,0 +1,175 @@
+"""
+Unit tests for LeadWatcher (watch mode)
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from lead_engine.config import LeadEngineConfig
+from lead_engine.watcher import LeadWatcher
+
+
+HEADER = "business_name,email,contact_name,industry,size,city,state\n"
+
+
+class TestLeadWatcher(unittest.TestCase):
+    """Test cases for LeadWatcher"""
+    
+    def setUp(self):
+        """Set up inbox/output directories and a config with min_score 0"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.inbox = os.path.join(self.tmp.name, "inbox")
+        self.out = os.path.join(self.tmp.name, "out")
+        os.makedirs(self.inbox)
+        
+        config_path = os.path.join(self.tmp.name, "config.json")
+        with open(config_path, "w") as f:
+            json.dump({"ranking": {"min_score": 0.0}}, f)
+        self.config = LeadEngineConfig(config_path, reload_interval=0)
+        self.watcher = LeadWatcher(self.inbox, self.out, config=self.config)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def _append(self, name, text):
+        with open(os.path.join(self.inbox, name), "a", encoding="utf-8") as f:
+            f.write(text)
+    
+    def _read_output(self, name):
+        with open(os.path.join(self.out, name), encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+    
+    def test_processes_new_file(self):
+        """A new CSV file is processed and exported"""
+        self._append("batch.csv", HEADER +
+                     "Smith Law,john.smith@smithlaw.com,John Smith,law firm,solo,Austin,TX\n"
+                     "Acme Dental,info@acme.com,,dental clinic,small,Irvine,CA\n")
+        
+        stats = self.watcher.poll_once()
+        
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0].rows_loaded, 2)
+        rows = self._read_output("batch_processed.csv")
+        self.assertEqual({r["business_name"] for r in rows}, {"Smith Law", "Acme Dental"})
+        
+        # Nothing new - nothing processed
+        self.assertEqual(self.watcher.poll_once(), [])
+    
+    def test_processes_only_appended_rows(self):
+        """Appended rows are processed incrementally and deduplicated across increments"""
+        self._append("batch.csv", HEADER + "Smith Law,john.smith@smithlaw.com,John Smith,law,solo,Austin,TX\n")
+        self.watcher.poll_once()
+        
+        # Partial line is held back until it is complete
+        self._append("batch.csv", "Acme Dental,info@acme.com,,clinic,small,Irvine,CA\nNew Co,a@b")
+        stats = self.watcher.poll_once()
+        self.assertEqual(stats[0].rows_loaded, 1)
+        
+        self._append("batch.csv", ".com,,,,Reno,NV\nSmith Law Dup,john.smith@smithlaw.com,,,,,\n")
+        stats = self.watcher.poll_once()
+        self.assertEqual(stats[0].rows_loaded, 2)
+        self.assertEqual(stats[0].leads_exported, 1)
+        
+        rows = self._read_output("batch_processed.csv")
+        self.assertEqual([r["business_name"] for r in rows], ["Smith Law", "Acme Dental", "New Co"])
+    
+    def test_replaced_file_reprocessed(self):
+        """A file replaced by a larger one with a different header starts over"""
+        self._append("b.csv", HEADER + "Smith Law,john.smith@smithlaw.com,John Smith,law,solo,Austin,TX\n")
+        self.watcher.poll_once()
+        
+        replacement = os.path.join(self.tmp.name, "b.csv")
+        with open(replacement, "w", encoding="utf-8") as f:
+            f.write("company,contact_email\n" + "".join(f"Co {i},c{i}@example.com\n" for i in range(5)) +
+                    "YYYYY Co,y@example.com\n")
+        os.replace(replacement, os.path.join(self.inbox, "b.csv"))
+        stats = self.watcher.poll_once()
+        
+        self.assertEqual(stats[0].rows_loaded, 6)
+        rows = self._read_output("b_processed.csv")
+        self.assertEqual(len(rows), 6)
+        self.assertIn("YYYYY Co", [r["business_name"] for r in rows])
+    
+    def test_quoted_newline_across_polls(self):
+        """A quoted field spanning lines is only read once the record is complete"""
+        self._append("q.csv", 'business_name,email,notes\nSmith Law,john@smithlaw.com,"first line\n')
+        self.assertEqual(self.watcher.poll_once()[0].rows_loaded, 0)  # header only
+        
+        self._append("q.csv", 'second line"\nAcme Dental,info@acme.com,\n')
+        stats = self.watcher.poll_once()
+        
+        self.assertEqual(stats[0].rows_loaded, 2)
+        rows = self._read_output("q_processed.csv")
+        self.assertEqual([r["business_name"] for r in rows], ["Smith Law", "Acme Dental"])
+    
+    def test_last_row_without_newline_flushed(self):
+        """A final row with no trailing newline is processed once the file is stable"""
+        self._append("batch.csv", HEADER +
+                     "Acme Law,info@acmelaw.com,,law,small,Austin,TX\n"
+                     "Beta Law,info@betalaw.com,,law,small,Austin,TX")
+        self.assertEqual(self.watcher.poll_once()[0].rows_loaded, 1)
+        
+        stats = self.watcher.poll_once()
+        
+        self.assertEqual(stats[0].rows_loaded, 1)
+        self.assertEqual(self.watcher.poll_once(), [])
+        rows = self._read_output("batch_processed.csv")
+        self.assertEqual([r["business_name"] for r in rows], ["Acme Law", "Beta Law"])
+    
+    def test_failed_json_retried(self):
+        """A JSON file whose processing fails is processed again on the next poll"""
+        with open(os.path.join(self.inbox, "leads.json"), "w", encoding="utf-8") as f:
+            json.dump([{"business_name": "Acme Dental", "email": "info@acme.com", "industry": "clinic"}], f)
+        score_leads = self.watcher.ranker.score_leads
+        def fail(leads):
+            raise RuntimeError("ranker down")
+        self.watcher.ranker.score_leads = fail
+        self.assertEqual(self.watcher.poll_once(), [])
+        
+        self.watcher.ranker.score_leads = score_leads
+        stats = self.watcher.poll_once()
+        self.assertEqual(stats[0].leads_exported, 1)
+    
+    def test_failed_batch_retried(self):
+        """Rows of a batch whose export fails are processed on the next poll"""
+        self._append("batch.csv", HEADER + "Smith Law,john.smith@smithlaw.com,John Smith,law,solo,Austin,TX\n")
+        score_leads = self.watcher.ranker.score_leads
+        def fail(leads):
+            raise RuntimeError("ranker down")
+        self.watcher.ranker.score_leads = fail
+        self.assertEqual(self.watcher.poll_once(), [])
+        
+        self.watcher.ranker.score_leads = score_leads
+        stats = self.watcher.poll_once()
+        self.assertEqual(stats[0].leads_exported, 1)
+    
+    def test_deleted_file_forgotten(self):
+        """Watch state of a deleted file is dropped"""
+        self._append("batch.csv", HEADER + "Acme Dental,info@acme.com,,clinic,small,Irvine,CA\n")
+        self.watcher.poll_once()
+        os.remove(os.path.join(self.inbox, "batch.csv"))
+        self.watcher.poll_once()
+        self.assertEqual(self.watcher.files, {})
+    
+    def test_config_reload(self):
+        """Edited thresholds are picked up without restarting"""
+        with open(self.config.config_file, "w") as f:
+            json.dump({"ranking": {"min_score": 1.0}}, f)
+        os.utime(self.config.config_file, (0, os.stat(self.config.config_file).st_mtime + 5))
+        
+        self._append("batch.csv", HEADER + "Acme Dental,info@acme.com,,clinic,small,Irvine,CA\n")
+        stats = self.watcher.poll_once()
+        
+        self.assertEqual(self.watcher.min_score, 1.0)
+        self.assertEqual(stats[0].leads_exported, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,298 @@
+"""
+Lead Engine Watch Mode
+
+Long-running worker that keeps warm LeadProcessor / DecisionMakerDetector /
+LeadRanker instances and watches an inbox directory for lead files.
+
+- New .csv files are processed from the start
+- Appended bytes in known .csv files are processed incrementally (only
+  complete records, so quoted fields may span lines; the header is
+  remembered per file). A last record without a trailing newline is
+  processed once the file is stable (same size and mtime on two polls).
+  A file that was replaced (new inode or different header) or truncated
+  is processed again from the start
+- .json files are re-processed whole when they change
+- Results are appended to <output_dir>/<stem>_processed.csv
+- config.json edits are picked up via LeadEngineConfig.reload_if_changed()
+
+Uses stat-based polling (stdlib only, works on every platform and on network
+mounts where inotify events are not delivered).
+"""
+
+import csv
+import io
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from lead_engine.cli import export_leads_to_csv
+from lead_engine.config import LeadEngineConfig
+from lead_engine.decision_maker_detector import DecisionMakerDetector
+from lead_engine.lead_processor import Lead, LeadProcessor
+from lead_engine.lead_ranker import LeadRanker
+from lead_engine.lead_sources import LeadSourceLoader
+
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SUFFIXES = ('.csv', '.json')
+
+
+@dataclass
+class FileState:
+    """Per-file watch state"""
+    path: Path
+    offset: int = 0
+    size: int = 0  # size seen by the previous poll
+    mtime: float = 0.0
+    inode: int = 0
+    header: Optional[bytes] = None  # raw header record, to detect in-place rewrites
+    fieldnames: Optional[List[str]] = None
+    processor: LeadProcessor = field(default_factory=LeadProcessor)
+    rows_total: int = 0
+
+
+def _record_end(data: bytes, max_records: Optional[int] = None) -> int:
+    """
+    Length of the leading complete CSV records in data
+
+    A newline ends a record only outside quotes (an even number of quote
+    characters before it; escaped "" quotes keep the parity).
+    """
+    end = pos = quotes = records = 0
+    while max_records is None or records < max_records:
+        newline = data.find(b'\n', pos)
+        if newline == -1:
+            break
+        quotes += data.count(b'"', pos, newline)
+        pos = newline + 1
+        if quotes % 2 == 0:
+            end = pos
+            records += 1
+    return end
+
+
+@dataclass
+class FileStats:
+    """Result of processing one file increment"""
+    path: str
+    rows_loaded: int
+    leads_exported: int
+    bytes_read: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_loaded / self.seconds if self.seconds > 0 else 0.0
+
+
+class LeadWatcher:
+    """Watches an inbox directory and processes new lead data incrementally"""
+
+    def __init__(
+        self,
+        inbox_dir: str,
+        output_dir: str,
+        config: Optional[LeadEngineConfig] = None,
+        poll_interval: float = 1.0,
+        profile: Optional[str] = None
+    ):
+        """
+        Args:
+            inbox_dir: Directory to watch for .csv/.json lead files
+            output_dir: Directory for <stem>_processed.csv outputs
+            config: Lead engine config (reloaded when its file changes)
+            poll_interval: Seconds between directory scans
+            profile: Scoring profile for all leads (default: route by segment)
+        """
+        self.inbox_dir = Path(inbox_dir)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.config = config or LeadEngineConfig()
+        self.poll_interval = poll_interval
+        self.profile = profile
+        self.files: Dict[Path, FileState] = {}
+        self._build_pipeline()
+
+    def _build_pipeline(self):
+        """(Re)build warm pipeline stages from the current config snapshot"""
+        settings = self.config.snapshot
+        self.detector = DecisionMakerDetector(settings.ranking.decision_maker_threshold)
+        self.ranker = LeadRanker(self.config, profile=self.profile)
+        self.min_score = settings.ranking.min_score
+
+    def output_path_for(self, path: Path) -> Path:
+        """Output CSV path for an inbox file"""
+        return self.output_dir / f"{path.stem}_processed.csv"
+
+    def poll_once(self) -> List[FileStats]:
+        """Scan inbox once and process anything new; returns per-file stats"""
+        if self.config.reload_if_changed():
+            logger.info("Config changed, rebuilding pipeline")
+            self._build_pipeline()
+
+        results = []
+        try:
+            entries = sorted(os.scandir(self.inbox_dir), key=lambda e: e.name)
+        except FileNotFoundError:
+            entries = []
+
+        present = set()
+        for entry in entries:
+            if not entry.is_file() or not entry.name.lower().endswith(SUPPORTED_SUFFIXES):
+                continue
+            path = Path(entry.path)
+            present.add(path)
+            # entry.stat() doesn't fill st_ino on Windows
+            st = os.stat(path)
+            state = self.files.get(path)
+            if state is None:
+                state = self.files[path] = FileState(path=path)
+
+            try:
+                stats = self._process_if_changed(state, st)
+            except Exception as e:
+                logger.error(f"Failed to process {path}: {e}")
+                continue
+
+            if stats:
+                results.append(stats)
+                logger.info(
+                    f"{path.name}: {stats.rows_loaded} rows, {stats.leads_exported} exported, "
+                    f"{stats.seconds * 1000:.1f} ms, {stats.rows_per_second:.0f} rows/sec"
+                )
+
+        for path in self.files.keys() - present:
+            logger.info(f"{path.name} removed, forgetting it")
+            del self.files[path]
+
+        return results
+
+    def run(self, max_polls: Optional[int] = None):
+        """Poll until interrupted (or max_polls scans have run)"""
+        logger.info(f"Watching {self.inbox_dir} -> {self.output_dir}")
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            self.poll_once()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.poll_interval)
+
+    def _process_if_changed(self, state: FileState, st: os.stat_result) -> Optional[FileStats]:
+        """Dispatch to CSV/JSON processing if the file changed"""
+        size, mtime = st.st_size, st.st_mtime
+        if state.path.suffix.lower() == '.json':
+            if mtime == state.mtime and size == state.offset:
+                return None
+            stats = self._process_json(state, size)
+            # Only after processing succeeds; a failed file is retried next poll
+            state.mtime = mtime
+            state.offset = size
+            return stats
+
+        if mtime == state.mtime and size == state.offset:
+            return None
+        if state.offset and (st.st_ino != state.inode or size < state.offset or not self._header_matches(state)):
+            # Replaced (e.g. os.replace) or truncated - the old offset and header don't apply
+            logger.info(f"{state.path.name} was replaced or truncated, reprocessing from start")
+            self.files[state.path] = state = FileState(path=state.path)
+            self.output_path_for(state.path).unlink(missing_ok=True)
+        if size == state.offset:
+            state.mtime = mtime
+            return None
+        # Unchanged since the last poll: the writer is done, so a last record
+        # without a trailing newline is complete too
+        stable = size == state.size and mtime == state.mtime
+        stats = self._process_csv_increment(state, st.st_ino, flush=stable)
+        state.size, state.mtime = size, mtime
+        return stats
+
+    @staticmethod
+    def _header_matches(state: FileState) -> bool:
+        """Whether the file still starts with the header it was read with"""
+        if state.header is None:
+            return True
+        with open(state.path, 'rb') as f:
+            return f.read(len(state.header)) == state.header
+
+    def _process_csv_increment(self, state: FileState, inode: int, flush: bool = False) -> Optional[FileStats]:
+        """
+        Process complete records appended to a CSV since the last offset
+
+        Args:
+            state: Watch state of the file
+            inode: Current inode of the file
+            flush: Also process a last record that has no trailing newline
+        """
+        start = time.perf_counter()
+        with open(state.path, 'rb') as f:
+            f.seek(state.offset)
+            data = f.read()
+
+        # Only consume complete records; a partial last record is picked up
+        # next poll, or flushed once the file stops changing
+        end = len(data) if flush else _record_end(data)
+        if end == 0:
+            return None
+        chunk = data[:end]
+
+        fieldnames, header, body = state.fieldnames, state.header, chunk
+        if fieldnames is None:
+            header_end = _record_end(chunk, max_records=1) or len(chunk)
+            header, body = chunk[:header_end], chunk[header_end:]
+            fieldnames = next(csv.reader(io.StringIO(header.decode('utf-8-sig'), newline='')))
+
+        leads = state.processor.load_from_csv_text(body.decode('utf-8'), fieldnames)
+        exported = self._run_pipeline(state, leads, append=True)
+
+        # Only advance once the batch is exported; a failure retries it next poll
+        state.fieldnames, state.header, state.inode = fieldnames, header, inode
+        state.offset += len(chunk)
+        state.rows_total += len(leads)
+
+        return FileStats(
+            path=str(state.path),
+            rows_loaded=len(leads),
+            leads_exported=exported,
+            bytes_read=len(chunk),
+            seconds=time.perf_counter() - start
+        )
+
+    def _process_json(self, state: FileState, size: int) -> FileStats:
+        """Re-process a whole JSON file and rewrite its output"""
+        start = time.perf_counter()
+        state.processor = LeadProcessor()
+        leads = LeadSourceLoader(state.processor).load_from_json(str(state.path))
+        exported = self._run_pipeline(state, leads, append=False)
+        state.rows_total = len(leads)
+
+        return FileStats(
+            path=str(state.path),
+            rows_loaded=len(leads),
+            leads_exported=exported,
+            bytes_read=size,
+            seconds=time.perf_counter() - start
+        )
+
+    def _run_pipeline(self, state: FileState, leads: List[Lead], append: bool) -> int:
+        """Dedup, validate, score, filter and export a batch; returns exported count"""
+        unique = state.processor.deduplicate(leads, incremental=append)
+        try:
+            valid, _ = state.processor.validate_leads(unique)
+            scored = self.detector.batch_detect(valid)
+            ranked = self.ranker.score_leads(scored)
+            filtered = [l for l in ranked if l.raw_data.get('rank_score', 0) >= self.min_score]
+
+            output = self.output_path_for(state.path)
+            if filtered:
+                export_leads_to_csv(filtered, str(output), append=append)
+            elif not append:
+                output.unlink(missing_ok=True)
+        except Exception:
+            # The batch will be retried; don't let it count as duplicates of itself
+            state.processor.forget(unique)
+            raise
+        return len(filtered)
@@ -6,21 +6,87 @@ Useful for Twilio webhooks, VAPI integrations, and other async contexts.
 """
 
 import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Dict, Optional, Any, Callable
+from voice_agent.session_store import InMemorySessionStore
 from voice_agent.state_machine import VoiceAgentStateMachine
 from voice_agent.call_flows import CallType, CallContext, CallState
+from voice_agent.prompt_audio import PromptAudioCache
+
+
+# Threads for blocking integrations (HTTP APIs, storage); override with env var
+DEFAULT_MAX_WORKERS = int(os.getenv("VOICE_AGENT_IO_WORKERS", "16"))
 
 
 class AsyncVoiceAgent:
     """
     Async wrapper for VoiceAgentStateMachine
     
-    Allows non-blocking call processing for webhook handlers and API integrations.
+    With the in-memory session store, state machine operations are
+    microseconds of pure-Python CPU work, so they run inline on the event
+    loop; a thread hop would cost more than the work. Other stores (e.g.
+    SQLiteSessionStore) do blocking I/O on every operation (start, turn,
+    summary, end), so those are offloaded by default. Blocking integrations go through `run_blocking()`, which uses
+    a dedicated, bounded thread pool (never asyncio's shared default executor).
     """
     
-    def __init__(self, state_machine: Optional[VoiceAgentStateMachine] = None):
+    def __init__(
+        self,
+        state_machine: Optional[VoiceAgentStateMachine] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        executor: Optional[Executor] = None,
+        offload_turns: Optional[bool] = None
+    ):
+        """
+        Args:
+            state_machine: State machine to drive (default: a new one)
+            max_workers: Size of the dedicated pool for blocking integrations
+            executor: Use this executor instead of creating one (not shut down by close())
+            offload_turns: Run each state machine operation (a webhook turn is
+                one hop) in the pool instead of inline, e.g. when flows call slow
+                synchronous code (default: only when the session store isn't
+                in-memory)
+        """
         self.state_machine = state_machine or VoiceAgentStateMachine()
-        self.executor = None  # Would be ThreadPoolExecutor in production
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="voice-agent-io"
+        )
+        if offload_turns is None:
+            offload_turns = not isinstance(self.state_machine.sessions, InMemorySessionStore)
+        self.offload_turns = offload_turns
+    
+    async def run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking integration call in the dedicated pool
+        
+        Args:
+            func: Blocking callable (HTTP request, DB write, ...)
+            *args, **kwargs: Passed to func
+        
+        Returns:
+            func's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+    
+    async def run_state_machine(self, func: Callable, *args) -> Any:
+        """
+        Run a state machine operation inline, or in the pool if offload_turns is set
+        
+        Args:
+            func: State machine method (start_call, handle_turn, ...)
+            *args: Passed to func
+        
+        Returns:
+            func's return value
+        """
+        if self.offload_turns:
+            return await self.run_blocking(func, *args)
+        return func(*args)
     
     async def start_call_async(
         self,
@@ -39,15 +105,7 @@ class AsyncVoiceAgent:
         Returns:
             CallContext for this call
         """
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self.state_machine.start_call,
-            call_id,
-            call_type,
-            initial_context
-        )
+        return await self.run_state_machine(self.state_machine.start_call, call_id, call_type, initial_context)
     
     async def process_user_input_async(
         self,
@@ -64,31 +122,51 @@ class AsyncVoiceAgent:
         Returns:
             Dict with prompt, state, intent, etc.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self.state_machine.process_user_input,
-            call_id,
-            user_input
-        )
+        return await self.run_state_machine(self.state_machine.process_user_input, call_id, user_input)
     
     async def get_call_summary_async(self, call_id: str) -> Optional[Dict[str, Any]]:
         """Get call summary asynchronously"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self.state_machine.get_call_summary,
-            call_id
-        )
+        return await self.run_state_machine(self.state_machine.get_call_summary, call_id)
     
     async def end_call_async(self, call_id: str) -> Optional[Dict[str, Any]]:
         """End call and return summary asynchronously"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self.state_machine.end_call,
-            call_id
+        return await self.run_state_machine(self.state_machine.end_call, call_id)
+    
+    async def handle_turn_async(
+        self,
+        call_id: str,
+        user_input: str,
+        call_type: CallType = CallType.INBOUND,
+        initial_context: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Handle one webhook turn: start the call if it is new, then process input
+        
+        Runs inline, or as a single executor hop when offload_turns is set.
+        
+        Args:
+            call_id: Call identifier
+            user_input: User's speech/text input
+            call_type: Call type used if the call has to be started
+            initial_context: Initial data used if the call has to be started
+        
+        Returns:
+            Dict with prompt, state, intent, etc.
+        """
+        return await self.run_state_machine(
+            self.state_machine.handle_turn, call_id, user_input, call_type, initial_context
         )
+    
+    def close(self):
+        """Shut down the dedicated pool (if this agent created it)"""
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+    
+    async def __aenter__(self) -> "AsyncVoiceAgent":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.close()
 
 
 # Example async webhook handler for Twilio
@@ -103,6 +181,9 @@ async def handle_twilio_webhook_async(
     
     Usage in FastAPI/Flask async endpoint:
     
+    prompt_audio = PromptAudioCache()
+    prompt_audio.prewarm()  # at startup; serve prompt_audio.directory at its base_url
+    
     @app.post("/twilio/webhook")
     async def twilio_webhook(request: Request):
         form = await request.form()
@@ -114,55 +195,59 @@ async def handle_twilio_webhook_async(
             call_sid, speech_result, from_number, async_agent
         )
         
-        return generate_twiml_response(result)
+        return generate_twiml_response(result, prompt_audio)
     """
-    # Check if call exists, if not start it
-    summary = await async_agent.get_call_summary_async(call_sid)
-    
-    if not summary:
-        # New call - start it
-        await async_agent.start_call_async(
-            call_sid,
-            CallType.INBOUND,
-            {"contact_phone": from_number}
-        )
-    
-    # Process input
-    result = await async_agent.process_user_input_async(call_sid, speech_result)
-    
-    return result
+    # Start the call if it is new and process input in one step
+    return await async_agent.handle_turn_async(
+        call_sid,
+        speech_result,
+        CallType.INBOUND,
+        {"contact_phone": from_number}
+    )
 
 
-def generate_twiml_response(result: Dict[str, Any]) -> str:
+def generate_twiml_response(
+    result: Dict[str, Any],
+    audio_cache: Optional[PromptAudioCache] = None,
+    partial_result_callback: Optional[str] = None
+) -> str:
     """
     Generate TwiML XML response for Twilio
     
     Args:
         result: Result from process_user_input_async
+        audio_cache: Pre-synthesized prompts; cached prompts are sent as <Play>
+        partial_result_callback: URL Twilio posts partial transcripts to
+            (feed them to StreamingTurnProcessor.feed_partial)
     
     Returns:
         TwiML XML string
     """
     prompt = result.get("prompt", "Thank you for calling.")
+    audio_url = audio_cache.lookup(prompt) if audio_cache is not None else None
+    speak = f'<Play>{audio_url}</Play>' if audio_url else f'<Say voice="alice">{prompt}</Say>'
     should_end = result.get("should_end", False)
     should_transfer = result.get("should_transfer", False)
     
     twiml_parts = ['<?xml version="1.0" encoding="UTF-8"?>', '<Response>']
     
     if should_transfer:
+        # Speak first: an emergency transfer tells the caller to hang up and call 911
+        twiml_parts.append(speak)
         twiml_parts.append(
             '<Dial>'
             '<Number>+1234567890</Number>'  # Would be configured
             '</Dial>'
         )
     elif should_end:
-        twiml_parts.append(f'<Say voice="alice">{prompt}</Say>')
+        twiml_parts.append(speak)
         twiml_parts.append('<Hangup/>')
     else:
-        twiml_parts.append(f'<Say voice="alice">{prompt}</Say>')
+        twiml_parts.append(speak)
+        partial = f' partialResultCallback="{partial_result_callback}"' if partial_result_callback else ''
         twiml_parts.append(
             '<Gather input="speech" action="/twilio/webhook" '
-            'speechTimeout="5" timeout="10"/>'
+            f'speechTimeout="5" timeout="10"{partial}/>'
         )
     
     twiml_parts.append('</Response>')
@@ -170,6 +255,28 @@ def generate_twiml_response(result: Dict[str, Any]) -> str:
     return '\n'.join(twiml_parts)
 
 
+def generate_media_stream_twiml(stream_url: str, parameters: Optional[Dict[str, str]] = None) -> str:
+    """
+    TwiML that connects the call to the media stream server (see media_stream)
+    
+    Args:
+        stream_url: wss:// URL of MediaStreamServer
+        parameters: Custom parameters passed in the stream's start message (e.g. call_type)
+    
+    Returns:
+        TwiML XML string
+    """
+    params = ''.join(
+        f'<Parameter name="{name}" value="{value}"/>' for name, value in (parameters or {}).items()
+    )
+    return '\n'.join([
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<Response>',
+        f'<Connect><Stream url="{stream_url}">{params}</Stream></Connect>',
+        '</Response>'
+    ])
+
+
 # Example async integration with OpenAI (for future NLP enhancement)
 async def enhance_with_openai_async(
     user_input: str,
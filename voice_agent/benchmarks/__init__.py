@@ -0,0 +1,2 @@
+# Voice agent benchmarks
+# Per-call and per-turn latency measurements (stdlib only)
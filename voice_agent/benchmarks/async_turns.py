@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Async webhook turn load test
+
+Drives N concurrent simulated calls through handle_twilio_webhook_async and
+measures turn latency from the moment a caller turn is due (after its think
+time) until the response is ready, so event-loop queueing is included.
+
+Modes:
+    legacy  - previous AsyncVoiceAgent: two default-executor hops per turn
+    inline  - AsyncVoiceAgent: state machine runs on the event loop
+    offload - AsyncVoiceAgent(offload_turns=True): one dedicated-pool hop per turn
+
+Usage:
+    python -m voice_agent.benchmarks.async_turns --calls 1000 --turns 4
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+from voice_agent.async_support import AsyncVoiceAgent, handle_twilio_webhook_async
+from voice_agent.call_flows import CallType
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+CALLER_TURNS = [
+    "Hi, I need a quote for a new install.",
+    "It's for a small office. I want something energy efficient.",
+    "My email is jake@example.com.",
+    "yes",
+    "what do you mean?",
+    "ok sounds good",
+]
+
+MODES = ("legacy", "inline", "offload")
+
+
+class LegacyAsyncVoiceAgent:
+    """Previous behaviour: default executor, summary lookup + process = two hops"""
+
+    def __init__(self, state_machine: Optional[VoiceAgentStateMachine] = None):
+        self.state_machine = state_machine or VoiceAgentStateMachine()
+
+    async def handle_turn_async(self, call_id, user_input, call_type=CallType.INBOUND, initial_context=None):
+        loop = asyncio.get_running_loop()
+        summary = await loop.run_in_executor(None, self.state_machine.get_call_summary, call_id)
+        if not summary:
+            await loop.run_in_executor(None, self.state_machine.start_call, call_id, call_type, initial_context)
+        return await loop.run_in_executor(None, self.state_machine.process_user_input, call_id, user_input)
+
+    def close(self):
+        pass
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _run_call(agent, call_index: int, turns: int, think_ms: float, rng: random.Random,
+                    latencies: List[float]):
+    call_sid = f"CA{call_index:06d}"
+    for turn in range(turns):
+        delay = rng.uniform(0, think_ms) / 1000
+        due = time.perf_counter() + delay
+        await asyncio.sleep(delay)
+        result = await handle_twilio_webhook_async(
+            call_sid, CALLER_TURNS[(call_index + turn) % len(CALLER_TURNS)], "+15550001111", agent
+        )
+        latencies.append((time.perf_counter() - due) * 1000)
+        if result.get("should_end") or result.get("should_transfer"):
+            break
+    agent.state_machine.end_call(call_sid)
+
+
+async def _run_mode(mode: str, calls: int, turns: int, think_ms: float, seed: int) -> Dict[str, float]:
+    if mode == "legacy":
+        agent = LegacyAsyncVoiceAgent()
+    else:
+        agent = AsyncVoiceAgent(offload_turns=(mode == "offload"))
+    rng = random.Random(seed)
+    latencies: List[float] = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_run_call(agent, i, turns, think_ms, rng, latencies) for i in range(calls)))
+    elapsed = time.perf_counter() - start
+    agent.close()
+
+    ordered = sorted(latencies)
+    return {
+        "turns": len(ordered),
+        "p50_ms": _percentile(ordered, 0.50),
+        "p99_ms": _percentile(ordered, 0.99),
+        "max_ms": ordered[-1],
+        "turns_per_sec": len(ordered) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def run_load_test(
+    calls: int = 1000,
+    turns: int = 4,
+    think_ms: float = 50.0,
+    modes=MODES,
+    seed: int = 42
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the load test for each mode
+
+    Args:
+        calls: Concurrent calls
+        turns: Caller turns per call (calls may end earlier)
+        think_ms: Max random think time before each turn
+        modes: Modes to run (see module docstring)
+        seed: Think-time seed (same for every mode)
+
+    Returns:
+        Dict of mode -> {turns, p50_ms, p99_ms, max_ms, turns_per_sec}
+    """
+    return {mode: asyncio.run(_run_mode(mode, calls, turns, think_ms, seed)) for mode in modes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test async webhook turns")
+    parser.add_argument("--calls", type=int, default=1000, help="Concurrent calls (default: 1000)")
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--think-ms", type=float, default=50.0)
+    parser.add_argument("--modes", default=",".join(MODES))
+    args = parser.parse_args()
+
+    results = run_load_test(args.calls, args.turns, args.think_ms, args.modes.split(","))
+    print(f"{'mode':<8} {'turns':>7} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'turns/s':>9}")
+    for mode, stats in results.items():
+        print(f"{mode:<8} {stats['turns']:>7} {stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f} "
+              f"{stats['max_ms']:>9.3f} {stats['turns_per_sec']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Call setup benchmark
+
+Measures the cost of starting a call (start_call + greeting prompt) through
+the shared flow registry, against the old behaviour of building every flow
+object on each lookup.
+
+Usage:
+    python -m voice_agent.benchmarks.call_setup --calls 20000
+"""
+
+import argparse
+import time
+from typing import Dict
+
+from voice_agent.call_flows import (
+    CallState, CallType, InboundFlow, MissedCallFlow, OutboundDiscoveryFlow, get_flow_for_call_type
+)
+from voice_agent.state_machine import TwilioAdapter, VoiceAgentStateMachine
+
+
+def _build_all_flows(call_type: CallType):
+    """Pre-registry behaviour: build all four flows per lookup"""
+    flow_map = {
+        CallType.OUTBOUND: OutboundDiscoveryFlow(CallType.OUTBOUND),
+        CallType.INBOUND: InboundFlow(CallType.INBOUND),
+        CallType.DEMO_REQUEST: OutboundDiscoveryFlow(CallType.DEMO_REQUEST),
+        CallType.MISSED: MissedCallFlow(CallType.MISSED)
+    }
+    return flow_map[call_type]
+
+
+def _per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def run_benchmark(calls: int = 20000) -> Dict[str, float]:
+    """Return microseconds per operation for each measured path"""
+    results = {
+        "flow_lookup_rebuild_us": _per_call_us(lambda i: _build_all_flows(CallType.INBOUND), calls),
+        "flow_lookup_registry_us": _per_call_us(lambda i: get_flow_for_call_type(CallType.INBOUND), calls),
+    }
+
+    sm = VoiceAgentStateMachine()
+    adapter = TwilioAdapter(sm)
+
+    def twilio_call_start(i):
+        adapter.handle_incoming_call(f"CA{i}", "+15550001111", "+15550002222")
+        sm.end_call(f"CA{i}")
+
+    def legacy_call_start(i):
+        context = sm.start_call(f"CL{i}", CallType.INBOUND, {"contact_phone": "+15550001111"})
+        _build_all_flows(CallType.INBOUND).get_next_prompt(CallState.GREETING, context)
+        sm.end_call(f"CL{i}")
+
+    results["call_setup_rebuild_us"] = _per_call_us(legacy_call_start, calls)
+    results["call_setup_registry_us"] = _per_call_us(twilio_call_start, calls)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark call setup cost")
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.calls)
+    for name, value in results.items():
+        print(f"{name:<28} {value:8.2f} µs")
+    print(f"Call setup speedup: {results['call_setup_rebuild_us'] / results['call_setup_registry_us']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
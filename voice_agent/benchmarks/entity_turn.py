@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Entity extraction per-turn benchmark
+
+Compares IntentDetector.extract_entities (compiled keyword matchers) against
+the previous findall / per-pattern re.search / nested `any(keyword in text)`
+implementation, checks both extract the same entities, and reports mean and
+p99 microseconds per turn against a budget.
+
+Usage:
+    python -m voice_agent.benchmarks.entity_turn --turns 100000 --budget-us 25
+"""
+
+import argparse
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+from voice_agent.benchmarks.intent_turn import UTTERANCES
+from voice_agent.intent_detector import IntentDetector
+
+
+# Mean per-turn budget for extract_entities (generous; CI machines vary)
+DEFAULT_BUDGET_US = 50.0
+
+
+def legacy_extract_entities(detector: IntentDetector, text: str) -> Dict[str, str]:
+    """Previous implementation, kept as the reference for parity checks"""
+    entities = {}
+    text_lower = text.lower()
+
+    emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+    if emails:
+        entities['email'] = emails[0]
+
+    phones = re.findall(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text)
+    if phones:
+        entities['phone'] = phones[0]
+
+    for size_type, patterns in detector.SIZE_PATTERNS.items():
+        if any(re.search(p, text_lower) for p in patterns):
+            entities['business_size'] = size_type
+            break
+
+    for industry, keywords in detector.INDUSTRY_KEYWORDS.items():
+        if any(keyword in text_lower for keyword in keywords):
+            entities['industry'] = industry
+            break
+
+    return entities
+
+
+def _timings_us(fn, turns: int, utterances: List[str]) -> List[float]:
+    n = len(utterances)
+    timings = []
+    clock = time.perf_counter
+    for i in range(turns):
+        text = utterances[i % n]
+        start = clock()
+        fn(text)
+        timings.append((clock() - start) * 1e6)
+    return timings
+
+
+def _summary(timings: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "mean_us": sum(ordered) / len(ordered),
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+
+def run_benchmark(turns: int = 100000, utterances: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Return mean/p99 microseconds per turn for the legacy, compiled and memoized paths"""
+    utterances = utterances or UTTERANCES
+    detector = IntentDetector(cache_size=0)
+    cached = IntentDetector()
+
+    mismatches = [
+        u for u in utterances
+        if detector.extract_entities(u) != legacy_extract_entities(detector, u)
+    ]
+    if mismatches:
+        raise AssertionError(f"Compiled extraction disagrees on: {mismatches}")
+
+    return {
+        "legacy": _summary(_timings_us(lambda u: legacy_extract_entities(detector, u), turns, utterances)),
+        "compiled": _summary(_timings_us(detector.extract_entities, turns, utterances)),
+        "cached": _summary(_timings_us(cached.extract_entities, turns, utterances)),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-turn entity extraction")
+    parser.add_argument("--turns", type=int, default=100000)
+    parser.add_argument("--budget-us", type=float, default=DEFAULT_BUDGET_US,
+                        help=f"Fail if compiled mean exceeds this (default: {DEFAULT_BUDGET_US})")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.turns)
+    for name, stats in results.items():
+        print(f"{name:<10} mean {stats['mean_us']:7.2f} µs   p99 {stats['p99_us']:7.2f} µs")
+    print(f"Speedup (mean): {results['legacy']['mean_us'] / results['compiled']['mean_us']:.1f}x")
+
+    if results["compiled"]["mean_us"] > args.budget_us:
+        print(f"OVER BUDGET: {results['compiled']['mean_us']:.2f} µs > {args.budget_us:.2f} µs")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Collected-data size and turn time: field extraction vs raw-response copies
+
+Replays the load-simulation corpus (same random picks for both modes) through
+a state machine twice:
+
+    raw       - previous behaviour: every field of a state gets the whole response
+    extracted - field extractors; raw response only for required fields
+
+and reports the mean serialized collected_data per call and the mean turn
+time.
+
+Usage:
+    python -m voice_agent.benchmarks.field_extraction --calls 2000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+from voice_agent.call_flows import FLOW_REGISTRY, CallType, FlowRegistry
+from voice_agent.load_simulation import load_corpus
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+def _raw_copy(text: str) -> str:
+    return text
+
+
+def raw_copy_registry() -> FlowRegistry:
+    """Default flows with every collected field mapped to the raw response"""
+    registry = FlowRegistry()
+    for call_type, flow in FLOW_REGISTRY.items():
+        fields = {field for fields in flow.table.fields_to_collect.values() for field in fields}
+        raw_flow = type(f"Raw{type(flow).__name__}", (type(flow),), {
+            "FIELD_EXTRACTORS": {field: _raw_copy for field in fields}
+        })
+        registry.register(call_type, raw_flow)
+    return registry
+
+
+def _calls(count: int, seed: int) -> List[Tuple[CallType, List[str]]]:
+    rng = random.Random(seed)
+    scenarios = load_corpus()
+    weights = [scenario.weight for scenario in scenarios]
+    return [
+        (scenario.call_type, scenario.script(rng))
+        for scenario in rng.choices(scenarios, weights, k=count)
+    ]
+
+
+def measure(registry: FlowRegistry, calls: List[Tuple[CallType, List[str]]]) -> Dict[str, float]:
+    sm = VoiceAgentStateMachine(flow_registry=registry)
+    sizes, turn_times = [], []
+    for index, (call_type, script) in enumerate(calls):
+        call_id = f"FX{index}"
+        sm.start_call(call_id, call_type)
+        for text in script:
+            start = time.perf_counter()
+            result = sm.process_user_input(call_id, text)
+            turn_times.append(time.perf_counter() - start)
+            if result.get("should_end") or result.get("should_transfer"):
+                break
+        summary = sm.end_call(call_id)
+        sizes.append(len(json.dumps(summary["data_collected"], ensure_ascii=False)))
+    return {
+        "data_bytes_per_call": statistics.mean(sizes),
+        "turn_us": statistics.mean(turn_times) * 1e6,
+    }
+
+
+def run_benchmark(calls: int = 2000, seed: int = 7) -> Dict[str, Dict[str, float]]:
+    """Mean collected_data bytes per call and turn time for raw vs extracted"""
+    replay = _calls(calls, seed)
+    return {
+        "raw": measure(raw_copy_registry(), replay),
+        "extracted": measure(FLOW_REGISTRY, replay),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Field extraction vs raw copies")
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    report = run_benchmark(args.calls)
+    print(f"{'mode':<10} {'data bytes/call':>16} {'turn us':>9}")
+    for mode, row in report.items():
+        print(f"{mode:<10} {row['data_bytes_per_call']:>16.0f} {row['turn_us']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
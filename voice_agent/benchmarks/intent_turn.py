@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Intent detection per-turn benchmark
+
+Compares IntentDetector.detect (one precompiled alternation per intent) against
+the previous behaviour of calling re.search(pattern, text, re.IGNORECASE) once
+per pattern, and checks that both return the same intent for every utterance.
+
+Usage:
+    python -m voice_agent.benchmarks.intent_turn --turns 200000
+"""
+
+import argparse
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from voice_agent.intent_detector import Intent, IntentDetector
+
+
+# Representative caller turns (short answers dominate real calls)
+UTTERANCES: List[str] = [
+    "yes", "yeah sure", "no", "nope", "ok", "sounds good",
+    "no, not interested", "stop calling me", "remove me from your list",
+    "not now, maybe later", "too busy right now",
+    "can I speak to a human", "transfer me to someone", "let me talk to the owner please",
+    "can you repeat that?", "what do you mean", "sorry, I didn't catch that",
+    "how much does it cost?", "what is this about?", "can you explain?",
+    "I run a small law firm downtown with three attorneys",
+    "we're a dental practice, about 15 people, mostly evening calls",
+    "my email is owner@example.com and my number is 555-123-4567",
+    "honestly we miss a lot of calls after hours and it's costing us jobs",
+    "I don't think so, we already have an answering service",
+    "",
+    "hmm",
+]
+
+
+def sequential_detect(detector: IntentDetector, text: str) -> Tuple[Intent, float]:
+    """Previous behaviour: one re.search per pattern, in priority order"""
+    if not text:
+        return Intent.UNKNOWN, 0.0
+    text_lower = text.lower().strip()
+    for intent, confidence, attr in detector.INTENT_PRIORITY:
+        if any(re.search(p, text_lower, re.IGNORECASE) for p in getattr(detector, attr)):
+            return intent, confidence
+    if len(text_lower) > 10:
+        return Intent.CONTINUE, 0.6
+    return Intent.UNKNOWN, 0.3
+
+
+def _per_turn_us(fn, turns: int, utterances: List[str]) -> float:
+    n = len(utterances)
+    start = time.perf_counter()
+    for i in range(turns):
+        fn(utterances[i % n])
+    return (time.perf_counter() - start) / turns * 1e6
+
+
+def run_benchmark(turns: int = 200000, utterances: Optional[List[str]] = None) -> Dict[str, float]:
+    """Return microseconds per turn for the sequential, compiled and memoized paths"""
+    utterances = utterances or UTTERANCES
+    detector = IntentDetector(cache_size=0)
+    cached = IntentDetector()
+
+    mismatches = [u for u in utterances if detector.detect(u) != sequential_detect(detector, u)]
+    if mismatches:
+        raise AssertionError(f"Compiled classifier disagrees on: {mismatches}")
+
+    return {
+        "sequential_us": _per_turn_us(lambda u: sequential_detect(detector, u), turns, utterances),
+        "compiled_us": _per_turn_us(detector.detect, turns, utterances),
+        "cached_us": _per_turn_us(cached.detect, turns, utterances),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-turn intent detection")
+    parser.add_argument("--turns", type=int, default=200000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.turns)
+    for name, value in results.items():
+        print(f"{name:<16} {value:8.2f} µs/turn")
+    print(f"Speedup: {results['sequential_us'] / results['compiled_us']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
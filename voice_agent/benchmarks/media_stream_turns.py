@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Media stream end-to-end benchmark
+
+A fake Twilio media client replays scripted calls against a local
+MediaStreamServer: mu-law speech frames for each word, then silence, and
+waits for the agent's audio before the next utterance. Turn latency is
+measured by the client from its last speech frame to the first audio frame
+of the reply, so it includes endpointing; turns committed early from
+partial transcripts come back before the caller has finished (negative
+latency).
+
+Usage:
+    python -m voice_agent.benchmarks.media_stream_turns --calls 4
+    python -m voice_agent.benchmarks.media_stream_turns --fast  # no real-time pacing
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from voice_agent.benchmarks.streaming_turns import SCRIPTS
+from voice_agent.call_flows import CallType
+from voice_agent.media_stream import (
+    ENDPOINT_FRAMES, FRAME_BYTES, FRAMES_PER_WORD, MediaStreamServer, WebSocket
+)
+
+
+FRAME_SECONDS = 0.02
+SPEECH_FRAME = bytes((0x10 + i % 64) for i in range(FRAME_BYTES))
+SILENCE_FRAME = b"\xff" * FRAME_BYTES
+
+
+class FakeMediaClient:
+    """Plays the Twilio side of a media stream for one call"""
+
+    def __init__(self, host: str, port: int, realtime: bool = True):
+        self.host = host
+        self.port = port
+        self.realtime = realtime
+        self.ws: Optional[WebSocket] = None
+        self.stream_sid = ""
+        self.marks: List[str] = []
+        self.audio_bytes = 0
+        # turn index -> time the first reply audio frame arrived
+        self._first_audio: Dict[int, float] = {}
+        self._pending_first: Optional[float] = None
+        self._turn_done: Dict[int, asyncio.Event] = {}
+        self.ended = asyncio.Event()
+
+    def _event(self, turn: int) -> asyncio.Event:
+        return self._turn_done.setdefault(turn, asyncio.Event())
+
+    async def _read(self):
+        while True:
+            message = await self.ws.recv()
+            if message is None:
+                self.ended.set()
+                return
+            event = json.loads(message)
+            if event["event"] == "media":
+                if self._pending_first is None:
+                    self._pending_first = time.perf_counter()
+                self.audio_bytes += len(base64.b64decode(event["media"]["payload"]))
+            elif event["event"] == "mark":
+                name = event["mark"]["name"]
+                self.marks.append(name)
+                if name.startswith("turn-"):
+                    turn = int(name[5:])
+                    self._first_audio[turn] = self._pending_first
+                    self._pending_first = None
+                    self._event(turn).set()
+                else:
+                    self.ended.set()
+
+    async def _send_frame(self, frame: bytes, chunk: int):
+        await self.ws.send_json({
+            "event": "media",
+            "streamSid": self.stream_sid,
+            "media": {"track": "inbound", "chunk": str(chunk), "payload": base64.b64encode(frame).decode("ascii")}
+        })
+        if self.realtime:
+            await asyncio.sleep(FRAME_SECONDS)
+
+    async def run_call(
+        self,
+        call_sid: str,
+        call_type: CallType,
+        utterances: Sequence[str],
+        timeout: float = 10.0
+    ) -> List[float]:
+        """
+        Replay one call
+
+        Returns:
+            Per-turn latency in ms (last speech frame to first reply audio)
+        """
+        self.ws = await WebSocket.connect(self.host, self.port, "/media")
+        self.stream_sid = f"MZ{call_sid}"
+        reader = asyncio.ensure_future(self._read())
+        await self.ws.send_json({"event": "connected", "protocol": "Call", "version": "1.0.0"})
+        await self.ws.send_json({
+            "event": "start",
+            "streamSid": self.stream_sid,
+            "start": {
+                "callSid": call_sid,
+                "streamSid": self.stream_sid,
+                "tracks": ["inbound"],
+                "mediaFormat": {"encoding": "audio/x-mulaw", "sampleRate": 8000, "channels": 1},
+                "customParameters": {"call_type": call_type.value, "script": "|".join(utterances)},
+            },
+        })
+        await asyncio.wait_for(self._event(0).wait(), timeout)
+
+        latencies = []
+        chunk = 0
+        for turn, text in enumerate(utterances, start=1):
+            speech_end = None
+            for _ in range(len(text.split()) * FRAMES_PER_WORD):
+                chunk += 1
+                await self._send_frame(SPEECH_FRAME, chunk)
+                speech_end = time.perf_counter()
+            # The caller pauses even if the reply already started (early commit)
+            for _ in range(ENDPOINT_FRAMES + 5):
+                chunk += 1
+                await self._send_frame(SILENCE_FRAME, chunk)
+            await asyncio.wait_for(self._event(turn).wait(), timeout)
+            latencies.append((self._first_audio[turn] - speech_end) * 1000)
+            if self.ended.is_set():
+                break
+
+        await self.ws.send_json({"event": "stop", "streamSid": self.stream_sid})
+        await asyncio.wait_for(reader, timeout)
+        await self.ws.close()
+        return latencies
+
+
+async def run_benchmark_async(calls: int = 4, realtime: bool = True) -> Dict[str, Any]:
+    """Replay `calls` concurrent scripted calls per script; returns latency stats"""
+    server = MediaStreamServer(port=0)
+    port = await server.start()
+    try:
+        clients = []
+        for i in range(calls):
+            for name, (call_type, utterances) in SCRIPTS.items():
+                client = FakeMediaClient("127.0.0.1", port, realtime=realtime)
+                clients.append(client.run_call(f"CA{name}{i}", call_type, utterances))
+        results = await asyncio.gather(*clients)
+    finally:
+        await server.close()
+
+    latencies = sorted(latency for call in results for latency in call)
+    return {
+        "calls": len(results),
+        "turns": len(latencies),
+        "early_turns": sum(1 for latency in latencies if latency < 0),
+        "client_p50_ms": statistics.median(latencies),
+        "client_max_ms": latencies[-1],
+        "server": server.get_metrics(),
+    }
+
+
+def run_benchmark(calls: int = 4, realtime: bool = True) -> Dict[str, Any]:
+    return asyncio.run(run_benchmark_async(calls, realtime))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end media stream turn latency")
+    parser.add_argument("--calls", type=int, default=4, help="Concurrent calls per script")
+    parser.add_argument("--fast", action="store_true", help="Send frames without real-time pacing")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.calls, realtime=not args.fast)
+    server = report["server"]
+    print(f"calls={report['calls']} turns={report['turns']} answered before end of speech={report['early_turns']}")
+    endpointing = "" if args.fast else f" (includes {ENDPOINT_FRAMES * FRAME_SECONDS * 1000:.0f}ms endpointing)"
+    print(f"client: p50={report['client_p50_ms']:.1f}ms max={report['client_max_ms']:.1f}ms{endpointing}")
+    print(f"server: transcript->first audio p50={server.get('turn_latency_p50_ms', 0)}ms "
+          f"p99={server.get('turn_latency_p99_ms', 0)}ms")
+
+
+if __name__ == "__main__":
+    main()
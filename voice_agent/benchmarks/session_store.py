@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Session store per-turn overhead benchmark
+
+Measures what a session store adds to each turn (load + save of a call
+context with a realistic amount of history) for the in-memory and SQLite
+backends, and the end-to-end turn time through VoiceAgentStateMachine.
+
+Usage:
+    python -m voice_agent.benchmarks.session_store --turns 5000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict
+
+from voice_agent.call_flows import CallContext, CallState, CallType
+from voice_agent.session_store import CallSessionStore, InMemorySessionStore, SQLiteSessionStore
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+def _sample_context(call_id: str) -> CallContext:
+    context = CallContext(call_id=call_id, call_type=CallType.MISSED, contact_phone="+15550001111",
+                          current_state=CallState.OPERATIONS_ASSESSMENT)
+    context.collected_data.update({
+        "city": "Irvine", "issue": "AC stopped, house getting hot", "urgency": "urgent",
+        "callback_window": "tomorrow 9-11am", "text_ok": True,
+    })
+    for i in range(6):
+        context.add_to_history(CallState.BUSINESS_DISCOVERY, f"caller turn {i} with a few words", f"prompt {i}")
+    return context
+
+
+def measure_store(store: CallSessionStore, turns: int) -> float:
+    """Mean microseconds for one load + save cycle"""
+    store.create(_sample_context("CA_BENCH"))
+    start = time.perf_counter()
+    for _ in range(turns):
+        context = store.load("CA_BENCH")
+        context.clarification_count = (context.clarification_count + 1) % 2
+        store.save(context)
+    elapsed = time.perf_counter() - start
+    store.delete("CA_BENCH")
+    return elapsed / turns * 1e6
+
+
+def measure_turns(store: CallSessionStore, turns: int) -> float:
+    """Mean microseconds per process_user_input turn with the given store"""
+    sm = VoiceAgentStateMachine(session_store=store)
+    start = time.perf_counter()
+    for i in range(turns):
+        if i % 4 == 0:
+            sm.start_call(f"CA{i}", CallType.INBOUND, {"contact_phone": "+15550001111"})
+        sm.process_user_input(f"CA{i - i % 4}", "It's for a small office downtown.")
+    return (time.perf_counter() - start) / turns * 1e6
+
+
+def run_benchmark(turns: int = 5000) -> Dict[str, float]:
+    """Return per-turn microseconds for each backend"""
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_store = SQLiteSessionStore(os.path.join(tmp, "sessions.db"))
+        results = {
+            "memory_load_save_us": measure_store(InMemorySessionStore(), turns),
+            "sqlite_load_save_us": measure_store(sqlite_store, turns),
+            "memory_turn_us": measure_turns(InMemorySessionStore(), turns),
+            "sqlite_turn_us": measure_turns(sqlite_store, turns),
+        }
+        sqlite_store.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session store overhead per turn")
+    parser.add_argument("--turns", type=int, default=5000)
+    args = parser.parse_args()
+
+    for name, value in run_benchmark(args.turns).items():
+        print(f"{name:<22} {value:9.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
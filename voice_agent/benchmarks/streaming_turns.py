@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Streaming turn latency benchmark
+
+Replays scripted calls word by word as partial transcripts and compares
+when each turn's response is ready:
+
+- end of speech: last word + Twilio's speechTimeout + processing
+- streaming: the partial a StreamingTurnProcessor commits on (+ processing
+  of every partial up to it); turns without an early commit fall back to
+  end of speech
+
+Speech timing is simulated (words at a fixed rate); processing time is
+measured.
+
+Usage:
+    python -m voice_agent.benchmarks.streaming_turns --endpoint-s 5
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+from voice_agent.call_flows import CallType
+from voice_agent.simulate_call import map_scenario_to_call_type, scenario_script
+from voice_agent.state_machine import VoiceAgentStateMachine
+from voice_agent.streaming import StreamingTurnProcessor
+
+
+# ~170 words per minute
+WORD_SECONDS = 0.35
+
+# Recorded scenario scripts plus calls decided early in the utterance
+SCRIPTS: Dict[str, Tuple[CallType, List[str]]] = {
+    name: (map_scenario_to_call_type(name), scenario_script(name))
+    for name in ("missed_call", "demo_request", "inbound")
+}
+SCRIPTS.update({
+    "outbound_yes": (CallType.OUTBOUND, [
+        "Yes, now is a good time, go ahead and ask.",
+        "We run a family law practice with two attorneys.",
+    ]),
+    "outbound_opt_out": (CallType.OUTBOUND, [
+        "Please stop calling me, I already told you guys last week.",
+    ]),
+    "inbound_transfer": (CallType.INBOUND, [
+        "Can I talk to a person about pricing for my office please?",
+    ]),
+    "missed_opt_out": (CallType.MISSED, [
+        "Not interested, please remove me from whatever list this is.",
+    ]),
+})
+
+
+def replay_script(call_type: CallType, utterances: List[str], endpoint_s: float) -> List[Dict[str, float]]:
+    """Per-turn response-ready times (seconds from start of the utterance)"""
+    sm = VoiceAgentStateMachine()
+    processor = StreamingTurnProcessor(sm)
+    sm.start_call("CA_STREAM", call_type)
+    turns = []
+
+    for text in utterances:
+        words = text.split()
+        end_of_speech = len(words) * WORD_SECONDS
+        streaming_ready = None
+        processing = 0.0
+
+        for k in range(1, len(words) + 1):
+            start = time.perf_counter()
+            result = processor.feed_partial("CA_STREAM", " ".join(words[:k]))
+            processing += time.perf_counter() - start
+            if result is not None:
+                streaming_ready = k * WORD_SECONDS + processing
+                break
+
+        start = time.perf_counter()
+        result = processor.finalize("CA_STREAM", text)
+        final_processing = time.perf_counter() - start
+        baseline_ready = end_of_speech + endpoint_s + final_processing
+        turns.append({
+            "baseline_s": baseline_ready,
+            "streaming_s": streaming_ready if streaming_ready is not None else baseline_ready,
+            "early": streaming_ready is not None,
+        })
+        if result.get("should_end") or result.get("should_transfer"):
+            break
+    return turns
+
+
+def run_benchmark(endpoint_s: float = 5.0) -> Dict[str, Dict[str, float]]:
+    """Mean response-ready latency per script, with and without streaming"""
+    report = {}
+    for name, (call_type, utterances) in SCRIPTS.items():
+        turns = replay_script(call_type, utterances, endpoint_s)
+        report[name] = {
+            "turns": len(turns),
+            "early_commits": sum(turn["early"] for turn in turns),
+            "baseline_ms": statistics.mean(turn["baseline_s"] for turn in turns) * 1000,
+            "streaming_ms": statistics.mean(turn["streaming_s"] for turn in turns) * 1000,
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare end-of-speech vs streaming turn latency")
+    parser.add_argument("--endpoint-s", type=float, default=5.0,
+                        help="Silence before the final transcript (Twilio speechTimeout)")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.endpoint_s)
+    print(f"{'script':<18} {'turns':>5} {'early':>5} {'end-of-speech':>14} {'streaming':>10}")
+    for name, row in report.items():
+        print(f"{name:<18} {row['turns']:>5} {row['early_commits']:>5} "
+              f"{row['baseline_ms']:>12.0f}ms {row['streaming_ms']:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
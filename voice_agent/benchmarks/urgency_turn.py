@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Urgency classification per-turn benchmark
+
+Times UrgencyClassifier.classify on missed-call issue/urgency answers:
+
+    per_keyword  one word-boundary re.search per keyword (the dispatch service's
+                 loop, ported as-is; reference only, it can't tell "not urgent"
+                 from "urgent")
+    compiled     single-pass keyword automaton + weighted patterns, no cache
+    cached       the default classifier (memoized per text)
+
+and reports mean and p99 microseconds per turn against a budget.
+
+Usage:
+    python -m voice_agent.benchmarks.urgency_turn --turns 100000 --budget-us 25
+"""
+
+import argparse
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+from voice_agent.urgency import URGENCY_CATEGORIES, UrgencyClassifier
+
+
+# Mean per-turn budget for the uncached classifier (generous; CI machines vary)
+DEFAULT_BUDGET_US = 25.0
+
+UTTERANCES = [
+    "I'm in Irvine, my AC stopped and the house is getting hot.",
+    "Pretty urgent. No AC tonight and we've got kids in the house.",
+    "I'm in Tustin and the furnace won't turn on.",
+    "It can wait until tomorrow.",
+    "I'm in Anaheim, water is leaking under the kitchen sink.",
+    "Not urgent, sometime this week is fine.",
+    "In Costa Mesa, the breaker keeps tripping.",
+    "Very urgent, it's getting worse.",
+    "I'm in Irvine, a pipe burst and water is everywhere.",
+    "I'm in Orange and I smell gas in the kitchen.",
+    "The smoke detector keeps chirping, no rush.",
+    "Water is pouring through the ceiling and I can't shut the water off.",
+]
+
+
+def _per_keyword_patterns():
+    return [
+        (category, re.compile(rf"\b{re.escape(keyword)}\b"))
+        for category in URGENCY_CATEGORIES
+        for keyword in category.keywords
+    ]
+
+
+def per_keyword_score(patterns, text: str) -> float:
+    """Reference scorer: every keyword searched separately"""
+    text = text.lower()
+    seen = {}
+    for category, pattern in patterns:
+        if category.name not in seen and pattern.search(text):
+            seen[category.name] = category.weight
+    return sum(seen.values())
+
+
+def _timings_us(fn, turns: int, utterances: List[str]) -> List[float]:
+    n = len(utterances)
+    timings = []
+    clock = time.perf_counter
+    for i in range(turns):
+        text = utterances[i % n]
+        start = clock()
+        fn(text)
+        timings.append((clock() - start) * 1e6)
+    return timings
+
+
+def _summary(timings: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "mean_us": sum(ordered) / len(ordered),
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+
+def run_benchmark(turns: int = 100000, utterances: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Return mean/p99 microseconds per turn for the per-keyword, compiled and cached paths"""
+    utterances = utterances or UTTERANCES
+    classifier = UrgencyClassifier()
+    patterns = _per_keyword_patterns()
+    return {
+        "per_keyword": _summary(_timings_us(lambda u: per_keyword_score(patterns, u), turns, utterances)),
+        # _classify skips the memo, so every turn pays for the full scan
+        "compiled": _summary(_timings_us(lambda u: classifier._classify(u.lower()), turns, utterances)),
+        "cached": _summary(_timings_us(classifier.classify, turns, utterances)),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-turn urgency classification")
+    parser.add_argument("--turns", type=int, default=100000)
+    parser.add_argument("--budget-us", type=float, default=DEFAULT_BUDGET_US,
+                        help=f"Fail if compiled mean exceeds this (default: {DEFAULT_BUDGET_US})")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.turns)
+    for name, stats in results.items():
+        print(f"{name:<12} mean {stats['mean_us']:7.2f} µs   p99 {stats['p99_us']:7.2f} µs")
+    print(f"Speedup (mean): {results['per_keyword']['mean_us'] / results['compiled']['mean_us']:.1f}x")
+
+    if results["compiled"]["mean_us"] > args.budget_us:
+        print(f"OVER BUDGET: {results['compiled']['mean_us']:.2f} µs > {args.budget_us:.2f} µs")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,11 +13,23 @@ Enhanced with:
 - Graceful failure handling
 """
 
+import threading
+import time
+from collections import deque
 from enum import Enum
-from typing import Dict, List, Optional, Any, Set
+from types import MappingProxyType
 from dataclasses import dataclass
+from string import Formatter
+from typing import (
+    Any, Callable, Deque, Dict, FrozenSet, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set,
+    Tuple, Union
+)
 from datetime import datetime
 
+from .field_extractors import FIELD_EXTRACTORS, FieldExtractor
+from .opt_out import OPT_OUT_MATCHER
+from .urgency import URGENCY_CLASSIFIER, UrgencyClassifier, UrgencyLevel
+
 
 class CallType(Enum):
     """Type of call being handled"""
@@ -42,47 +54,258 @@ class CallState(Enum):
     DATA_INCOMPLETE = "data_incomplete"  # Missing required data
 
 
-@dataclass
+# Oldest turns are dropped once a call has this many history entries
+MAX_HISTORY_ENTRIES = 50
+
+
+class HistoryEntry(NamedTuple):
+    """One conversation turn; `elapsed` is seconds since the call started (monotonic)"""
+    state: str
+    response: str
+    prompt: Optional[str]
+    elapsed: float
+
+
+_CONTEXT_FIELDS = (
+    "call_id", "call_type", "lead_id", "business_name", "contact_name", "contact_phone",
+    "current_state", "collected_data", "history", "missing_fields", "clarification_count",
+    "max_clarifications", "version", "started_at", "history_count",
+)
+
+
 class CallContext:
-    """Context maintained throughout a call"""
-    call_id: str
-    call_type: CallType
-    lead_id: Optional[str] = None
-    business_name: Optional[str] = None
-    contact_name: Optional[str] = None
-    contact_phone: Optional[str] = None
-    current_state: CallState = CallState.GREETING
-    collected_data: Dict[str, Any] = None
-    conversation_history: List[Dict[str, str]] = None
-    missing_fields: Set[str] = None
-    clarification_count: int = 0
-    max_clarifications: int = 2
-    
-    def __post_init__(self):
-        if self.collected_data is None:
-            self.collected_data = {}
-        if self.conversation_history is None:
-            self.conversation_history = []
-        if self.missing_fields is None:
-            self.missing_fields = set()
-    
+    """
+    Context maintained throughout a call
+
+    A __slots__ class (no per-instance __dict__). History is a bounded ring
+    buffer of HistoryEntry tuples; `conversation_history` renders it as the
+    list of dicts callers used to get.
+    """
+    __slots__ = _CONTEXT_FIELDS + ("_monotonic_start", "prompt_cache")
+
+    def __init__(
+        self,
+        call_id: str,
+        call_type: CallType,
+        lead_id: Optional[str] = None,
+        business_name: Optional[str] = None,
+        contact_name: Optional[str] = None,
+        contact_phone: Optional[str] = None,
+        current_state: CallState = CallState.GREETING,
+        collected_data: Optional[Dict[str, Any]] = None,
+        conversation_history: Optional[Iterable[Union[HistoryEntry, Dict[str, Any]]]] = None,
+        missing_fields: Optional[Set[str]] = None,
+        clarification_count: int = 0,
+        max_clarifications: int = 2,
+        version: int = 0,
+        started_at: Optional[float] = None,
+        history_count: Optional[int] = None
+    ):
+        """
+        Args:
+            conversation_history: HistoryEntry tuples (or legacy history dicts)
+            version: Bumped on every session store save (optimistic concurrency)
+            started_at: Wall-clock start of the call (epoch seconds, default now)
+            history_count: Entries ever added, including ones dropped from the
+                ring buffer (default: number of entries given)
+        """
+        self.call_id = call_id
+        self.call_type = call_type
+        self.lead_id = lead_id
+        self.business_name = business_name
+        self.contact_name = contact_name
+        self.contact_phone = contact_phone
+        self.current_state = current_state
+        self.collected_data = collected_data if collected_data is not None else {}
+        self.missing_fields = missing_fields if missing_fields is not None else set()
+        self.clarification_count = clarification_count
+        self.max_clarifications = max_clarifications
+        self.version = version
+        self.started_at = time.time() if started_at is None else started_at
+        # Monotonic clock reading that corresponds to started_at
+        self._monotonic_start = time.monotonic() - (time.time() - self.started_at)
+        self.history: Deque[HistoryEntry] = deque(maxlen=MAX_HISTORY_ENTRIES)
+        # (inputs, text) of the last prompt a flow rendered; not persisted
+        self.prompt_cache: Optional[Tuple[Any, str]] = None
+        self.conversation_history = conversation_history or ()
+        if history_count is not None:
+            self.history_count = history_count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CallContext):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _CONTEXT_FIELDS)
+
+    def __repr__(self) -> str:
+        return (f"CallContext(call_id={self.call_id!r}, call_type={self.call_type}, "
+                f"current_state={self.current_state}, turns={self.history_count}, version={self.version})")
+
+    @property
+    def conversation_history(self) -> List[Dict[str, Any]]:
+        """History rendered as dicts with ISO timestamps (built on each access)"""
+        return [self._render(entry) for entry in self.history]
+
+    @conversation_history.setter
+    def conversation_history(self, entries: Iterable[Union[HistoryEntry, Dict[str, Any]]]):
+        self.history.clear()
+        for entry in entries:
+            if isinstance(entry, dict):
+                timestamp = entry.get("timestamp")
+                elapsed = (datetime.fromisoformat(timestamp).timestamp() - self.started_at
+                           if timestamp else 0.0)
+                entry = HistoryEntry(entry["state"], entry["response"], entry.get("prompt"), round(elapsed, 3))
+            self.history.append(HistoryEntry(*entry))
+        self.history_count = len(self.history)
+
+    def _render(self, entry: HistoryEntry) -> Dict[str, Any]:
+        return {
+            "state": entry.state,
+            "response": entry.response,
+            "prompt": entry.prompt,
+            "timestamp": datetime.fromtimestamp(self.started_at + entry.elapsed).isoformat()
+        }
+
     def add_to_history(self, state: CallState, response: str, prompt: Optional[str] = None):
         """Add entry to conversation history with timestamp"""
-        self.conversation_history.append({
-            "state": state.value,
-            "response": response,
-            "prompt": prompt,
-            "timestamp": datetime.now().isoformat()
-        })
+        elapsed = round(time.monotonic() - self._monotonic_start, 3)
+        self.history.append(HistoryEntry(state.value, response, prompt, elapsed))
+        self.history_count += 1
+
+    def history_since(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Rendered entries added after the first `count` (see history_count)
+
+        Entries already dropped from the ring buffer are not returned.
+        """
+        new = self.history_count - count
+        if new <= 0:
+            return []
+        retained = list(self.history)
+        return [self._render(entry) for entry in retained[max(len(retained) - new, 0):]]
+
+
+# Clarifying question asked for each missing field
+CLARIFICATION_QUESTIONS: Mapping[str, str] = MappingProxyType({
+    "business_description": "Could you tell me more about what your business does?",
+    "industry": "What industry would you say you're in?",
+    "manual_tasks": "What tasks are you doing manually right now?",
+    "biggest_pain": "What's the biggest challenge you're facing?",
+    "is_decision_maker": "Are you able to make decisions about operations and automation?",
+    "timeline": "When would you consider making changes?",
+    "email": "What's the best email address to reach you?",
+    "phone": "What's the best phone number to reach you?"
+})
+
+
+# Template values used when the call has no contact/business name yet
+PROMPT_DEFAULTS: Mapping[str, str] = MappingProxyType({
+    "name": "there",
+    "agent_name": "Sarah from Afterhours",
+    "business_name": "your business",
+    "clarification_question": ""
+})
+
+
+class PromptTemplate:
+    """
+    str.format template split once into (literal, field) parts
+
+    Rendering joins the parts instead of re-parsing the template on every
+    turn. Templates using format specs, conversions or attribute/index
+    lookups fall back to str.format.
+    """
+    __slots__ = ("template", "fields", "_parts", "_static")
+
+    def __init__(self, template: str):
+        self.template = template
+        parsed = list(Formatter().parse(template))
+        self.fields: FrozenSet[str] = frozenset(field for _, field, _, _ in parsed if field)
+        simple = all(
+            not spec and not conversion and "." not in field and "[" not in field
+            for _, field, spec, conversion in parsed if field is not None
+        )
+        self._parts: Optional[Tuple[Tuple[str, Optional[str]], ...]] = (
+            tuple((literal, field) for literal, field, _, _ in parsed) if simple else None
+        )
+        # Text of a template without fields ("{{" already unescaped)
+        self._static: Optional[str] = "".join(literal for literal, _, _, _ in parsed) if not self.fields else None
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Fill in the template (values must contain every field)"""
+        if self._static is not None:
+            return self._static
+        if self._parts is None:
+            return self.template.format(**values)
+        return "".join(
+            literal + str(values[field]) if field is not None else literal
+            for literal, field in self._parts
+        )
+
+
+@dataclass(frozen=True)
+class FlowTable:
+    """Routing data compiled from a flow's state and required-field definitions"""
+    next_state: Mapping[CallState, CallState]
+    fields_to_collect: Mapping[CallState, Tuple[str, ...]]
+    required_fields: Mapping[CallState, Tuple[str, ...]]
+    prompts: Mapping[CallState, PromptTemplate]
+    # Every required field across all states, in definition order (for completeness scoring)
+    all_required_fields: Tuple[str, ...]
+    # (field, extractor or None, required in that state) per state, in fields_to_collect order
+    extractors: Mapping[CallState, Tuple[Tuple[str, Optional[FieldExtractor], bool], ...]]
 
 
 class CallFlow:
     """Base class for call flow definitions"""
     
+    # Linear order of the main states; each advances to the next one
+    STATE_SEQUENCE: Tuple[CallState, ...] = ()
+    
+    # Per-flow extractor overrides (field -> extractor) on top of FIELD_EXTRACTORS
+    FIELD_EXTRACTORS: Mapping[str, FieldExtractor] = MappingProxyType({})
+    
     def __init__(self, call_type: CallType):
         self.call_type = call_type
         self.states = self._define_states()
         self.required_fields = self._define_required_fields()
+        self.table = self.compile()
+    
+    def compile(self) -> FlowTable:
+        """
+        Build the transition table from the current definitions
+        
+        Called at construction and again by FlowRegistry.register, so
+        definitions edited before registration are picked up.
+        """
+        sequence = self.STATE_SEQUENCE
+        required = {state: tuple(fields) for state, fields in self.required_fields.items()}
+        fields_to_collect = {
+            state: tuple(state_def.get("fields_to_collect", ()))
+            for state, state_def in self.states.items()
+        }
+        extractors = dict(FIELD_EXTRACTORS)
+        extractors.update(self.FIELD_EXTRACTORS)
+        return FlowTable(
+            next_state=MappingProxyType(dict(zip(sequence, sequence[1:]))),
+            fields_to_collect=MappingProxyType(fields_to_collect),
+            required_fields=MappingProxyType(required),
+            prompts=MappingProxyType({
+                state: PromptTemplate(state_def["prompt"])
+                for state, state_def in self.states.items() if "prompt" in state_def
+            }),
+            all_required_fields=tuple(field for fields in required.values() for field in fields),
+            extractors=MappingProxyType({
+                state: tuple(
+                    (field, extractors.get(field), field in required.get(state, ()))
+                    for field in fields
+                )
+                for state, fields in fields_to_collect.items() if fields
+            })
+        )
+    
+    def next_state_after(self, state: CallState) -> CallState:
+        """Next state in STATE_SEQUENCE (COMPLETED after the last one or off-sequence)"""
+        return self.table.next_state.get(state, CallState.COMPLETED)
     
     def _define_states(self) -> Dict[CallState, Dict[str, Any]]:
         """Define the states and transitions for this flow"""
@@ -100,6 +323,26 @@ class CallFlow:
         """Process user response and determine next state"""
         raise NotImplementedError
     
+    def collect_fields(self, state: CallState, response: str, context: CallContext):
+        """
+        Store the fields this state collects from a response
+        
+        Each field gets its extractor's value; the raw response is stored only
+        for required fields without an extractor or whose extractor found nothing.
+        """
+        if not response.strip():
+            return
+        collected = context.collected_data
+        for field, extractor, required in self.table.extractors.get(state, ()):
+            value = extractor(response) if extractor is not None else None
+            if not value:
+                if not required:
+                    continue
+                value = response
+            collected[field] = value
+            # Remove from missing fields if it was there
+            context.missing_fields.discard(field)
+    
     def check_data_completeness(self, state: CallState, context: CallContext) -> tuple[bool, List[str]]:
         """
         Check if required data for current state is complete
@@ -107,13 +350,8 @@ class CallFlow:
         Returns:
             (is_complete, missing_fields)
         """
-        required = self.required_fields.get(state, [])
-        missing = []
-        
-        for field in required:
-            if field not in context.collected_data or not context.collected_data[field]:
-                missing.append(field)
-        
+        collected = context.collected_data
+        missing = [field for field in self.table.required_fields.get(state, ()) if not collected.get(field)]
         return len(missing) == 0, missing
     
     def get_clarifying_question(self, missing_fields: List[str], state: CallState) -> Optional[str]:
@@ -121,22 +359,11 @@ class CallFlow:
         if not missing_fields:
             return None
         
-        # Map fields to clarifying questions
-        clarification_map = {
-            "business_description": "Could you tell me more about what your business does?",
-            "industry": "What industry would you say you're in?",
-            "manual_tasks": "What tasks are you doing manually right now?",
-            "biggest_pain": "What's the biggest challenge you're facing?",
-            "is_decision_maker": "Are you able to make decisions about operations and automation?",
-            "timeline": "When would you consider making changes?",
-            "email": "What's the best email address to reach you?",
-            "phone": "What's the best phone number to reach you?"
-        }
-        
         # Return question for first missing field
         for field in missing_fields:
-            if field in clarification_map:
-                return clarification_map[field]
+            question = CLARIFICATION_QUESTIONS.get(field)
+            if question is not None:
+                return question
         
         return f"Could you provide more details about {missing_fields[0]}?"
 
@@ -151,6 +378,16 @@ class OutboundDiscoveryFlow(CallFlow):
     - Graceful handling of incomplete information
     """
     
+    STATE_SEQUENCE = (
+        CallState.GREETING,
+        CallState.BUSINESS_DISCOVERY,
+        CallState.OPERATIONS_ASSESSMENT,
+        CallState.DECISION_MAKER_CONFIRMATION,
+        CallState.TIMELINE_INTEREST,
+        CallState.CLOSING,
+        CallState.COMPLETED
+    )
+    
     def _define_states(self) -> Dict[CallState, Dict[str, Any]]:
         return {
             CallState.GREETING: {
@@ -211,35 +448,47 @@ class OutboundDiscoveryFlow(CallFlow):
         }
     
     def get_next_prompt(self, state: CallState, context: CallContext) -> str:
-        """Get formatted prompt for current state"""
-        state_def = self.states.get(state)
-        if not state_def:
+        """
+        Get formatted prompt for current state
+        
+        The rendered prompt is cached on the context and reused while the
+        state, contact/business names and missing fields are unchanged
+        (e.g. when the caller asks to repeat a clarifying question).
+        """
+        missing = frozenset(context.missing_fields)
+        key = (self, state, context.current_state, context.contact_name, context.business_name, missing)
+        cached = context.prompt_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        prompt = self._render_prompt(state, context, missing)
+        context.prompt_cache = (key, prompt)
+        return prompt
+    
+    def _render_prompt(self, state: CallState, context: CallContext, missing: FrozenSet[str]) -> str:
+        prompts = self.table.prompts
+        template = prompts.get(state)
+        if template is None:
             return "I'm sorry, I didn't understand. Could you repeat that?"
         
-        prompt_template = state_def["prompt"]
+        clarification_question = None
+        if state == CallState.CLARIFYING or "clarification_question" in template.fields:
+            clarification_question = self.get_clarifying_question(list(missing), context.current_state)
         
         # Handle clarifying state
         if state == CallState.CLARIFYING:
-            clarification_question = self.get_clarifying_question(
-                list(context.missing_fields),
-                context.current_state
-            )
             if clarification_question:
                 return clarification_question
             # Fallback to previous state prompt
-            state_def = self.states.get(context.current_state)
-            prompt_template = state_def["prompt"] if state_def else prompt_template
+            template = prompts.get(context.current_state, template)
         
         # Format with context data
-        return prompt_template.format(
-            name=context.contact_name or "there",
-            agent_name="Sarah from Afterhours",
-            business_name=context.business_name or "your business",
-            clarification_question=self.get_clarifying_question(
-                list(context.missing_fields),
-                context.current_state
-            ) or ""
-        )
+        return template.render({
+            "name": context.contact_name or PROMPT_DEFAULTS["name"],
+            "agent_name": PROMPT_DEFAULTS["agent_name"],
+            "business_name": context.business_name or PROMPT_DEFAULTS["business_name"],
+            "clarification_question": clarification_question or PROMPT_DEFAULTS["clarification_question"]
+        })
     
     def process_response(self, state: CallState, response: str, context: CallContext) -> CallState:
         """Process response and extract data, return next state"""
@@ -251,14 +500,7 @@ class OutboundDiscoveryFlow(CallFlow):
         context.add_to_history(state, response)
         
         # Extract data based on fields_to_collect
-        fields = state_def.get("fields_to_collect", [])
-        for field in fields:
-            # In real implementation, use NLP to extract structured data
-            # For MVP, store raw response
-            if response.strip():
-                context.collected_data[field] = response
-                # Remove from missing fields if it was there
-                context.missing_fields.discard(field)
+        self.collect_fields(state, response, context)
         
         # If we're in clarifying state, check if we got the missing data
         if state == CallState.CLARIFYING:
@@ -284,27 +526,16 @@ class OutboundDiscoveryFlow(CallFlow):
             context.clarification_count = 1
             return CallState.CLARIFYING
         
-        # Determine next state
-        next_states = state_def.get("next_states", [])
-        
         # Handle opt-out in greeting
         if state == CallState.GREETING:
-            response_lower = response.lower().strip()
-
             # SAFE opt-out detection:
-            # Only opt out on explicit phrases like "not now", "busy", "call later", "no thanks".
-            # Avoid false positives like "no AC", "no heat", "no water".
-            explicit_opt_out = any(phrase in response_lower for phrase in [
-                "no thanks", "no thank you", "not now", "call later", "later", "busy", "stop calling", "don't call", "do not call"
-            ])
-
-            # If the whole response is basically "no" (short), treat as opt-out
-            short_no = response_lower in {"no", "nah", "nope"}
-
-            if explicit_opt_out or short_no:
+            # Only opt out on explicit phrases like "not now", "busy", "call later", "no thanks",
+            # or a bare "no". Avoid false positives like "no AC", "no heat", "no water".
+            if OPT_OUT_MATCHER.match(response).declined:
                 return CallState.OPTED_OUT
 
             # Positive confirmation to proceed
+            response_lower = response.lower().strip()
             if any(word in response_lower for word in ["yes", "sure", "okay", "ok", "fine", "yep", "yeah"]):
                 return CallState.BUSINESS_DISCOVERY
         
@@ -313,23 +544,7 @@ class OutboundDiscoveryFlow(CallFlow):
     
     def _get_next_state_for(self, current_state: CallState) -> CallState:
         """Get next state in sequence"""
-        state_sequence = [
-            CallState.GREETING,
-            CallState.BUSINESS_DISCOVERY,
-            CallState.OPERATIONS_ASSESSMENT,
-            CallState.DECISION_MAKER_CONFIRMATION,
-            CallState.TIMELINE_INTEREST,
-            CallState.CLOSING,
-            CallState.COMPLETED
-        ]
-        try:
-            current_idx = state_sequence.index(current_state)
-            if current_idx < len(state_sequence) - 1:
-                return state_sequence[current_idx + 1]
-        except ValueError:
-            pass
-        
-        return CallState.COMPLETED
+        return self.next_state_after(current_state)
 
 
 class InboundFlow(CallFlow):
@@ -338,6 +553,13 @@ class InboundFlow(CallFlow):
     Shorter, more direct flow focused on understanding their immediate need.
     """
     
+    STATE_SEQUENCE = (
+        CallState.GREETING,
+        CallState.BUSINESS_DISCOVERY,
+        CallState.CLOSING,
+        CallState.COMPLETED
+    )
+    
     def _define_states(self) -> Dict[CallState, Dict[str, Any]]:
         return {
             CallState.GREETING: {
@@ -376,11 +598,7 @@ class InboundFlow(CallFlow):
         
         context.add_to_history(state, response)
         
-        fields = state_def.get("fields_to_collect", [])
-        for field in fields:
-            if response.strip():
-                context.collected_data[field] = response
-                context.missing_fields.discard(field)
+        self.collect_fields(state, response, context)
         
         # Check completeness
         is_complete, missing = self.check_data_completeness(state, context)
@@ -388,21 +606,8 @@ class InboundFlow(CallFlow):
             context.missing_fields = set(missing)
             return CallState.CLARIFYING
         
-        next_states = state_def.get("next_states", [])
-        if next_states:
-            state_sequence = [
-                CallState.GREETING,
-                CallState.BUSINESS_DISCOVERY,
-                CallState.CLOSING,
-                CallState.COMPLETED
-            ]
-            try:
-                current_idx = state_sequence.index(state)
-                if current_idx < len(state_sequence) - 1:
-                    return state_sequence[current_idx + 1]
-            except ValueError:
-                pass
-        
+        if state_def.get("next_states"):
+            return self.next_state_after(state)
         return CallState.COMPLETED
 
 
@@ -412,6 +617,20 @@ class MissedCallFlow(CallFlow):
     Goal: capture triage info + preferred callback window fast.
     """
 
+    STATE_SEQUENCE = (
+        CallState.GREETING,
+        CallState.OPERATIONS_ASSESSMENT,
+        CallState.TIMELINE_INTEREST,
+        CallState.CLOSING,
+        CallState.COMPLETED
+    )
+
+    # Issue/urgency answers are classified after these states; calls at or
+    # above TRANSFER_URGENCY are transferred instead of continuing the flow
+    URGENCY_STATES = frozenset((CallState.GREETING, CallState.OPERATIONS_ASSESSMENT))
+    URGENCY_CLASSIFIER: UrgencyClassifier = URGENCY_CLASSIFIER
+    TRANSFER_URGENCY = UrgencyLevel.EMERGENCY
+
     def _define_states(self) -> Dict[CallState, Dict[str, Any]]:
         return {
             CallState.GREETING: {
@@ -463,12 +682,12 @@ class MissedCallFlow(CallFlow):
 
         context.add_to_history(state, response)
 
-        # Store raw response for each field in this state
-        fields = state_def.get("fields_to_collect", [])
-        for field in fields:
-            if response.strip():
-                context.collected_data[field] = response
-                context.missing_fields.discard(field)
+        # Store extracted values (raw response only for required fields)
+        self.collect_fields(state, response, context)
+
+        # Emergencies go straight to a person, even with fields missing
+        if state in self.URGENCY_STATES and self.classify_urgency(context).rank >= self.TRANSFER_URGENCY.rank:
+            return CallState.TRANSFERRED
 
         # completeness check
         is_complete, missing = self.check_data_completeness(state, context)
@@ -478,26 +697,115 @@ class MissedCallFlow(CallFlow):
             return CallState.CLARIFYING
 
         # move through sequence
-        sequence = [
-            CallState.GREETING,
-            CallState.OPERATIONS_ASSESSMENT,
-            CallState.TIMELINE_INTEREST,
-            CallState.CLOSING,
-            CallState.COMPLETED
-        ]
-        try:
-            i = sequence.index(state)
-            return sequence[i + 1] if i < len(sequence) - 1 else CallState.COMPLETED
-        except ValueError:
-            return CallState.COMPLETED
+        return self.next_state_after(state)
+
+    def classify_urgency(self, context: CallContext) -> UrgencyLevel:
+        """
+        Score the issue and urgency answers and store the level in collected_data
+
+        Returns:
+            The UrgencyLevel (also stored as collected_data["urgency_level"])
+        """
+        data = context.collected_data
+        level = self.URGENCY_CLASSIFIER.classify(data.get("issue"), data.get("urgency")).level
+        data["urgency_level"] = level.value
+        return level
+
+
+def _freeze_definition(value: Any) -> Any:
+    """Recursively convert dicts/lists in a flow definition to read-only types"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze_definition(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_definition(v) for v in value)
+    return value
+
+
+FlowFactory = Callable[[CallType], CallFlow]
+
+
+class FlowRegistry(Mapping):
+    """
+    Process-wide registry of shared, read-only flow instances
+    
+    Each flow is built once at registration, its `states` and
+    `required_fields` are frozen and compiled into a FlowTable, so a single
+    instance can be shared by every call and thread. Flows only mutate the
+    CallContext passed to them.
+    
+    Lookups are lock-free: registration swaps in a new immutable mapping.
+    """
+    
+    def __init__(self, default_call_type: CallType = CallType.OUTBOUND):
+        self.default_call_type = default_call_type
+        self._flows: Mapping[CallType, CallFlow] = MappingProxyType({})
+        self._lock = threading.Lock()
+    
+    def register(
+        self,
+        call_type: CallType,
+        flow: Union[CallFlow, FlowFactory],
+        replace: bool = False
+    ) -> CallFlow:
+        """
+        Register a flow for a call type
+        
+        Args:
+            call_type: Call type the flow handles
+            flow: Flow instance, or a flow class/factory called with call_type
+            replace: Allow replacing an already registered flow
+        
+        Returns:
+            The shared (frozen) flow instance
+        """
+        instance = flow if isinstance(flow, CallFlow) else flow(call_type)
+        instance.states = _freeze_definition(dict(instance.states))
+        instance.required_fields = _freeze_definition(dict(instance.required_fields))
+        instance.table = instance.compile()
+        
+        with self._lock:
+            if call_type in self._flows and not replace:
+                raise ValueError(f"Flow already registered for {call_type.value}; pass replace=True")
+            flows = dict(self._flows)
+            flows[call_type] = instance
+            self._flows = MappingProxyType(flows)
+        return instance
+    
+    def get(self, call_type: CallType, default: Optional[CallFlow] = None) -> CallFlow:
+        """Get shared flow for call type (default call type's flow if unregistered)"""
+        flow = self._flows.get(call_type)
+        if flow is None:
+            flow = default if default is not None else self._flows[self.default_call_type]
+        return flow
+    
+    def __getitem__(self, call_type: CallType) -> CallFlow:
+        return self._flows[call_type]
+    
+    def __iter__(self) -> Iterator[CallType]:
+        return iter(self._flows)
+    
+    def __len__(self) -> int:
+        return len(self._flows)
+
+
+def _build_default_registry() -> FlowRegistry:
+    registry = FlowRegistry()
+    registry.register(CallType.OUTBOUND, OutboundDiscoveryFlow)
+    registry.register(CallType.INBOUND, InboundFlow)
+    registry.register(CallType.DEMO_REQUEST, OutboundDiscoveryFlow)
+    registry.register(CallType.MISSED, MissedCallFlow)
+    return registry
+
+
+# Shared by every state machine, adapter and simulator in the process
+FLOW_REGISTRY = _build_default_registry()
+
+
+def register_flow(call_type: CallType, flow: Union[CallFlow, FlowFactory], replace: bool = True) -> CallFlow:
+    """Register (or replace) a custom flow in the process-wide registry"""
+    return FLOW_REGISTRY.register(call_type, flow, replace=replace)
 
 
 def get_flow_for_call_type(call_type: CallType) -> CallFlow:
-    """Factory function to get appropriate flow for call type"""
-    flow_map = {
-        CallType.OUTBOUND: OutboundDiscoveryFlow(CallType.OUTBOUND),
-        CallType.INBOUND: InboundFlow(CallType.INBOUND),
-        CallType.DEMO_REQUEST: OutboundDiscoveryFlow(CallType.DEMO_REQUEST),
-        CallType.MISSED: MissedCallFlow(CallType.MISSED)
-    }
-    return flow_map.get(call_type, OutboundDiscoveryFlow(CallType.OUTBOUND))
+    """Get the shared flow for a call type from the process-wide registry"""
+    return FLOW_REGISTRY.get(call_type)
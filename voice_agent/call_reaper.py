@@ -0,0 +1,206 @@
+"""
+Idle Call Reaper
+
+Calls are only removed from the session store when end_call() runs. Twilio
+calls that drop without a final webhook would otherwise stay in memory
+forever, so IdleCallReaper expires calls with no turn for `idle_timeout`
+seconds.
+
+- Deadlines live in a min-heap keyed on last-activity time. A turn pushes a
+  new entry instead of updating the old one; stale entries are skipped when
+  popped (lazy invalidation) and the heap is compacted when it grows too
+  large, so a turn costs O(log n) and a reap pass only touches expired entries
+- Before expiring, the call's stored version is compared with the version
+  seen at the last local turn. If another worker (shared session store)
+  processed a turn in between, the call is rescheduled instead of expired
+- `on_expire(summary)` receives get_call_summary() output (with
+  end_reason="idle_timeout") so abandoned calls are still persisted
+"""
+
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .call_flows import CallContext
+from .state_machine import VoiceAgentStateMachine
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 15 * 60
+DEFAULT_REAP_INTERVAL_SECONDS = 5.0
+
+# Rebuild the heap when stale entries outnumber live calls by this factor
+_COMPACT_FACTOR = 4
+
+
+class SummaryFileSink:
+    """on_expire hook that appends call summaries to a JSON-lines file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def __call__(self, summary: Dict[str, Any]):
+        line = json.dumps(summary, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class IdleCallReaper:
+    """Expires calls with no activity for idle_timeout seconds"""
+
+    def __init__(
+        self,
+        state_machine: VoiceAgentStateMachine,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        on_expire: Optional[Callable[[Dict[str, Any]], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            state_machine: State machine whose calls are tracked (listeners are registered on it)
+            idle_timeout: Seconds without a turn before a call expires
+            on_expire: Hook called with the call summary before the call is removed
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.state_machine = state_machine
+        self.idle_timeout = idle_timeout
+        self.on_expire = on_expire
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, str]] = []
+        # call_id -> (deadline, version at last local activity)
+        self._tracked: Dict[str, Tuple[float, int]] = {}
+
+        self.evicted_total = 0
+        self.rescheduled_total = 0
+        self.hook_errors = 0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        state_machine.add_activity_listener(self.touch)
+        state_machine.add_end_listener(self.forget)
+
+    def touch(self, context: CallContext):
+        """Record activity on a call (registered as a state machine listener)"""
+        deadline = self.clock() + self.idle_timeout
+        with self._lock:
+            self._tracked[context.call_id] = (deadline, context.version)
+            heapq.heappush(self._heap, (deadline, context.call_id))
+            if len(self._heap) > _COMPACT_FACTOR * len(self._tracked) + 64:
+                self._compact()
+
+    def forget(self, call_id: str):
+        """Stop tracking an ended call (its heap entries become stale)"""
+        with self._lock:
+            self._tracked.pop(call_id, None)
+
+    def _compact(self):
+        """Drop stale heap entries (caller holds self._lock)"""
+        self._heap = [(deadline, call_id) for call_id, (deadline, _) in self._tracked.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_expired(self, now: float) -> List[Tuple[str, int]]:
+        """Pop due, still-current entries; returns (call_id, version) pairs"""
+        due = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                deadline, call_id = heapq.heappop(heap)
+                tracked = self._tracked.get(call_id)
+                if tracked is None or tracked[0] != deadline:
+                    continue  # stale: call ended or had later activity
+                del self._tracked[call_id]
+                due.append((call_id, tracked[1]))
+        return due
+
+    def reap(self, now: Optional[float] = None) -> int:
+        """
+        Expire every call whose idle deadline has passed
+
+        Args:
+            now: Current clock value (default: clock())
+
+        Returns:
+            Number of calls expired
+        """
+        now = self.clock() if now is None else now
+        sessions = self.state_machine.sessions
+        expired = 0
+
+        for call_id, version in self._pop_expired(now):
+            with sessions.lock(call_id):
+                context = sessions.load(call_id)
+                if context is None:
+                    continue
+                if context.version != version:
+                    # Another worker handled a turn; give the call a fresh timeout
+                    with self._lock:
+                        self.rescheduled_total += 1
+                    self.touch(context)
+                    continue
+
+                summary = self.state_machine.get_call_summary(call_id)
+                sessions.delete(call_id)
+
+            expired += 1
+            logger.info(f"Expired idle call {call_id}")
+
+            # Outside the call's lock: the hook may do slow I/O (session logs)
+            if summary is not None and self.on_expire is not None:
+                summary["end_reason"] = "idle_timeout"
+                try:
+                    self.on_expire(summary)
+                except Exception as e:
+                    # Never let a failing sink keep dead calls in memory
+                    with self._lock:
+                        self.hook_errors += 1
+                    logger.error(f"on_expire hook failed for call {call_id}: {e}")
+
+        with self._lock:
+            self.evicted_total += expired
+        return expired
+
+    def start(self, interval: float = DEFAULT_REAP_INTERVAL_SECONDS):
+        """Run reap() every `interval` seconds in a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.reap()
+                except Exception as e:
+                    logger.error(f"Idle call reaper pass failed: {e}")
+
+        self._thread = threading.Thread(target=run, name="idle-call-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Gauges for active/tracked calls and counters for evictions"""
+        with self._lock:
+            metrics = {
+                "tracked_calls": len(self._tracked),
+                "heap_entries": len(self._heap),
+                "evicted_total": self.evicted_total,
+                "rescheduled_total": self.rescheduled_total,
+                "expire_hook_errors": self.hook_errors,
+            }
+        return {"active_calls": len(self.state_machine.sessions), **metrics}
@@ -0,0 +1,168 @@
+"""
+Sharded Active-Call Registry
+
+Thread-safe replacement for the `active_calls` dict in VoiceAgentStateMachine.
+
+- Calls are spread over N shards by hash(call_id); each shard has its own
+  lock, so registering/removing calls on different shards never contends
+- `lock(call_id)` gives a per-call re-entrant lock: turns for one call are
+  processed one at a time and in arrival order per thread, while different
+  calls run in parallel
+- Per-shard counters record how often call locks were contended and how
+  long threads waited for them
+
+The registry is a MutableMapping, so existing `call_id in active_calls`,
+`active_calls.get(call_id)` and `del active_calls[call_id]` code keeps working.
+"""
+
+import threading
+import time
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List
+
+from .call_flows import CallContext
+
+
+DEFAULT_SHARDS = 16
+
+
+@dataclass
+class LockMetrics:
+    """Call-lock contention counters (per shard, summed by CallRegistry.get_metrics)"""
+    acquisitions: int = 0
+    contended: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def add(self, other: "LockMetrics"):
+        self.acquisitions += other.acquisitions
+        self.contended += other.contended
+        self.wait_seconds += other.wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, other.max_wait_seconds)
+
+
+class _CallLock:
+    """Per-call re-entrant lock plus the number of threads using it"""
+    __slots__ = ("rlock", "users")
+
+    def __init__(self):
+        self.rlock = threading.RLock()
+        self.users = 0
+
+
+class _Shard:
+    __slots__ = ("lock", "calls", "call_locks", "metrics")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls: Dict[str, CallContext] = {}
+        self.call_locks: Dict[str, _CallLock] = {}
+        self.metrics = LockMetrics()
+
+
+class CallRegistry(MutableMapping):
+    """Sharded call_id -> CallContext map with per-call locks"""
+
+    def __init__(self, shards: int = DEFAULT_SHARDS):
+        """
+        Args:
+            shards: Number of independently locked shards
+        """
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self._shards: List[_Shard] = [_Shard() for _ in range(shards)]
+
+    def _shard(self, call_id: str) -> _Shard:
+        return self._shards[hash(call_id) % len(self._shards)]
+
+    # MutableMapping interface
+
+    def __getitem__(self, call_id: str) -> CallContext:
+        return self._shard(call_id).calls[call_id]
+
+    def __setitem__(self, call_id: str, context: CallContext):
+        shard = self._shard(call_id)
+        with shard.lock:
+            shard.calls[call_id] = context
+
+    def __delitem__(self, call_id: str):
+        shard = self._shard(call_id)
+        with shard.lock:
+            del shard.calls[call_id]
+            lock = shard.call_locks.get(call_id)
+            if lock is not None and lock.users == 0:
+                del shard.call_locks[call_id]
+
+    def __contains__(self, call_id: object) -> bool:
+        return call_id in self._shard(call_id).calls
+
+    def __iter__(self) -> Iterator[str]:
+        # Snapshot so callers can iterate while other threads add/remove calls
+        keys: List[str] = []
+        for shard in self._shards:
+            with shard.lock:
+                keys.extend(shard.calls)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return sum(len(shard.calls) for shard in self._shards)
+
+    def get(self, call_id: str, default: Any = None) -> Any:
+        return self._shard(call_id).calls.get(call_id, default)
+
+    # Per-call locking
+
+    @contextmanager
+    def lock(self, call_id: str) -> Iterator[None]:
+        """
+        Hold the call's lock (re-entrant) for the duration of the block
+
+        Locks exist for unregistered call ids too, so "start call if new, then
+        process" can be done atomically.
+        """
+        shard = self._shard(call_id)
+        with shard.lock:
+            call_lock = shard.call_locks.get(call_id)
+            if call_lock is None:
+                call_lock = shard.call_locks[call_id] = _CallLock()
+            call_lock.users += 1
+
+        waited = None
+        if not call_lock.rlock.acquire(blocking=False):
+            start = time.perf_counter()
+            call_lock.rlock.acquire()
+            waited = time.perf_counter() - start
+
+        try:
+            yield
+        finally:
+            call_lock.rlock.release()
+            with shard.lock:
+                metrics = shard.metrics
+                metrics.acquisitions += 1
+                if waited is not None:
+                    metrics.contended += 1
+                    metrics.wait_seconds += waited
+                    if waited > metrics.max_wait_seconds:
+                        metrics.max_wait_seconds = waited
+                call_lock.users -= 1
+                if call_lock.users == 0 and call_id not in shard.calls:
+                    shard.call_locks.pop(call_id, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Active call count and call-lock contention across all shards"""
+        totals = LockMetrics()
+        for shard in self._shards:
+            with shard.lock:
+                totals.add(shard.metrics)
+        return {
+            "active_calls": len(self),
+            "shards": len(self._shards),
+            "lock_acquisitions": totals.acquisitions,
+            "lock_contended": totals.contended,
+            "lock_contention_rate": totals.contended / totals.acquisitions if totals.acquisitions else 0.0,
+            "lock_wait_seconds": round(totals.wait_seconds, 6),
+            "max_lock_wait_seconds": round(totals.max_wait_seconds, 6),
+        }
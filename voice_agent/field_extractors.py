@@ -0,0 +1,200 @@
+"""
+Field extractors for call flows
+
+Each collected field can have an extractor that pulls the value (or the
+relevant span) out of the caller's response, so flows store "legal" or
+"tomorrow 9-11am" instead of the whole utterance in every field of a state.
+Flows look their extractors up once, when they are compiled (see
+CallFlow.compile); a field without an extractor, or whose extractor finds
+nothing, gets the raw response only if it is required for that state.
+
+    @field_extractor("po_number")
+    def extract_po_number(text: str) -> Optional[str]:
+        ...
+
+Extractors registered after a flow was compiled apply once the flow is
+(re-)registered; flows can also override extractors per class through
+CallFlow.FIELD_EXTRACTORS.
+"""
+
+import re
+from typing import Callable, Dict, Mapping, Optional
+
+from .intent_detector import EMAIL_REGEX, PHONE_REGEX, IntentDetector
+from .keyword_matcher import compile_keywords
+
+
+FieldExtractor = Callable[[str], Optional[str]]
+
+# Process-wide field name -> extractor
+FIELD_EXTRACTORS: Dict[str, FieldExtractor] = {}
+
+
+def register_field_extractor(field: str, extractor: FieldExtractor) -> FieldExtractor:
+    """
+    Register (or replace) the extractor for a field
+
+    Args:
+        field: collected_data key
+        extractor: Called with the raw response; returns the value or None
+
+    Returns:
+        The extractor
+    """
+    FIELD_EXTRACTORS[field] = extractor
+    return extractor
+
+
+def field_extractor(*fields: str) -> Callable[[FieldExtractor], FieldExtractor]:
+    """Decorator registering an extractor for one or more fields"""
+    def decorator(extractor: FieldExtractor) -> FieldExtractor:
+        for field in fields:
+            register_field_extractor(field, extractor)
+        return extractor
+    return decorator
+
+
+def get_field_extractors() -> Mapping[str, FieldExtractor]:
+    """Snapshot of the registered extractors"""
+    return dict(FIELD_EXTRACTORS)
+
+
+CITY_PATTERN = re.compile(r"\b(i'm in|im in|in|at)\s+([A-Za-z]+(?:\s[A-Za-z]+)*)")
+# time range like 9-11am / 9–11am / 9 to 11
+CALLBACK_WINDOW_PATTERN = re.compile(
+    r"(tomorrow\s*)?\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*(?:-|–|to)\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
+    re.IGNORECASE
+)
+TIMELINE_PATTERN = re.compile(
+    r"\b(right away|asap|immediately|today|tonight|tomorrow|"
+    r"(?:this|next) (?:week|month|quarter|year)|"
+    r"in (?:a|one|two|three|four|six|a few|a couple(?: of)?|\d+) (?:days?|weeks?|months?)|"
+    r"(?:january|february|march|april|may|june|july|august|september|october|november|december)|"
+    r"not (?:any ?time )?soon|someday|eventually)\b",
+    re.IGNORECASE
+)
+STAKEHOLDER_PATTERN = re.compile(
+    r"\b(?:my|our) (?:business )?(?:partners?|co-?founders?|boss|manager|office manager|wife|husband|spouse|board|accountant)\b",
+    re.IGNORECASE
+)
+NO_STAKEHOLDERS_PATTERN = re.compile(r"\b(no ?one|nobody|just me|only me|no one else)\b", re.IGNORECASE)
+NAME_PATTERN = re.compile(
+    r"\b(?:[Mm]y name is|[Nn]ame[’']s|[Tt]his is|[Ii]t[’']s|I[’']m|I am)\s+([A-Z][a-z'-]+(?:\s[A-Z][a-z'-]+)?)"
+)
+
+# Checked in order: an explicit "no" wins over a "yes" phrase
+TEXT_OK_MATCHER = compile_keywords({
+    "no": ["no text", "dont text", "don't text", "do not text", "no sms", "no texting", "no texts"],
+    "yes": ["texting is fine", "text is fine", "you can text", "text ok", "text okay", "sms is fine",
+            "yes, texting", "yes texting"],
+})
+DECISION_MAKER_MATCHER = compile_keywords({
+    "no": [r"\bnot (?:me|the decision|really)\b", r"\b(?:have|need) to (?:ask|check with)\b",
+           r"\bmy (?:boss|manager|partner) (?:decides|makes)\b", r"^\s*no\b(?! problem)", r"\bnope\b"],
+    "yes": [r"\bi(?:'m| am) the (?:owner|decision|one who|founder|ceo|president)",
+            r"\bi (?:own|run) (?:it|the)\b", r"\bi (?:make|handle) (?:the|those|all)\b", r"\bi decide\b",
+            r"\bmanaging partner\b", r"\bthat(?:'s| is) me\b", r"\b(?:yes|yeah|yep|yup|correct)\b"],
+}, regex=True)
+CONFIRMATION_MATCHER = compile_keywords({
+    "no": [r"^\s*no\b(?! problem)", r"\b(?:nope|not really|doesn't work|does not work)\b"],
+    "yes": [r"\b(?:yes|yeah|yep|yup|sure|sounds good|works|perfect|great|ok|okay)\b"],
+}, regex=True)
+CONTACT_METHOD_MATCHER = compile_keywords({
+    "email": [r"\be-?mail\b"],
+    "text": [r"\b(?:text|sms)\b"],
+    "phone": [r"\b(?:call|phone)\b"],
+}, regex=True)
+CUSTOMERS_MATCHER = compile_keywords({
+    "commercial": [r"\b(?:commercial|businesses|companies|offices|b2b)\b"],
+    "residential": [r"\b(?:residential|homeowners?|families|individuals|consumers|patients|clients)\b"],
+}, regex=True)
+SIZE_MATCHER = compile_keywords(IntentDetector.SIZE_PATTERNS, regex=True)
+INDUSTRY_MATCHER = compile_keywords(IntentDetector.INDUSTRY_KEYWORDS)
+
+
+def _lower(text: str) -> str:
+    """Lowercase with typographic apostrophes (speech-to-text output) made plain"""
+    return text.lower().replace("\u2019", "'")
+
+
+@field_extractor("email")
+def extract_email(text: str) -> Optional[str]:
+    match = EMAIL_REGEX.search(text) if "@" in text else None
+    return match.group() if match else None
+
+
+@field_extractor("phone")
+def extract_phone(text: str) -> Optional[str]:
+    match = PHONE_REGEX.search(text)
+    return match.group() if match else None
+
+
+@field_extractor("industry")
+def extract_industry(text: str) -> Optional[str]:
+    return INDUSTRY_MATCHER.category(_lower(text))
+
+
+@field_extractor("size")
+def extract_size(text: str) -> Optional[str]:
+    return SIZE_MATCHER.category(_lower(text))
+
+
+@field_extractor("customers")
+def extract_customers(text: str) -> Optional[str]:
+    return CUSTOMERS_MATCHER.category(_lower(text))
+
+
+@field_extractor("is_decision_maker")
+def extract_decision_maker(text: str) -> Optional[str]:
+    return DECISION_MAKER_MATCHER.category(_lower(text))
+
+
+@field_extractor("other_stakeholders")
+def extract_stakeholders(text: str) -> Optional[str]:
+    match = STAKEHOLDER_PATTERN.search(text)
+    if match:
+        return match.group()
+    return "none" if NO_STAKEHOLDERS_PATTERN.search(text) else None
+
+
+@field_extractor("timeline")
+def extract_timeline(text: str) -> Optional[str]:
+    match = TIMELINE_PATTERN.search(text)
+    return match.group() if match else None
+
+
+@field_extractor("preferred_communication", "preferred_contact")
+def extract_contact_method(text: str) -> Optional[str]:
+    return CONTACT_METHOD_MATCHER.category(_lower(text))
+
+
+@field_extractor("confirmation")
+def extract_confirmation(text: str) -> Optional[str]:
+    return CONFIRMATION_MATCHER.category(_lower(text))
+
+
+@field_extractor("location")
+def extract_city(text: str) -> Optional[str]:
+    match = CITY_PATTERN.search(text)
+    if not match:
+        return None
+    candidate = match.group(2).strip()
+    # keep it short-ish
+    return candidate if 2 <= len(candidate) <= 30 else None
+
+
+@field_extractor("callback_window")
+def extract_callback_window(text: str) -> Optional[str]:
+    match = CALLBACK_WINDOW_PATTERN.search(text)
+    return match.group().strip() if match else None
+
+
+@field_extractor("text_ok")
+def extract_text_ok(text: str) -> Optional[str]:
+    return TEXT_OK_MATCHER.category(_lower(text))
+
+
+@field_extractor("contact_name")
+def extract_contact_name(text: str) -> Optional[str]:
+    match = NAME_PATTERN.search(text)
+    return match.group(1) if match else None
@@ -5,10 +5,40 @@ Detects user intent from speech/text input using rule-based patterns.
 In production, this would integrate with NLP services (OpenAI, etc.)
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
+import json
+import logging
+import os
 import re
 
+from .keyword_matcher import compile_keywords
+from .session_log import SessionLogReader
+
+
+logger = logging.getLogger(__name__)
+
+# Where simulate_call.run_simulation saves session transcripts
+TRANSCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "out")
+
+EMAIL_REGEX = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_REGEX = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+
+# Default number of distinct utterances memoized per IntentDetector
+DEFAULT_CACHE_SIZE = 4096
+
+# Confidence reported per extracted entity type (rule-based, so fixed per rule)
+ENTITY_CONFIDENCE = {
+    'email': 0.95,
+    'phone': 0.9,
+    'business_size': 0.7,
+    'industry': 0.6
+}
+
 
 class Intent(Enum):
     """Detected user intent"""
@@ -22,6 +52,26 @@ class Intent(Enum):
     UNKNOWN = "unknown"  # Could not determine intent
 
 
+@dataclass(frozen=True)
+class EntityMatch:
+    """Extracted entity value with its span in the input text"""
+    value: str
+    span: Tuple[int, int]
+    confidence: float
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Compile one intent's pattern list into a single alternation
+    
+    Input text is lowercased before matching and the patterns are lowercase,
+    so IGNORECASE (which disables the regex engine's literal prefix scans) is
+    not needed. Cached so every IntentDetector shares the compiled objects.
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
 class IntentDetector:
     """Rule-based intent detection (MVP - can be replaced with NLP)"""
     
@@ -58,6 +108,53 @@ class IntentDetector:
         r"\b(what do you mean|clarify|explain)\b"
     ]
     
+    # (intent, confidence, pattern list attribute) in priority order, most specific first
+    INTENT_PRIORITY = [
+        (Intent.OPT_OUT, 0.9, "OPT_OUT_PATTERNS"),  # respect immediately
+        (Intent.TRANSFER, 0.85, "TRANSFER_PATTERNS"),
+        (Intent.CLARIFICATION, 0.8, "CLARIFICATION_PATTERNS"),
+        (Intent.QUESTION, 0.75, "QUESTION_PATTERNS"),
+        (Intent.AFFIRMATIVE, 0.7, "AFFIRMATIVE_PATTERNS"),
+        (Intent.NEGATIVE, 0.7, "NEGATIVE_PATTERNS"),
+    ]
+    
+    # Business size indicators (regexes, checked in order)
+    SIZE_PATTERNS = {
+        'solo': [r'\b(solo|just me|only me|one person)\b'],
+        'small': [r'\b(\d+[- ]?(employees|people|staff)|small team|few people)\b'],
+        'medium': [r'\b(\d+[- ]?(employees|people|staff)|medium|growing team)\b']
+    }
+    
+    # Industry keywords (substring match, first category wins)
+    INDUSTRY_KEYWORDS = {
+        'legal': ['law', 'attorney', 'lawyer', 'legal', 'law firm'],
+        'healthcare': ['health', 'medical', 'doctor', 'clinic', 'hospital'],
+        'real_estate': ['real estate', 'realtor', 'property', 'realty'],
+        'professional_services': ['consulting', 'consultant', 'advisory', 'services'],
+        'ecommerce': ['ecommerce', 'online store', 'shop', 'retail'],
+        'local_services': ['plumber', 'electrician', 'contractor', 'local']
+    }
+    
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            cache_size: Max distinct utterances memoized for detect() and for
+                extract_entities() (LRU; 0 disables caching)
+        """
+        # Compiled once per pattern set: (intent, confidence, regex) in priority order
+        self._compiled_intents = [
+            (intent, confidence, _compile_patterns(tuple(getattr(self, attr))))
+            for intent, confidence, attr in self.INTENT_PRIORITY
+        ]
+        self._size_matcher = compile_keywords(self.SIZE_PATTERNS, regex=True)
+        self._industry_matcher = compile_keywords(self.INDUSTRY_KEYWORDS)
+        
+        # A few utterances ("yes", "ok", "what?") dominate real calls
+        self.cache_size = cache_size
+        if cache_size > 0:
+            self._detect_normalized = lru_cache(maxsize=cache_size)(self._detect_normalized)
+            self._match_entities = lru_cache(maxsize=cache_size)(self._match_entities)
+    
     def detect(self, text: str, context: Optional[Dict] = None) -> Tuple[Intent, float]:
         """
         Detect intent from text input
@@ -68,34 +165,14 @@ class IntentDetector:
         if not text:
             return Intent.UNKNOWN, 0.0
         
-        text_lower = text.lower().strip()
-        
-        # Check patterns in order of specificity
-        # Most specific first
-        
-        # Opt-out (high priority - respect immediately)
-        if self._match_patterns(text_lower, self.OPT_OUT_PATTERNS):
-            return Intent.OPT_OUT, 0.9
-        
-        # Transfer request
-        if self._match_patterns(text_lower, self.TRANSFER_PATTERNS):
-            return Intent.TRANSFER, 0.85
-        
-        # Clarification needed
-        if self._match_patterns(text_lower, self.CLARIFICATION_PATTERNS):
-            return Intent.CLARIFICATION, 0.8
-        
-        # Question
-        if self._match_patterns(text_lower, self.QUESTION_PATTERNS):
-            return Intent.QUESTION, 0.75
-        
-        # Affirmative
-        if self._match_patterns(text_lower, self.AFFIRMATIVE_PATTERNS):
-            return Intent.AFFIRMATIVE, 0.7
-        
-        # Negative
-        if self._match_patterns(text_lower, self.NEGATIVE_PATTERNS):
-            return Intent.NEGATIVE, 0.7
+        return self._detect_normalized(text.lower().strip())
+    
+    def _detect_normalized(self, text_lower: str) -> Tuple[Intent, float]:
+        """Detect intent from lowercased, stripped text (memoized per instance)"""
+        # Check intents in order of specificity (see INTENT_PRIORITY)
+        for intent, confidence, regex in self._compiled_intents:
+            if regex.search(text_lower):
+                return intent, confidence
         
         # Default: assume continue if we have substantial text
         if len(text_lower) > 10:
@@ -103,59 +180,146 @@ class IntentDetector:
         
         return Intent.UNKNOWN, 0.3
     
-    def _match_patterns(self, text: str, patterns: List[str]) -> bool:
-        """Check if text matches any pattern"""
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
-    
     def extract_entities(self, text: str) -> Dict[str, any]:
         """
         Extract entities from text (business name, industry, etc.)
         MVP: Basic pattern matching
         Production: Use NLP service
         """
+        return {name: match.value for name, match in self._match_entities(text).items()}
+    
+    def extract_entity_matches(self, text: str) -> Dict[str, "EntityMatch"]:
+        """
+        Extract entities with their spans and confidence
+        
+        The text is lowercased once; email and phone are matched on the
+        original text, size and industry each with one compiled keyword
+        matcher on the lowercased text (see keyword_matcher).
+        
+        Args:
+            text: User input text
+            
+        Returns:
+            Dict of entity name -> EntityMatch (first/highest-priority match only)
+        """
+        # Copy so callers can't mutate the memoized result
+        return dict(self._match_entities(text))
+    
+    def _match_entities(self, text: str) -> Dict[str, "EntityMatch"]:
+        """Uncached entity extraction (memoized per instance, keyed on raw text)"""
         entities = {}
         text_lower = text.lower()
         
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            entities['email'] = emails[0]
+        match = EMAIL_REGEX.search(text) if '@' in text else None
+        if match:
+            entities['email'] = EntityMatch(match.group(), match.span(), ENTITY_CONFIDENCE['email'])
         
         # Extract phone number
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        phones = re.findall(phone_pattern, text)
-        if phones:
-            entities['phone'] = phones[0]
+        match = PHONE_REGEX.search(text)
+        if match:
+            entities['phone'] = EntityMatch(match.group(), match.span(), ENTITY_CONFIDENCE['phone'])
         
         # Extract business size indicators
-        size_patterns = {
-            'solo': r'\b(solo|just me|only me|one person)\b',
-            'small': r'\b(\d+[- ]?(employees|people|staff)|small team|few people)\b',
-            'medium': r'\b(\d+[- ]?(employees|people|staff)|medium|growing team)\b'
-        }
-        for size_type, pattern in size_patterns.items():
-            if re.search(pattern, text_lower):
-                entities['business_size'] = size_type
-                break
+        keyword_match = self._size_matcher.find(text_lower)
+        if keyword_match:
+            entities['business_size'] = EntityMatch(
+                keyword_match.category, keyword_match.span, ENTITY_CONFIDENCE['business_size']
+            )
         
         # Extract industry keywords (simplified)
-        industry_keywords = {
-            'legal': ['law', 'attorney', 'lawyer', 'legal', 'law firm'],
-            'healthcare': ['health', 'medical', 'doctor', 'clinic', 'hospital'],
-            'real_estate': ['real estate', 'realtor', 'property', 'realty'],
-            'professional_services': ['consulting', 'consultant', 'advisory', 'services'],
-            'ecommerce': ['ecommerce', 'online store', 'shop', 'retail'],
-            'local_services': ['plumber', 'electrician', 'contractor', 'local']
-        }
-        
-        for industry, keywords in industry_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                entities['industry'] = industry
-                break
+        keyword_match = self._industry_matcher.find(text_lower)
+        if keyword_match:
+            entities['industry'] = EntityMatch(
+                keyword_match.category, keyword_match.span, ENTITY_CONFIDENCE['industry']
+            )
         
         return entities
+    
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters for the detect() and extract_entities() caches"""
+        stats = {}
+        for name, fn in (('detect', self._detect_normalized), ('entities', self._match_entities)):
+            info = fn.cache_info() if hasattr(fn, 'cache_info') else None
+            stats[name] = {
+                'hits': info.hits if info else 0,
+                'misses': info.misses if info else 0,
+                'size': info.currsize if info else 0,
+                'max_size': self.cache_size
+            }
+        return stats
+    
+    def clear_cache(self):
+        """Drop memoized results and reset counters"""
+        for fn in (self._detect_normalized, self._match_entities):
+            if hasattr(fn, 'cache_clear'):
+                fn.cache_clear()
+    
+    def warm_cache(self, utterances: Iterable[str]) -> int:
+        """
+        Pre-populate the caches with historical utterances
+        
+        The most frequent utterances are inserted last so they are the most
+        recently used entries and survive eviction longest.
+        
+        Args:
+            utterances: Caller utterances (e.g. from saved transcripts)
+            
+        Returns:
+            Number of distinct utterances cached
+        """
+        if self.cache_size <= 0:
+            return 0
+        counts = Counter(u for u in utterances if u)
+        warmed = counts.most_common(self.cache_size)
+        for text, _ in reversed(warmed):
+            self.detect(text)
+            self.extract_entities(text)
+        return len(warmed)
+    
+    def warm_from_transcripts(self, directory: Optional[str] = None) -> int:
+        """
+        Pre-populate the caches from sessions saved by simulate_call
+        
+        Args:
+            directory: Directory of session logs (default: voice_agent/out)
+            
+        Returns:
+            Number of distinct utterances cached
+        """
+        return self.warm_cache(load_transcript_utterances(directory))
 
+
+def load_transcript_utterances(directory: Optional[str] = None) -> List[str]:
+    """
+    Collect caller utterances from saved sessions
+    
+    Reads session log segments (see session_log) and legacy one-file-per-call
+    session JSON files.
+    
+    Args:
+        directory: Directory of session logs (default: voice_agent/out)
+        
+    Returns:
+        Caller utterances in file order (unreadable files are skipped)
+    """
+    directory = directory or TRANSCRIPTS_DIR
+    utterances: List[str] = []
+    if not os.path.isdir(directory):
+        return utterances
+    
+    sessions = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                sessions.append(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping transcript {name}: {e}")
+    
+    for session in chain(sessions, SessionLogReader(directory).iter_records()):
+        for turn in session.get('transcript', []) if isinstance(session, dict) else []:
+            if turn.get('speaker') == 'caller' and turn.get('text'):
+                utterances.append(turn['text'])
+    return utterances
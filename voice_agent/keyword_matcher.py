@@ -0,0 +1,180 @@
+"""
+Priority Keyword Matcher
+
+Compiles a `{category: [keywords]}` dictionary (categories in priority order)
+into one regex and finds the highest-priority category present in a text.
+Shared by IntentDetector.extract_entities and LeadProcessor._normalize_industry
+so both match industry keywords the same way.
+
+Semantics match the straightforward loop:
+
+    for category, keywords in mapping.items():
+        if any(keyword in text for keyword in keywords):
+            return category
+
+Literal keywords are merged into a prefix trie and emitted as one group-free
+alternation (`l(?:aw(?: firm|yer)?|egal|ocal)|...`), which lets the regex
+engine skip ahead on first characters (named groups per category would
+disable that). A miss (the common case on a conversational turn) costs one
+search over the text; on a hit the search is repeated over the
+higher-priority categories only, until none of them match.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """Winning category and where its first keyword occurrence was found"""
+    category: str
+    keyword: str
+    span: Tuple[int, int]
+
+
+def _trie_pattern(keywords: Sequence[str]) -> str:
+    """Regex source matching any of the keywords, factored by common prefix"""
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        optional = '' in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return f"(?:{'|'.join(branches)}){'?' if optional else ''}"
+
+    return emit(trie)
+
+
+def compile_alternation(keywords: Sequence[str], whole_words: bool = False) -> "re.Pattern":
+    """
+    One prefix-factored regex matching any of the literal keywords
+
+    Unlike KeywordMatcher (first category wins), use finditer() with this to
+    find every keyword occurrence in one pass. Longer keywords win over their
+    prefixes ("smoke detector" over "smoke").
+
+    Args:
+        keywords: Literal keywords
+        whole_words: Only match at word boundaries
+    """
+    pattern = _trie_pattern(keywords)
+    return re.compile(rf"\b(?:{pattern})\b" if whole_words else pattern)
+
+
+class KeywordMatcher:
+    """Compiled priority matcher for a category → keywords dictionary"""
+
+    def __init__(self, mapping: Mapping[str, Sequence[str]], regex: bool = False):
+        """
+        Args:
+            mapping: Categories in priority order (first wins) with their keywords
+            regex: Treat keywords as regex patterns instead of literal substrings
+        """
+        self.categories: List[str] = list(mapping)
+        self.regex = regex
+
+        if regex:
+            # Per-category patterns identify which category matched at a position
+            self._category_patterns = [
+                re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+                for patterns in mapping.values()
+            ]
+        else:
+            # Keyword -> index of the highest-priority category listing it
+            self._keyword_index: Dict[str, int] = {}
+            for index, keywords in enumerate(mapping.values()):
+                for keyword in keywords:
+                    self._keyword_index.setdefault(keyword, index)
+
+        # _prefixes[k] matches any keyword of categories 0..k-1 (None if there are none)
+        self._prefixes: List[Optional["re.Pattern"]] = []
+        keywords: List[str] = []
+        for category_keywords in [[]] + list(mapping.values()):
+            keywords.extend(category_keywords)
+            if not keywords:
+                self._prefixes.append(None)
+            elif regex:
+                self._prefixes.append(re.compile("|".join(f"(?:{p})" for p in keywords)))
+            else:
+                self._prefixes.append(re.compile(_trie_pattern(keywords)))
+        self._any = self._prefixes[-1]
+
+    def find(self, text: str) -> Optional[KeywordMatch]:
+        """
+        Find the highest-priority category with a keyword in text
+
+        Args:
+            text: Text to search (callers lowercase it; keywords are lowercase)
+
+        Returns:
+            KeywordMatch, or None if no keyword occurs
+        """
+        if self._any is None:
+            return None
+        match = self._any.search(text)
+        if match is None:
+            return None
+
+        while True:
+            index, match = self._categorize(text, match)
+            higher = self._prefixes[index]
+            better = higher.search(text) if higher is not None else None
+            if better is None:
+                return KeywordMatch(self.categories[index], match.group(), match.span())
+            match = better
+
+    def _categorize(self, text: str, match: "re.Match") -> Tuple[int, "re.Match"]:
+        """Highest-priority category matching where `match` starts"""
+        if not self.regex:
+            return self._keyword_index[match.group()], match
+        start = match.start()
+        for index, pattern in enumerate(self._category_patterns):
+            if pattern is not None:
+                category_match = pattern.match(text, start)
+                if category_match:
+                    return index, category_match
+        raise AssertionError("combined pattern matched but no category did")
+
+    def category(self, text: str) -> Optional[str]:
+        """Highest-priority category in text, or None"""
+        match = self.find(text)
+        return match.category if match else None
+
+
+@lru_cache(maxsize=64)
+def _compile_cached(items: Tuple[Tuple[str, Tuple[str, ...]], ...], regex: bool) -> KeywordMatcher:
+    return KeywordMatcher(dict(items), regex=regex)
+
+
+def compile_keywords(mapping: Mapping[str, Sequence[str]], regex: bool = False) -> KeywordMatcher:
+    """
+    Get the shared compiled matcher for a keyword dictionary
+
+    Matchers are cached by content, so every caller passing an equal
+    dictionary gets the same compiled object.
+
+    Args:
+        mapping: Categories in priority order with their keywords
+        regex: Treat keywords as regex patterns instead of literal substrings
+    """
+    items = tuple((category, tuple(keywords)) for category, keywords in mapping.items())
+    return _compile_cached(items, regex)
+
+
+def match_keywords_reference(mapping: Mapping[str, Sequence[str]], text: str) -> Optional[str]:
+    """Plain-loop equivalent of KeywordMatcher.category (for tests and benchmarks)"""
+    for category, keywords in mapping.items():
+        if any(keyword in text for keyword in keywords):
+            return category
+    return None
+
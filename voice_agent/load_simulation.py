@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Load simulation for the voice agent
+
+Runs many scripted or randomized conversations concurrently through
+AsyncVoiceAgent with Poisson call arrivals, no console output per call, and
+one session log (SessionLogWriter) for the whole run. Reports per-turn latency
+(histogram + percentiles), throughput and memory. Owner summaries are not
+rendered on the call path; `--summarize` renders them afterwards as a batch
+stage (owner_summary.summarize_sessions).
+
+Scenario corpus (NDJSON, one scenario per line):
+    {"name": "missed_call", "call_type": "missed", "weight": 4,
+     "utterances": ["fixed line", ["alternative 1", "alternative 2"], ...]}
+
+A list in `utterances` is a slot: each call picks one alternative at random.
+
+Usage:
+    python -m voice_agent.load_simulation --calls 5000 --rate 500
+    python -m voice_agent.load_simulation --corpus my_scenarios.ndjson --think-ms 0 --compress
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import random
+import time
+import tracemalloc
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from voice_agent.async_support import AsyncVoiceAgent
+from voice_agent.call_flows import CallType
+from voice_agent.owner_summary import summarize_sessions
+from voice_agent.session_log import SESSION_LOG_DIR, SessionLogReader, SessionLogWriter
+from voice_agent.simulate_call import SESSION_KEY, build_session
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "load_scenarios.ndjson")
+
+# Upper bounds of the latency histogram buckets (ms); the last bucket is open-ended
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+
+class Scenario(NamedTuple):
+    """One corpus entry"""
+    name: str
+    call_type: CallType
+    utterances: List[Union[str, List[str]]]
+    weight: float = 1.0
+
+    def script(self, rng: random.Random) -> List[str]:
+        """Caller lines for one call (one random pick per slot)"""
+        return [rng.choice(line) if isinstance(line, list) else line for line in self.utterances]
+
+
+def load_corpus(path: str = DEFAULT_CORPUS) -> List[Scenario]:
+    """
+    Read a scenario corpus
+
+    Args:
+        path: NDJSON file (see module docstring)
+
+    Returns:
+        List of Scenario
+    """
+    scenarios = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            scenarios.append(Scenario(
+                name=entry["name"],
+                call_type=CallType(entry["call_type"]),
+                utterances=entry["utterances"],
+                weight=float(entry.get("weight", 1.0)),
+            ))
+    if not scenarios:
+        raise ValueError(f"Scenario corpus {path} is empty")
+    return scenarios
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram that also keeps samples for exact percentiles"""
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.samples: List[float] = []
+
+    def record(self, value_ms: float):
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.samples.append(value_ms)
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    def buckets(self) -> Dict[str, int]:
+        """Bucket label ("<=1.0ms", ..., ">1000.0ms") -> count"""
+        labels = [f"<={bound}ms" for bound in self.bounds] + [f">{self.bounds[-1]}ms"]
+        return dict(zip(labels, self.counts))
+
+
+class LoadSimulation:
+    """Drives concurrent simulated calls through one AsyncVoiceAgent"""
+
+    def __init__(
+        self,
+        scenarios: Sequence[Scenario],
+        arrival_rate: float = 200.0,
+        think_ms: float = 20.0,
+        seed: int = 42,
+        session_log: Optional[SessionLogWriter] = None,
+        agent: Optional[AsyncVoiceAgent] = None,
+        run_id: Optional[str] = None
+    ):
+        """
+        Args:
+            scenarios: Corpus to sample calls from (by weight)
+            arrival_rate: Mean call arrivals per second (Poisson)
+            think_ms: Max random caller think time before each turn
+            seed: RNG seed for arrivals, scenario picks and think times
+            session_log: Writer for session records (None = no log)
+            agent: Agent to drive (default: a new AsyncVoiceAgent)
+            run_id: Call id prefix, so runs logging to one directory don't
+                share call ids (default: random)
+        """
+        self.scenarios = list(scenarios)
+        self.weights = [scenario.weight for scenario in self.scenarios]
+        self.arrival_rate = arrival_rate
+        self.think_ms = think_ms
+        self.rng = random.Random(seed)
+        self.session_log = session_log
+        self.agent = agent or AsyncVoiceAgent()
+        self.run_id = run_id or uuid.uuid4().hex[:8]
+        self.latency = LatencyHistogram()
+        self.calls_completed = 0
+        self.active_calls = 0
+        self.peak_active_calls = 0
+
+    async def _run_call(self, index: int, scenario: Scenario, script: List[str]):
+        call_id = f"LOAD-{self.run_id}-{index:07d}"
+        caller_phone = f"+1949555{index % 10000:04d}"
+        context = await self.agent.start_call_async(call_id, scenario.call_type, {"contact_phone": caller_phone})
+        flow = self.agent.state_machine.get_flow(scenario.call_type)
+        transcript = [{"speaker": "agent", "text": flow.get_next_prompt(context.current_state, context)}]
+        last_result: Dict[str, Any] = {}
+        latencies = []
+
+        for caller_text in script:
+            if self.think_ms:
+                await asyncio.sleep(self.rng.uniform(0, self.think_ms) / 1000)
+            start = time.perf_counter()
+            result = await self.agent.process_user_input_async(call_id, caller_text)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.latency.record(elapsed_ms)
+            latencies.append(round(elapsed_ms, 3))
+            last_result = result
+            transcript.append({"speaker": "caller", "text": caller_text})
+            transcript.append({"speaker": "agent", "text": result.get("prompt", "")})
+            if result.get("should_end") or result.get("should_transfer"):
+                break
+
+        await self.agent.end_call_async(call_id)
+        if self.session_log is not None:
+            session = build_session(
+                scenario.name, scenario.call_type, call_id, caller_phone, transcript, last_result, summarize=False
+            )
+            session["turn_latency_ms"] = latencies
+            # A blocking put would stall every call on the event loop while the
+            # writer catches up; drop the record instead and report it
+            self.session_log.write(session, block=False)
+
+    async def _tracked_call(self, index: int, scenario: Scenario, script: List[str]):
+        self.active_calls += 1
+        self.peak_active_calls = max(self.peak_active_calls, self.active_calls)
+        try:
+            await self._run_call(index, scenario, script)
+        finally:
+            self.active_calls -= 1
+            self.calls_completed += 1
+
+    async def run(self, calls: int) -> Dict[str, Any]:
+        """
+        Start `calls` calls with Poisson arrivals and wait for all of them
+
+        Returns:
+            Report dict (see report())
+        """
+        tasks = []
+        start = time.perf_counter()
+        for index in range(calls):
+            scenario = self.rng.choices(self.scenarios, self.weights)[0]
+            tasks.append(asyncio.ensure_future(self._tracked_call(index, scenario, scenario.script(self.rng))))
+            if self.arrival_rate > 0:
+                await asyncio.sleep(self.rng.expovariate(self.arrival_rate))
+        await asyncio.gather(*tasks)
+        return self.report(time.perf_counter() - start)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        turns = len(self.latency.samples)
+        return {
+            "calls": self.calls_completed,
+            "turns": turns,
+            "elapsed_s": round(elapsed, 3),
+            "calls_per_sec": round(self.calls_completed / elapsed, 1) if elapsed > 0 else 0.0,
+            "turns_per_sec": round(turns / elapsed, 1) if elapsed > 0 else 0.0,
+            "peak_active_calls": self.peak_active_calls,
+            "turn_latency_p50_ms": round(self.latency.percentile(0.50), 3),
+            "turn_latency_p99_ms": round(self.latency.percentile(0.99), 3),
+            "turn_latency_max_ms": round(max(self.latency.samples, default=0.0), 3),
+            "turn_latency_histogram": self.latency.buckets(),
+        }
+
+
+def run_load_simulation(
+    calls: int = 1000,
+    arrival_rate: float = 200.0,
+    think_ms: float = 20.0,
+    corpus: str = DEFAULT_CORPUS,
+    log_dir: Optional[str] = None,
+    compress: bool = False,
+    trace_memory: bool = False,
+    seed: int = 42,
+    summary_workers: int = 0
+) -> Dict[str, Any]:
+    """
+    Run a load simulation
+
+    Args:
+        calls: Total calls to simulate
+        arrival_rate: Mean call arrivals per second (0 = start all at once)
+        think_ms: Max random caller think time before each turn
+        corpus: Scenario corpus path
+        log_dir: Session log directory (None = don't log sessions)
+        compress: Gzip closed session log segments
+        trace_memory: Measure Python heap peak with tracemalloc (slows turns down)
+        seed: RNG seed
+        summary_workers: Render owner summaries for this run's sessions afterwards
+            with this many processes (0 = skip)
+
+    Returns:
+        Report dict with throughput, latency percentiles/histogram and memory
+    """
+    scenarios = load_corpus(corpus)
+    session_log = None
+    if log_dir:
+        session_log = SessionLogWriter(log_dir, prefix="load", key=SESSION_KEY, compress=compress)
+    if trace_memory:
+        tracemalloc.start()
+    agent = AsyncVoiceAgent()
+    try:
+        simulation = LoadSimulation(scenarios, arrival_rate, think_ms, seed, session_log, agent)
+        report = asyncio.run(simulation.run(calls))
+        if trace_memory:
+            report["heap_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        agent.close()
+        if session_log is not None:
+            session_log.close()
+
+    if resource is not None:
+        # ru_maxrss is KiB on Linux
+        report["max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    report["session_log_segments"] = session_log.segments if session_log is not None else []
+    report["session_log_dropped"] = session_log.records_dropped if session_log is not None else 0
+    if session_log is not None and summary_workers > 0:
+        start = time.perf_counter()
+        sessions = SessionLogReader(log_dir, key=SESSION_KEY).iter_records(session_log.segments)
+        report["owner_summaries"] = sum(1 for _ in summarize_sessions(sessions, workers=summary_workers))
+        report["owner_summary_s"] = round(time.perf_counter() - start, 3)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent call load simulation")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=200.0, help="Mean call arrivals per second (0 = all at once)")
+    parser.add_argument("--think-ms", type=float, default=20.0, help="Max caller think time per turn")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Scenario corpus (NDJSON)")
+    parser.add_argument("--log-dir", help="Session log directory (default: SESSION_LOG_DIR)")
+    parser.add_argument("--compress", action="store_true", help="Gzip closed session log segments")
+    parser.add_argument("--no-log", action="store_true", help="Don't write session logs")
+    parser.add_argument("--trace-memory", action="store_true", help="Report Python heap peak (tracemalloc)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--summarize", type=int, default=0, metavar="WORKERS",
+                        help="Render owner summaries after the run with this many processes")
+    args = parser.parse_args()
+
+    log_dir = None if args.no_log else (args.log_dir or SESSION_LOG_DIR)
+
+    report = run_load_simulation(
+        args.calls, args.rate, args.think_ms, args.corpus, log_dir, args.compress, args.trace_memory, args.seed, args.summarize
+    )
+    histogram = report.pop("turn_latency_histogram")
+    for key, value in report.items():
+        print(f"{key}: {value}")
+    print("turn latency histogram:")
+    for label, count in histogram.items():
+        if count:
+            print(f"  {label:>10} {count}")
+
+
+if __name__ == "__main__":
+    main()
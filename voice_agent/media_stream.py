@@ -0,0 +1,501 @@
+"""
+Twilio Media Streams Server
+
+Real-time alternative to the webhook + `<Gather>` loop: Twilio opens a
+WebSocket (`<Connect><Stream url="wss://.../media"/></Connect>`) and streams
+the caller's audio as base64 8 kHz mu-law frames. This server
+
+- accepts the WebSocket with a small stdlib (asyncio) RFC 6455
+  implementation, no web framework needed
+- feeds each frame to a pluggable SpeechToText; partial transcripts go
+  through StreamingTurnProcessor, so decisive turns are answered before
+  the caller stops talking, and final transcripts complete the turn
+- drives VoiceAgentStateMachine through an AsyncVoiceAgent (state machine
+  calls run inline on the event loop with the in-memory store and in the
+  agent's pool otherwise, see async_support; so does prompt synthesis)
+  and streams the prompt audio back as media
+  messages followed by a `turn-<n>` mark; a `hangup` or `transfer` mark
+  follows the last prompt of a call
+- records per-turn latency from the frame that completed the transcript to
+  the first audio frame sent back
+
+ScriptedSpeechToText is an offline stub for tests and load runs: energy
+endpointing on the real frames, words taken from a script (by default the
+`script` custom parameter of the stream, utterances separated by "|").
+
+Usage:
+    python -m voice_agent.media_stream --port 8765
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import statistics
+import struct
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .async_support import AsyncVoiceAgent
+from .call_flows import CallType
+from .prompt_audio import DEFAULT_VOICE, OfflineTTSBackend, PromptAudioCache, TTSBackend, mulaw_payload
+from .state_machine import VoiceAgentStateMachine
+from .streaming import StreamingTurnProcessor
+
+
+logger = logging.getLogger(__name__)
+
+# 20 ms of 8 kHz mu-law, the frame size Twilio sends
+FRAME_BYTES = 160
+MULAW_SILENCE = (0xFF, 0x7F)
+# Outbound audio is sent in 1 s chunks
+OUTBOUND_CHUNK_BYTES = 8000
+# Text messages larger than this close the connection
+MAX_MESSAGE_BYTES = 1 << 20
+# Synthesized prompt payloads kept in memory per server
+MAX_CACHED_PAYLOADS = 256
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+# Close code for messages that aren't valid Twilio media stream events
+CLOSE_INVALID_DATA = 1007
+
+
+class WebSocketError(Exception):
+    """Raised on a failed handshake or a protocol violation"""
+    pass
+
+
+def accept_key(key: str) -> str:
+    """Sec-WebSocket-Accept value for a client's Sec-WebSocket-Key"""
+    return base64.b64encode(hashlib.sha1((key + _WS_GUID).encode("ascii")).digest()).decode("ascii")
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    if not payload:
+        return payload
+    n = len(payload)
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bool = False) -> bytes:
+    """Encode one final frame (clients must mask, servers must not)"""
+    n = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, n)
+    if mask:
+        key = os.urandom(4)
+        return header + key + _apply_mask(payload, key)
+    return header + payload
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Tuple[str, Dict[str, str]]:
+    raw = await reader.readuntil(b"\r\n\r\n")
+    lines = raw.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+class WebSocket:
+    """Minimal RFC 6455 connection over asyncio streams (text messages)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, client: bool = False):
+        self.reader = reader
+        self.writer = writer
+        self.client = client
+        self.closed = False
+
+    @classmethod
+    async def accept(cls, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Tuple["WebSocket", str]:
+        """Server side handshake; returns the connection and the request path"""
+        request_line, headers = await _read_headers(reader)
+        parts = request_line.split()
+        key = headers.get("sec-websocket-key")
+        if len(parts) < 2 or headers.get("upgrade", "").lower() != "websocket" or not key:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            raise WebSocketError(f"not a WebSocket upgrade: {request_line!r}")
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+        ).encode("ascii"))
+        await writer.drain()
+        return cls(reader, writer), parts[1]
+
+    @classmethod
+    async def connect(cls, host: str, port: int, path: str = "/") -> "WebSocket":
+        """Client side handshake (used by tests and the fake media client)"""
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        writer.write((
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        ).encode("ascii"))
+        await writer.drain()
+        status_line, headers = await _read_headers(reader)
+        if status_line.split()[1:2] != ["101"] or headers.get("sec-websocket-accept") != accept_key(key):
+            writer.close()
+            raise WebSocketError(f"handshake failed: {status_line!r}")
+        return cls(reader, writer, client=True)
+
+    async def _read_frame(self) -> Tuple[bool, int, bytes]:
+        first, second = await self.reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", await self.reader.readexactly(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", await self.reader.readexactly(8))[0]
+        if length > MAX_MESSAGE_BYTES:
+            raise WebSocketError(f"frame of {length} bytes exceeds limit")
+        mask = await self.reader.readexactly(4) if second & 0x80 else None
+        payload = await self.reader.readexactly(length)
+        if mask is not None:
+            payload = _apply_mask(payload, mask)
+        return bool(first & 0x80), first & 0x0F, payload
+
+    async def recv(self) -> Optional[str]:
+        """Next text message, or None once the connection is closed"""
+        fragments: List[bytes] = []
+        while not self.closed:
+            try:
+                fin, opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.closed = True
+                return None
+            if opcode == OP_PING:
+                await self._send_frame(OP_PONG, payload)
+            elif opcode == OP_CLOSE:
+                await self.close()
+                return None
+            elif opcode in (OP_TEXT, OP_BINARY, OP_CONTINUATION):
+                fragments.append(payload)
+                if sum(len(f) for f in fragments) > MAX_MESSAGE_BYTES:
+                    raise WebSocketError("message exceeds limit")
+                if fin:
+                    return b"".join(fragments).decode("utf-8")
+        return None
+
+    async def _send_frame(self, opcode: int, payload: bytes):
+        if self.closed:
+            raise ConnectionError("WebSocket is closed")
+        self.writer.write(encode_frame(opcode, payload, mask=self.client))
+        await self.writer.drain()
+
+    async def send(self, message: str):
+        """Send a text message"""
+        await self._send_frame(OP_TEXT, message.encode("utf-8"))
+
+    async def send_json(self, data: Dict[str, Any]):
+        await self.send(json.dumps(data, separators=(",", ":")))
+
+    async def close(self, code: int = 1000):
+        """Send a close frame (if still open) and close the transport"""
+        if not self.closed:
+            try:
+                await self._send_frame(OP_CLOSE, struct.pack("!H", code))
+            except ConnectionError:
+                pass
+            self.closed = True
+        self.writer.close()
+
+
+def is_voiced(frame: bytes) -> bool:
+    """Energy check for one mu-law frame: mostly non-silence bytes"""
+    return frame.count(MULAW_SILENCE[0]) + frame.count(MULAW_SILENCE[1]) < len(frame) // 2
+
+
+class Transcript(NamedTuple):
+    """Speech recognition output; partials are replaced by later ones"""
+    text: str
+    is_final: bool
+
+
+class SpeechToText:
+    """Interface for streaming speech recognizers (one instance per call)"""
+
+    def accept(self, frame: bytes) -> List[Transcript]:
+        """Consume one audio frame; return any transcripts it completed"""
+        raise NotImplementedError
+
+
+# Stub timing: a word per 300 ms of speech, end of utterance after 500 ms of silence
+FRAMES_PER_WORD = 15
+ENDPOINT_FRAMES = 25
+
+
+class ScriptedSpeechToText(SpeechToText):
+    """Offline stub: real energy endpointing, words taken from a script"""
+
+    def __init__(
+        self,
+        utterances: Sequence[str],
+        frames_per_word: int = FRAMES_PER_WORD,
+        endpoint_frames: int = ENDPOINT_FRAMES
+    ):
+        self._utterances: Deque[str] = deque(u for u in utterances if u)
+        self.frames_per_word = frames_per_word
+        self.endpoint_frames = endpoint_frames
+        self._voiced = 0
+        self._silent = 0
+
+    def accept(self, frame: bytes) -> List[Transcript]:
+        if not self._utterances:
+            return []
+        words = self._utterances[0].split()
+        if is_voiced(frame):
+            self._voiced += 1
+            self._silent = 0
+            if self._voiced % self.frames_per_word == 0:
+                spoken = min(self._voiced // self.frames_per_word, len(words))
+                return [Transcript(" ".join(words[:spoken]), False)]
+            return []
+        if self._voiced == 0:
+            return []
+        self._silent += 1
+        if self._silent < self.endpoint_frames:
+            return []
+        self._voiced = self._silent = 0
+        return [Transcript(self._utterances.popleft(), True)]
+
+
+def scripted_stt_from_parameters(start: Dict[str, Any]) -> SpeechToText:
+    """Default STT factory: ScriptedSpeechToText from the `script` custom parameter"""
+    script = start.get("customParameters", {}).get("script", "")
+    return ScriptedSpeechToText(script.split("|"))
+
+
+def _object(value: Any, name: str) -> Dict[str, Any]:
+    """value if it is a JSON object, else ValueError (the connection is closed with 1007)"""
+    if not isinstance(value, dict):
+        raise ValueError(f"{name} is not a JSON object")
+    return value
+
+
+class _MediaCall:
+    """Per-connection call state"""
+    __slots__ = ("stream_sid", "call_sid", "stt", "turn", "responded", "ending")
+
+    def __init__(self, stream_sid: str, call_sid: str, stt: SpeechToText):
+        self.stream_sid = stream_sid
+        self.call_sid = call_sid
+        self.stt = stt
+        self.turn = 0
+        self.responded = False  # current caller turn already answered (early commit)
+        self.ending = False
+
+
+class MediaStreamServer:
+    """Asyncio WebSocket server for Twilio Media Streams"""
+
+    def __init__(
+        self,
+        state_machine: Optional[VoiceAgentStateMachine] = None,
+        stt_factory: Callable[[Dict[str, Any]], SpeechToText] = scripted_stt_from_parameters,
+        tts_backend: Optional[TTSBackend] = None,
+        audio_cache: Optional[PromptAudioCache] = None,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        executor: Optional[Executor] = None,
+        offload_turns: Optional[bool] = None
+    ):
+        """
+        Args:
+            state_machine: Shared state machine (default: a new one)
+            stt_factory: Builds a SpeechToText from the stream's start message
+            tts_backend: Synthesizes prompts missing from audio_cache (must produce 8 kHz mu-law WAV)
+            audio_cache: Pre-synthesized prompts (see prompt_audio)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            executor: Pool for prompt synthesis and offloaded state machine calls
+                (default: a dedicated pool, see AsyncVoiceAgent)
+            offload_turns: See AsyncVoiceAgent (default: offload unless the
+                session store is in-memory)
+        """
+        self.state_machine = state_machine or VoiceAgentStateMachine()
+        self.agent = AsyncVoiceAgent(self.state_machine, executor=executor, offload_turns=offload_turns)
+        self.streaming = StreamingTurnProcessor(self.state_machine)
+        self.stt_factory = stt_factory
+        self.tts_backend = tts_backend or (audio_cache.backend if audio_cache else OfflineTTSBackend())
+        self.audio_cache = audio_cache
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._payloads: Dict[str, bytes] = {}
+        self.turn_latencies_ms: Deque[float] = deque(maxlen=10000)
+        self.calls_handled = 0
+
+    async def start(self) -> int:
+        """Start listening; returns the bound port"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Media stream server listening on {self.host}:{self.port}")
+        return self.port
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.agent.close()
+
+    async def serve_forever(self):
+        await self.start()
+        await self._server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        call: Optional[_MediaCall] = None
+        ws: Optional[WebSocket] = None
+        try:
+            ws, _ = await WebSocket.accept(reader, writer)
+            while True:
+                message = await ws.recv()
+                if message is None:
+                    break
+                event = _object(json.loads(message), "message")
+                kind = event.get("event")
+                if kind == "start":
+                    if call is not None:
+                        raise ValueError(f"duplicate start event for call {call.call_sid}")
+                    call = await self._start_call(ws, event)
+                elif kind == "media" and call is not None and not call.ending:
+                    payload = _object(event["media"], "media")["payload"]
+                    if not isinstance(payload, str):
+                        raise ValueError("media.payload is not a string")
+                    frame = base64.b64decode(payload)
+                    received = time.perf_counter()
+                    for transcript in call.stt.accept(frame):
+                        await self._on_transcript(ws, call, transcript, received)
+                elif kind == "stop":
+                    break
+            await ws.close()
+        except (WebSocketError, asyncio.IncompleteReadError, ConnectionError) as e:
+            logger.warning(f"Media stream connection failed: {e}")
+            writer.close()
+        except (ValueError, KeyError) as e:
+            # Bad JSON or base64, a missing or mistyped field, an unknown
+            # call_type, a second start event
+            logger.warning(f"Invalid media stream message, closing connection: {e!r}")
+            if ws is not None:
+                await ws.close(CLOSE_INVALID_DATA)
+            else:
+                writer.close()
+        finally:
+            if call is not None:
+                await self.agent.end_call_async(call.call_sid)
+
+    async def _start_call(self, ws: WebSocket, event: Dict[str, Any]) -> _MediaCall:
+        start = _object(event["start"], "start")
+        params = _object(start.get("customParameters", {}), "start.customParameters")
+        if not isinstance(start["callSid"], str):
+            raise ValueError("start.callSid is not a string")
+        call = _MediaCall(event.get("streamSid") or start["streamSid"], start["callSid"], self.stt_factory(start))
+        call_type = CallType(params.get("call_type", CallType.INBOUND.value))
+        initial_context = {"contact_phone": params["from"]} if params.get("from") else None
+        context = await self.agent.start_call_async(call.call_sid, call_type, initial_context)
+        self.calls_handled += 1
+
+        greeting = self.state_machine.get_flow(call_type).get_next_prompt(context.current_state, context)
+        await self._speak(ws, call, greeting)
+        return call
+
+    async def _on_transcript(self, ws: WebSocket, call: _MediaCall, transcript: Transcript, received: float):
+        if transcript.is_final:
+            result = await self.agent.run_state_machine(self.streaming.finalize, call.call_sid, transcript.text)
+            answered, call.responded = call.responded, False
+            if answered:
+                return
+        else:
+            if call.responded:
+                return
+            result = await self.agent.run_state_machine(self.streaming.feed_partial, call.call_sid, transcript.text)
+            if result is None:
+                return
+            call.responded = True
+
+        await self._speak(ws, call, result["prompt"], received)
+        if result.get("should_end") or result.get("should_transfer"):
+            call.ending = True
+            name = "transfer" if result.get("should_transfer") else "hangup"
+            await ws.send_json({"event": "mark", "streamSid": call.stream_sid, "mark": {"name": name}})
+
+    async def _speak(self, ws: WebSocket, call: _MediaCall, text: str, received: Optional[float] = None):
+        """Stream a prompt's audio, then a turn-<n> mark"""
+        payload = await self._payload(text)
+        for offset in range(0, len(payload), OUTBOUND_CHUNK_BYTES):
+            await ws.send_json({
+                "event": "media",
+                "streamSid": call.stream_sid,
+                "media": {"payload": base64.b64encode(payload[offset:offset + OUTBOUND_CHUNK_BYTES]).decode("ascii")}
+            })
+            if offset == 0 and received is not None:
+                self.turn_latencies_ms.append((time.perf_counter() - received) * 1000)
+        await ws.send_json({"event": "mark", "streamSid": call.stream_sid, "mark": {"name": f"turn-{call.turn}"}})
+        call.turn += 1
+
+    async def _payload(self, text: str) -> bytes:
+        """Raw mu-law audio for a prompt (memory, then audio cache, then TTS)"""
+        payload = self._payloads.get(text)
+        if payload is None:
+            payload = await self.agent.run_blocking(self._load_payload, text)
+            if len(self._payloads) >= MAX_CACHED_PAYLOADS:
+                self._payloads.pop(next(iter(self._payloads)))
+            self._payloads[text] = payload
+        return payload
+
+    def _load_payload(self, text: str) -> bytes:
+        if self.audio_cache is not None:
+            path = self.audio_cache.path(text)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    return mulaw_payload(f.read())
+        voice = self.audio_cache.voice if self.audio_cache is not None else DEFAULT_VOICE
+        return mulaw_payload(self.tts_backend.synthesize(text, voice))
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Calls handled and turn latency percentiles (transcript to first audio frame)"""
+        latencies = sorted(self.turn_latencies_ms)
+        metrics: Dict[str, float] = {"calls_handled": self.calls_handled, "turns": len(latencies)}
+        if latencies:
+            metrics["turn_latency_p50_ms"] = round(statistics.median(latencies), 3)
+            metrics["turn_latency_p99_ms"] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 3)
+        return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Twilio Media Streams server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--prewarm", action="store_true", help="Pre-synthesize static prompts first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    audio_cache = PromptAudioCache()
+    if args.prewarm:
+        audio_cache.prewarm()
+    server = MediaStreamServer(audio_cache=audio_cache, host=args.host, port=args.port)
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
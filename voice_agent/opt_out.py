@@ -0,0 +1,102 @@
+"""
+Opt-out phrase matching
+
+Every opt-out phrase set (explicit opt-outs, outbound greeting declines, ...)
+is compiled into one prefix-factored regex, so a response is scanned once
+no matter how many sets are consulted.
+
+    match = OPT_OUT_MATCHER.match(user_input)
+    if match.explicit:
+        ...
+
+Phrases match as substrings of the lowercased text, like the `phrase in text`
+checks they replace, with one difference: matches don't overlap, so of two
+phrases that share characters in the text ("not interestedon't call", where
+"not interested" and "don't call" share the "d") only the first counts.
+Phrases separated by a space or punctuation are all found.
+"""
+
+from typing import Dict, FrozenSet, Mapping, NamedTuple, Optional, Sequence
+
+from .keyword_matcher import compile_alternation
+
+
+# Phrases that count as an opt-out even where a bare "no" doesn't (e.g. "no AC")
+EXPLICIT_OPT_OUT_PHRASES = (
+    "remove me", "unsubscribe", "stop calling", "do not call",
+    "don't call", "no thanks", "not interested"
+)
+
+# Ways to decline the outbound greeting ("is now a good time?")
+GREETING_DECLINE_PHRASES = (
+    "no thanks", "no thank you", "not now", "call later", "later", "busy",
+    "stop calling", "don't call", "do not call"
+)
+
+# Whole responses that decline the outbound greeting
+SHORT_NO_REPLIES = frozenset(("no", "nah", "nope"))
+
+EXPLICIT = "explicit"
+GREETING_DECLINE = "greeting_decline"
+
+OPT_OUT_PHRASE_SETS: Dict[str, Sequence[str]] = {
+    EXPLICIT: EXPLICIT_OPT_OUT_PHRASES,
+    GREETING_DECLINE: GREETING_DECLINE_PHRASES,
+}
+
+
+class OptOutMatch(NamedTuple):
+    """Opt-out phrases found in one response"""
+    text: str
+    phrase_sets: FrozenSet[str]  # names of the phrase sets with a match
+    phrase: Optional[str]  # first phrase found
+    short_no: bool  # the whole response is a bare "no"
+
+    @property
+    def explicit(self) -> bool:
+        """An explicit opt-out, valid on any call type and in any state"""
+        return EXPLICIT in self.phrase_sets
+
+    @property
+    def declined(self) -> bool:
+        """Declines the outbound greeting"""
+        return self.short_no or GREETING_DECLINE in self.phrase_sets
+
+
+class OptOutMatcher:
+    """Matches every opt-out phrase set in one pass"""
+
+    def __init__(self, phrase_sets: Mapping[str, Sequence[str]] = OPT_OUT_PHRASE_SETS):
+        """
+        Args:
+            phrase_sets: Set name -> phrases (matched as lowercase substrings)
+        """
+        phrase_to_sets: Dict[str, set] = {}
+        for name, phrases in phrase_sets.items():
+            for phrase in phrases:
+                phrase_to_sets.setdefault(phrase.lower(), set()).add(name)
+        # A match consumes its text, so a phrase found inside a longer one
+        # ("later" in "call later") is credited through the longer phrase
+        self._sets: Dict[str, FrozenSet[str]] = {
+            phrase: frozenset().union(*(sets for other, sets in phrase_to_sets.items() if other in phrase))
+            for phrase in phrase_to_sets
+        }
+        self._pattern = compile_alternation(list(self._sets))
+
+    def match(self, text: str) -> OptOutMatch:
+        """
+        Find opt-out phrases in a response
+
+        Args:
+            text: Caller's response
+
+        Returns:
+            OptOutMatch
+        """
+        text_lower = text.lower()
+        found = [m.group() for m in self._pattern.finditer(text_lower)]
+        sets = frozenset().union(*(self._sets[phrase] for phrase in found)) if found else frozenset()
+        return OptOutMatch(text, sets, found[0] if found else None, text_lower.strip() in SHORT_NO_REPLIES)
+
+
+OPT_OUT_MATCHER = OptOutMatcher()
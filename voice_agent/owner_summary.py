@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Owner summaries for finished calls
+
+Normalizes the collected fields of a call and renders the text summary
+sent to the business owner. Patterns are compiled once at import and city
+extraction is cached per unique text (callers often repeat the same phrasing,
+and one call checks up to three fields). `summarize_sessions` renders a
+stream of session records in bulk, optionally on a process pool for large
+backlogs.
+
+Usage:
+    python -m voice_agent.owner_summary --workers 4
+    python -m voice_agent.owner_summary --log-dir /var/log/afterhours --print
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .call_flows import CallType
+from .field_extractors import CALLBACK_WINDOW_PATTERN, TEXT_OK_MATCHER, extract_city
+from .session_log import SESSION_LOG_DIR, SessionLogReader, SessionLogWriter
+
+
+CITY_CACHE_SIZE = 4096
+DEFAULT_CHUNK_SIZE = 256
+
+
+def now_iso() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+@lru_cache(maxsize=CITY_CACHE_SIZE)
+def best_city_from_text(text: str) -> str:
+    if not text:
+        return ""
+    return extract_city(text) or ""
+
+
+def normalize_missed_fields(data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Flows store extracted values, but older sessions (and required fields
+    whose extractor found nothing) hold raw text, so normalize for a clean
+    owner summary.
+    """
+    issue = str(data.get("issue") or "").strip()
+    urgency = str(data.get("urgency") or "").strip()
+
+    # callback window: some versions store it under callback_window; others store the whole response
+    callback_raw = str(
+        data.get("callback_window") or data.get("callback_window_raw") or ""
+    ).strip()
+
+    name = str(data.get("contact_name") or "").strip()
+
+    # location may be blank or polluted; derive from whichever text has "in <city>"
+    location = str(data.get("location") or "").strip()
+    if not location or len(location) > 40:
+        location = best_city_from_text(issue) or best_city_from_text(urgency) or best_city_from_text(callback_raw)
+
+    # If issue is empty, steal from location field (some earlier versions stored it there)
+    if not issue and location and len(location) > 10:
+        issue = location
+
+    # --- Parse callback window compactly ---
+    window = ""
+    if callback_raw:
+        tm = CALLBACK_WINDOW_PATTERN.search(callback_raw.lower())
+        if tm:
+            window = tm.group(0).strip()
+        else:
+            # fallback: first sentence
+            window = callback_raw.split(".")[0].strip()
+
+    # --- Parse text_ok to yes/no ---
+    text_ok = str(data.get("text_ok") or "").strip()
+    if text_ok in ("yes", "no"):
+        text_ok_clean = text_ok
+    else:
+        # If text_ok is polluted (full sentence), infer from callback_raw instead
+        blob = (text_ok + " " + callback_raw).lower()
+        # default yes for missed-call triage
+        text_ok_clean = TEXT_OK_MATCHER.category(blob) or "yes"
+
+    return {
+        "contact_name": name,
+        "location": location,
+        "issue": issue,
+        "urgency": urgency,
+        "urgency_level": str(data.get("urgency_level") or "").strip(),
+        "callback_window": window or callback_raw,
+        "text_ok": text_ok_clean,
+    }
+
+
+def build_owner_summary(
+    call_type: CallType,
+    call_id: str,
+    caller_phone: str,
+    result: Dict[str, Any],
+    logged_at: Optional[str] = None
+) -> str:
+    data = result.get("data_collected", {}) or {}
+    intent = result.get("intent", "unknown")
+    state = result.get("state", "unknown")
+    logged_at = logged_at or now_iso()
+
+    if call_type == CallType.MISSED:
+        norm = normalize_missed_fields(data)
+        name = norm["contact_name"] or "(unknown)"
+        location = norm["location"] or "(unknown)"
+        issue = norm["issue"] or "(unknown)"
+        urgency = norm["urgency"] or "(unknown)"
+        if norm["urgency_level"]:
+            urgency = f"{norm['urgency_level']} — {urgency}"
+        window = norm["callback_window"] or "(unknown)"
+        text_ok = norm["text_ok"] or "yes"
+        if state == "transferred":
+            next_step = "Transferred to on-call as an emergency; confirm someone picked up and call back now if not."
+        else:
+            next_step = "Call back in the window; confirm address; assign if needed; share timing update if available."
+
+        lines = [
+            f"[Afterhours] Missed call summary — {call_id}",
+            f"Caller: {name}   Phone: {caller_phone}",
+            f"Location: {location}",
+            f"Issue: {issue}",
+            f"Urgency: {urgency}",
+            f"Callback window: {window}   Text OK: {text_ok}",
+            f"Intent: {intent}   State: {state}",
+            f"Recommended next step: {next_step}",
+            f"Logged: {logged_at}",
+        ]
+        return "\n".join(lines)
+
+    # fallback summary for other call types
+    name = data.get("contact_name") or data.get("name") or "(unknown)"
+    lines = [
+        f"[Afterhours] Call summary — {call_type.value.upper()} — {call_id}",
+        f"Caller: {name}   Phone: {caller_phone}",
+        f"Intent: {intent}   State: {state}",
+        f"Data keys: {', '.join(sorted(list(data.keys())))}",
+        f"Logged: {logged_at}",
+    ]
+    return "\n".join(lines)
+
+
+def summarize_session(session: Dict[str, Any], logged_at: Optional[str] = None) -> Dict[str, str]:
+    """
+    Owner summary for one session log record (see simulate_call.build_session)
+
+    Returns:
+        {"session_id": ..., "owner_summary": ...}
+    """
+    result = {
+        "data_collected": session.get("data_collected"),
+        "intent": session.get("last_intent") or "unknown",
+        "state": session.get("last_state") or "unknown",
+    }
+    call_id = session.get("session_id") or session.get("call_id") or ""
+    summary = build_owner_summary(
+        CallType(session["call_type"]), call_id, session.get("caller_phone", ""), result, logged_at
+    )
+    return {"session_id": call_id, "owner_summary": summary}
+
+
+# Session fields summarize_session reads; only these are sent to worker processes
+SUMMARY_FIELDS = ("session_id", "call_id", "call_type", "caller_phone", "data_collected", "last_intent", "last_state")
+
+
+def _summarize_batch(batch, logged_at):
+    return [summarize_session(session, logged_at) for session in batch]
+
+
+def _summary_fields(session: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: session[field] for field in SUMMARY_FIELDS if field in session}
+
+
+def summarize_sessions(
+    sessions: Iterable[Dict[str, Any]],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Dict[str, str]]:
+    """
+    Render owner summaries for a stream of completed sessions
+
+    Sessions are consumed in chunks, so arbitrarily long streams use bounded
+    memory. All summaries of one run share the same "Logged" timestamp.
+
+    Args:
+        sessions: Session records (e.g. SessionLogReader.iter_records())
+        workers: Worker processes (1 = render in this process)
+        chunk_size: Sessions per worker task
+
+    Yields:
+        {"session_id", "owner_summary"} in input order
+    """
+    logged_at = now_iso()
+    sessions = iter(sessions)
+    if workers <= 1:
+        for session in sessions:
+            yield summarize_session(session, logged_at)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            # Keep a few chunks per worker in flight
+            batches = [[_summary_fields(s) for s in islice(sessions, chunk_size)] for _ in range(workers * 2)]
+            batches = [batch for batch in batches if batch]
+            if not batches:
+                return
+            for summaries in pool.map(_summarize_batch, batches, [logged_at] * len(batches)):
+                yield from summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render owner summaries for logged sessions")
+    parser.add_argument("--log-dir", default=SESSION_LOG_DIR, help="Session log directory")
+    parser.add_argument("--output-dir", help="Summary log directory (default: <log-dir>/summaries)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--print", action="store_true", help="Print summaries instead of logging them")
+    args = parser.parse_args()
+
+    sessions = SessionLogReader(args.log_dir, key="session_id").iter_records()
+    summaries = summarize_sessions(sessions, workers=args.workers)
+    if args.print:
+        for summary in summaries:
+            print(summary["owner_summary"] + "\n")
+        return
+
+    output_dir = args.output_dir or os.path.join(args.log_dir, "summaries")
+    count = 0
+    with SessionLogWriter(output_dir, prefix="summaries", key="session_id") as writer:
+        for summary in summaries:
+            writer.write(summary)
+            count += 1
+    print(f"Wrote {count} owner summaries to {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
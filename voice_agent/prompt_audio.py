@@ -0,0 +1,267 @@
+"""
+Prompt Audio Cache
+
+Most agent prompts are static, or only vary by contact/business name. Having
+Twilio synthesize every `<Say>` live adds speech startup latency on each
+turn, so prompts are synthesized ahead of time and served as files:
+
+- TTSBackend: pluggable synthesizer (text -> audio bytes). OfflineTTSBackend
+  writes silent 8 kHz mu-law WAV files of plausible length, for tests and
+  local runs without a TTS provider
+- PromptAudioCache: content-addressed store on disk. A prompt's file name is
+  the SHA-256 of (backend, voice, text), so identical prompts share one file,
+  a changed prompt gets a new file and stale files are never served
+- prewarm() enumerates every static prompt in the flow registry (plus
+  templates rendered with the default name/business and the state
+  machine's fixed prompts) and synthesizes the missing ones
+- generate_twiml_response(result, audio_cache) emits `<Play>` for cache hits
+  and falls back to `<Say>` otherwise; lookups never synthesize on the
+  turn path
+
+Usage:
+    python -m voice_agent.prompt_audio --prewarm
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import struct
+import sys
+import threading
+from typing import Dict, Iterator, List, Optional
+
+from .call_flows import CLARIFICATION_QUESTIONS, FLOW_REGISTRY, PROMPT_DEFAULTS, FlowRegistry
+from .state_machine import FIXED_PROMPTS
+
+
+logger = logging.getLogger(__name__)
+
+PROMPT_AUDIO_DIR = os.getenv(
+    "VOICE_AGENT_PROMPT_AUDIO_DIR",
+    os.path.join(os.path.dirname(__file__), "out", "prompt_audio")
+)
+# URL path the web app serves PROMPT_AUDIO_DIR under
+PROMPT_AUDIO_BASE_URL = os.getenv("VOICE_AGENT_PROMPT_AUDIO_URL", "/prompt-audio")
+DEFAULT_VOICE = "alice"
+
+
+class TTSBackend:
+    """Interface for text-to-speech providers"""
+
+    # Part of the cache key: switching providers never serves the old audio
+    name = "base"
+    extension = ".wav"
+
+    def synthesize(self, text: str, voice: str) -> bytes:
+        """Return the audio file contents for text spoken in voice"""
+        raise NotImplementedError
+
+
+class OfflineTTSBackend(TTSBackend):
+    """Offline stub: silent 8 kHz mono mu-law WAV, ~0.35 s per word"""
+
+    name = "offline"
+    SAMPLE_RATE = 8000
+    SECONDS_PER_WORD = 0.35
+
+    def synthesize(self, text: str, voice: str) -> bytes:
+        samples = int(max(len(text.split()), 1) * self.SECONDS_PER_WORD * self.SAMPLE_RATE)
+        data = b"\xff" * samples  # mu-law silence
+        fmt = struct.pack("<HHIIHHH", 7, 1, self.SAMPLE_RATE, self.SAMPLE_RATE, 1, 8, 0)
+        fact = struct.pack("<I", samples)
+        body = (
+            b"WAVE"
+            + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"fact" + struct.pack("<I", len(fact)) + fact
+            + b"data" + struct.pack("<I", len(data)) + data
+        )
+        return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def mulaw_payload(wav: bytes) -> bytes:
+    """
+    Raw audio of an 8 kHz mono mu-law WAV file (what Twilio media streams carry)
+
+    Raises:
+        ValueError: Not a WAV file, or not 8 kHz mono mu-law
+    """
+    if wav[:4] != b"RIFF" or wav[8:12] != b"WAVE":
+        raise ValueError("not a WAV file")
+    offset = 12
+    while offset + 8 <= len(wav):
+        chunk_id = wav[offset:offset + 4]
+        size = struct.unpack("<I", wav[offset + 4:offset + 8])[0]
+        body = wav[offset + 8:offset + 8 + size]
+        if chunk_id == b"fmt ":
+            fmt_tag, channels, rate = struct.unpack("<HHI", body[:8])
+            if (fmt_tag, channels, rate) != (7, 1, 8000):
+                raise ValueError("media streams need 8 kHz mono mu-law audio")
+        elif chunk_id == b"data":
+            return body
+        offset += 8 + size + (size & 1)
+    raise ValueError("WAV file has no data chunk")
+
+
+def iter_static_prompts(registry: Optional[FlowRegistry] = None) -> Iterator[str]:
+    """
+    Every prompt text known before a call starts (deduplicated)
+
+    Includes flow prompts without template fields, templated prompts
+    rendered with PROMPT_DEFAULTS (callers whose name/business is unknown),
+    clarifying questions and the state machine's fixed prompts.
+    """
+    registry = registry if registry is not None else FLOW_REGISTRY
+    seen = set()
+    candidates: List[str] = []
+    for call_type in registry:
+        for template in registry[call_type].table.prompts.values():
+            if template.fields <= PROMPT_DEFAULTS.keys():
+                candidates.append(template.render(PROMPT_DEFAULTS))
+    candidates.extend(CLARIFICATION_QUESTIONS.values())
+    candidates.extend(FIXED_PROMPTS)
+
+    for text in candidates:
+        if text and text not in seen:
+            seen.add(text)
+            yield text
+
+
+class PromptAudioCache:
+    """Content-addressed on-disk cache of synthesized prompts"""
+
+    def __init__(
+        self,
+        directory: str = PROMPT_AUDIO_DIR,
+        backend: Optional[TTSBackend] = None,
+        voice: str = DEFAULT_VOICE,
+        base_url: str = PROMPT_AUDIO_BASE_URL
+    ):
+        """
+        Args:
+            directory: Where audio files are stored (served at base_url)
+            backend: TTS provider (default: OfflineTTSBackend)
+            voice: Voice passed to the backend
+            base_url: URL prefix for <Play> (a path or an absolute URL)
+        """
+        self.directory = directory
+        self.backend = backend or OfflineTTSBackend()
+        self.voice = voice
+        self.base_url = base_url.rstrip("/")
+        self._lock = threading.Lock()
+        # text -> URL of prompts known to be on disk
+        self._urls: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.synthesized = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, text: str) -> str:
+        """Content address of a prompt for this backend and voice"""
+        digest = hashlib.sha256(f"{self.backend.name}\0{self.voice}\0{text}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _relative_path(self, key: str) -> str:
+        # Two-level fan-out keeps directories small
+        return f"{key[:2]}/{key}{self.backend.extension}"
+
+    def path(self, text: str) -> str:
+        """File path a prompt's audio is (or would be) stored at"""
+        return os.path.join(self.directory, *self._relative_path(self.key(text)).split("/"))
+
+    def _cached_url(self, text: str) -> Optional[str]:
+        url = self._urls.get(text)
+        if url is None:
+            relative = self._relative_path(self.key(text))
+            if not os.path.exists(os.path.join(self.directory, *relative.split("/"))):
+                return None
+            # Synthesized earlier or by another process (e.g. a prewarm run)
+            url = f"{self.base_url}/{relative}"
+            with self._lock:
+                self._urls[text] = url
+        return url
+
+    def lookup(self, text: str) -> Optional[str]:
+        """
+        URL of the prompt's audio, or None if it was never synthesized
+
+        Never synthesizes, so it is safe on the turn path.
+        """
+        url = self._cached_url(text)
+        if url is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return url
+
+    def synthesize(self, text: str) -> str:
+        """Synthesize a prompt if it isn't cached yet; returns its URL"""
+        url = self._cached_url(text)
+        if url is not None:
+            return url
+
+        relative = self._relative_path(self.key(text))
+        path = os.path.join(self.directory, *relative.split("/"))
+        audio = self.backend.synthesize(text, self.voice)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename, so readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(audio)
+        os.replace(tmp_path, path)
+
+        url = f"{self.base_url}/{relative}"
+        with self._lock:
+            self._urls[text] = url
+            self.synthesized += 1
+        return url
+
+    def prewarm(self, registry: Optional[FlowRegistry] = None) -> int:
+        """
+        Synthesize every static prompt that isn't cached yet
+
+        Args:
+            registry: Flow registry to enumerate (default: FLOW_REGISTRY)
+
+        Returns:
+            Number of prompts newly synthesized
+        """
+        before = self.synthesized
+        for text in iter_static_prompts(registry):
+            try:
+                self.synthesize(text)
+            except Exception as e:
+                # A failing provider only costs latency: the prompt falls back to <Say>
+                logger.error(f"Prompt audio synthesis failed: {e}")
+        created = self.synthesized - before
+        logger.info(f"Prompt audio cache warm: {len(self._urls)} prompts, {created} synthesized")
+        return created
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Cached prompt count and lookup counters"""
+        return {
+            "cached_prompts": len(self._urls),
+            "hits": self.hits,
+            "misses": self.misses,
+            "synthesized": self.synthesized,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-synthesize static agent prompts")
+    parser.add_argument("--prewarm", action="store_true", help="Synthesize all static prompts")
+    parser.add_argument("--directory", default=PROMPT_AUDIO_DIR)
+    parser.add_argument("--voice", default=DEFAULT_VOICE)
+    args = parser.parse_args(argv)
+
+    cache = PromptAudioCache(args.directory, voice=args.voice)
+    if args.prewarm:
+        created = cache.prewarm()
+        print(f"Synthesized {created} prompts into {args.directory}")
+    for text in iter_static_prompts():
+        print(f"{cache.lookup(text) or '-'}  {text[:60]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
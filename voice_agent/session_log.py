@@ -0,0 +1,334 @@
+"""
+Session log for simulated and live calls
+
+SessionLogWriter appends compact NDJSON records (one per finished call) from
+a background thread into segment files that rotate by size or age, optionally
+gzip-compressing closed segments. Each closed segment gets a sidecar index
+(call id -> byte offset) so SessionLogReader can look sessions up without
+scanning; segments without one (still open, or from a crash) are scanned.
+
+    writer = SessionLogWriter("/var/log/afterhours", compress=True)
+    writer.write(state_machine.end_call(call_id))   # returns immediately
+    writer.close()
+
+    SessionLogReader("/var/log/afterhours").get(call_id)
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+SESSION_LOG_DIR = os.getenv(
+    "VOICE_AGENT_SESSION_LOG_DIR",
+    os.path.join(os.path.dirname(__file__), "out")
+)
+SEGMENT_SUFFIX = ".ndjson"
+COMPRESSED_SUFFIX = ".ndjson.gz"
+INDEX_SUFFIX = ".idx"
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_QUEUE_SIZE = 10000
+WRITE_BUFFER_BYTES = 1 << 16
+
+_STOP = object()
+
+
+def _segment_stem(path: str) -> str:
+    for suffix in (COMPRESSED_SUFFIX, SEGMENT_SUFFIX):
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def _open_segment(path: str):
+    if path.endswith(COMPRESSED_SUFFIX):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+class SessionLogWriter:
+    """Buffered NDJSON session log with a background writer thread"""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        prefix: str = "sessions",
+        key: str = "call_id",
+        max_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_age_s: Optional[float] = None,
+        compress: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        queue_size: int = DEFAULT_QUEUE_SIZE
+    ):
+        """
+        Args:
+            directory: Segment directory (default: SESSION_LOG_DIR)
+            prefix: Segment file name prefix
+            key: Record field holding the call id (indexed for lookups)
+            max_bytes: Rotate when a segment reaches this size
+            max_age_s: Also rotate segments older than this (None = size only)
+            compress: Gzip segments when they are closed
+            flush_interval: Max seconds buffered records wait before reaching the OS
+            queue_size: Pending records before write() blocks (backpressure)
+        """
+        self.directory = directory or SESSION_LOG_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self.prefix = prefix
+        self.key = key
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.segments: List[str] = []
+        self.records_written = 0
+        self.records_dropped = 0
+        self.write_errors = 0
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._path: Optional[str] = None
+        self._opened_at = 0.0
+        self._bytes = 0
+        self._offsets: List[Tuple[str, int]] = []
+        self._sequence = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="session-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, record: Dict[str, Any], block: bool = True) -> bool:
+        """
+        Queue one session record
+
+        Args:
+            record: Session record
+            block: Wait for room if the queue is full; with False the record
+                is dropped instead (use this from an event loop)
+
+        Returns:
+            False if the record was dropped
+        """
+        if self._closed:
+            raise RuntimeError("SessionLogWriter is closed")
+        if block:
+            self._queue.put(record)
+            return True
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.records_dropped += 1
+            return False
+        return True
+
+    def flush(self):
+        """Wait until every queued record has been written to the current segment"""
+        self._queue.join()
+
+    def close(self):
+        """Drain the queue, close (and index/compress) the current segment and stop the thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self) -> "SessionLogWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def current_segment(self) -> Optional[str]:
+        """Path of the segment being written (None until the first record)"""
+        return self._path
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._file is not None:
+                    self._file.flush()
+                    if self._expired():
+                        self._close_segment()
+                continue
+            try:
+                if item is _STOP:
+                    self._close_segment()
+                    return
+                self._write_record(item)
+                if self._queue.empty() and self._file is not None:
+                    self._file.flush()
+            except Exception:
+                self.write_errors += 1
+                logger.exception("Failed to write session log record")
+            finally:
+                self._queue.task_done()
+
+    def _expired(self) -> bool:
+        return self.max_age_s is not None and time.monotonic() - self._opened_at >= self.max_age_s
+
+    def _write_record(self, record: Dict[str, Any]):
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        if self._file is not None and (self._bytes + len(line) > self.max_bytes or self._expired()):
+            self._close_segment()
+        if self._file is None:
+            self._open_new_segment()
+        self._offsets.append((str(record.get(self.key, "")), self._bytes))
+        self._file.write(line)
+        self._bytes += len(line)
+        self.records_written += 1
+
+    def _open_new_segment(self):
+        self._sequence += 1
+        stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        while True:
+            # Several writers may share a directory (one per simulation run):
+            # the random suffix and exclusive create keep each segment, and
+            # its index, to a single writer
+            name = f"{self.prefix}-{stamp}-{os.getpid()}-{self._sequence:04d}-{uuid.uuid4().hex[:8]}{SEGMENT_SUFFIX}"
+            self._path = os.path.join(self.directory, name)
+            try:
+                self._file = open(self._path, "xb", buffering=WRITE_BUFFER_BYTES)
+                break
+            except FileExistsError:
+                continue
+        self._opened_at = time.monotonic()
+        self._bytes = 0
+        self._offsets = []
+
+    def _close_segment(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        path = self._path
+        stem = _segment_stem(path)
+
+        with open(stem + INDEX_SUFFIX, "w", encoding="utf-8") as f:
+            f.writelines(f"{call_id}\t{offset}\n" for call_id, offset in self._offsets)
+        if self.compress:
+            with open(path, "rb") as src, gzip.open(stem + COMPRESSED_SUFFIX, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(path)
+            path = stem + COMPRESSED_SUFFIX
+        self.segments.append(path)
+        self._path = None
+
+
+class SessionLogReader:
+    """Looks sessions up by call id across plain and compressed segments"""
+
+    def __init__(self, directory: Optional[str] = None, key: str = "call_id"):
+        """
+        Args:
+            directory: Segment directory (default: SESSION_LOG_DIR)
+            key: Record field holding the call id (only used for segments without an index)
+        """
+        self.directory = directory or SESSION_LOG_DIR
+        self.key = key
+        self._index: Optional[Dict[str, Tuple[str, int]]] = None
+
+    def segments(self) -> List[str]:
+        """Segment paths, oldest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        names = [
+            name for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX) or name.endswith(COMPRESSED_SUFFIX)
+        ]
+        return [os.path.join(self.directory, name) for name in sorted(names)]
+
+    def refresh(self) -> int:
+        """
+        (Re)build the call id index
+
+        Returns:
+            Number of indexed sessions
+        """
+        index: Dict[str, Tuple[str, int]] = {}
+        for path in self.segments():
+            for call_id, offset in self._segment_offsets(path):
+                # A later record for the same call wins
+                index[call_id] = (path, offset)
+        self._index = index
+        return len(index)
+
+    def _segment_offsets(self, path: str) -> Iterator[Tuple[str, int]]:
+        index_path = _segment_stem(path) + INDEX_SUFFIX
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    call_id, _, offset = line.rstrip("\n").rpartition("\t")
+                    if call_id:
+                        yield call_id, int(offset)
+            return
+        for offset, record in self._scan(path):
+            call_id = record.get(self.key)
+            if call_id:
+                yield str(call_id), offset
+
+    def _scan(self, path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        offset = 0
+        try:
+            with _open_segment(path) as f:
+                for line in f:
+                    start, offset = offset, offset + len(line)
+                    if not line.endswith(b"\n"):
+                        break  # partially written tail of a live segment
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Skipping corrupt record in {path} at byte {start}")
+                        continue
+                    if isinstance(record, dict):
+                        yield start, record
+        except (OSError, EOFError) as e:
+            logger.warning(f"Skipping unreadable segment {path}: {e}")
+
+    def get(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look a session up by call id
+
+        Args:
+            call_id: Call identifier
+
+        Returns:
+            The session record, or None if it isn't logged
+        """
+        if self._index is None or call_id not in self._index:
+            self.refresh()
+        location = self._index.get(call_id)
+        if location is None:
+            return None
+        path, offset = location
+        with _open_segment(path) as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def __contains__(self, call_id: str) -> bool:
+        if self._index is None:
+            self.refresh()
+        return call_id in self._index
+
+    def __len__(self) -> int:
+        if self._index is None:
+            self.refresh()
+        return len(self._index)
+
+    def iter_records(self, segments: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Every record in `segments` (default: all segments), oldest first"""
+        for path in self.segments() if segments is None else segments:
+            for _, record in self._scan(path):
+                yield record
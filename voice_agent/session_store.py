@@ -0,0 +1,290 @@
+"""
+Call Session Stores
+
+Pluggable storage for active call contexts, so several webhook worker
+processes (or nodes) can share call state.
+
+- InMemorySessionStore: the default; wraps the sharded CallRegistry and
+  hands out live CallContext objects (no serialization)
+- SQLiteSessionStore: shared file-backed store for multiple processes on one
+  host (or a network filesystem); contexts are serialized compactly
+
+Both use optimistic versioning: every save bumps CallContext.version, and a
+save whose version no longer matches the stored one raises
+SessionConflictError (another worker processed a turn for the same call in
+between). Per-call locks only serialize turns within one process; across
+processes the version check is what prevents lost updates.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from .call_flows import CallContext, CallState, CallType, HistoryEntry
+from .call_registry import CallRegistry
+
+
+# Idle sessions older than this are treated as gone by shared stores
+DEFAULT_SESSION_TTL_SECONDS = 2 * 60 * 60
+
+
+class SessionConflictError(Exception):
+    """Raised when a call session was modified since it was loaded"""
+    pass
+
+
+def serialize_context(context: CallContext) -> bytes:
+    """
+    Compact serialization of a CallContext
+
+    A positional JSON array (no field names) with enums stored by value and
+    history entries as [state, response, prompt, elapsed] arrays. The
+    version is stored separately by the store.
+    """
+    return json.dumps([
+        context.call_id,
+        context.call_type.value,
+        context.lead_id,
+        context.business_name,
+        context.contact_name,
+        context.contact_phone,
+        context.current_state.value,
+        context.collected_data,
+        list(context.history),
+        context.history_count,
+        context.started_at,
+        sorted(context.missing_fields),
+        context.clarification_count,
+        context.max_clarifications,
+    ], separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+
+def deserialize_context(data: bytes, version: int = 0) -> CallContext:
+    """Rebuild a CallContext from serialize_context() output"""
+    (call_id, call_type, lead_id, business_name, contact_name, contact_phone, state,
+     collected_data, history, history_count, started_at, missing_fields, clarification_count,
+     max_clarifications) = json.loads(data)
+    return CallContext(
+        call_id=call_id,
+        call_type=CallType(call_type),
+        lead_id=lead_id,
+        business_name=business_name,
+        contact_name=contact_name,
+        contact_phone=contact_phone,
+        current_state=CallState(state),
+        collected_data=collected_data,
+        conversation_history=[HistoryEntry(*entry) for entry in history],
+        missing_fields=set(missing_fields),
+        clarification_count=clarification_count,
+        max_clarifications=max_clarifications,
+        version=version,
+        started_at=started_at,
+        history_count=history_count
+    )
+
+
+class CallSessionStore:
+    """
+    Interface for call session storage
+
+    Subclasses implement load/save/create/delete. `lock()` serializes turns
+    for one call within this process; `in` and `get()` make a store usable
+    where the state machine's `active_calls` dict used to be.
+    """
+
+    def __init__(self):
+        # Local per-call locks (and contention metrics) for every backend
+        self._locks = CallRegistry()
+
+    def lock(self, call_id: str):
+        """Per-call re-entrant lock (process-local)"""
+        return self._locks.lock(call_id)
+
+    def load(self, call_id: str) -> Optional[CallContext]:
+        """Load a call's context (None if unknown or expired)"""
+        raise NotImplementedError
+
+    def create(self, context: CallContext) -> None:
+        """Store a new call, replacing any previous session with the same id"""
+        raise NotImplementedError
+
+    def save(self, context: CallContext) -> None:
+        """
+        Save a loaded context and bump its version
+
+        Raises:
+            SessionConflictError: The stored version changed since load
+        """
+        raise NotImplementedError
+
+    def delete(self, call_id: str) -> None:
+        """Remove a call (no-op if unknown)"""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, call_id: object) -> bool:
+        return self.load(call_id) is not None
+
+    def __getitem__(self, call_id: str) -> CallContext:
+        context = self.load(call_id)
+        if context is None:
+            raise KeyError(call_id)
+        return context
+
+    def get(self, call_id: str, default: Any = None) -> Any:
+        context = self.load(call_id)
+        return default if context is None else context
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Active session count and lock contention"""
+        metrics = self._locks.get_metrics()
+        metrics["active_calls"] = len(self)
+        return metrics
+
+
+class InMemorySessionStore(CallSessionStore):
+    """Process-local store holding live CallContext objects"""
+
+    def __init__(self, registry: Optional[CallRegistry] = None):
+        super().__init__()
+        # Contexts and their locks live in the same registry
+        self.calls = self._locks = registry or CallRegistry()
+
+    def load(self, call_id: str) -> Optional[CallContext]:
+        return self.calls.get(call_id)
+
+    def create(self, context: CallContext) -> None:
+        context.version = 1
+        self.calls[context.call_id] = context
+
+    def save(self, context: CallContext) -> None:
+        current = self.calls.get(context.call_id)
+        if current is not None and current is not context and current.version != context.version:
+            raise SessionConflictError(
+                f"Call {context.call_id} changed (version {current.version}, loaded {context.version})"
+            )
+        context.version += 1
+        self.calls[context.call_id] = context
+
+    def delete(self, call_id: str) -> None:
+        if call_id in self.calls:
+            del self.calls[call_id]
+
+    def __contains__(self, call_id: object) -> bool:
+        return call_id in self.calls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.calls)
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+
+class SQLiteSessionStore(CallSessionStore):
+    """
+    Shared session store in a SQLite database file
+
+    Uses WAL mode with synchronous=NORMAL so readers never block the writer
+    and commits don't fsync. Each thread gets its own connection.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS call_sessions ("
+        " call_id TEXT PRIMARY KEY,"
+        " version INTEGER NOT NULL,"
+        " expires_at REAL NOT NULL,"
+        " data BLOB NOT NULL)"
+    )
+
+    def __init__(self, path: str, ttl_seconds: float = DEFAULT_SESSION_TTL_SECONDS):
+        """
+        Args:
+            path: Database file (shared by all worker processes)
+            ttl_seconds: Sessions not saved for this long expire
+        """
+        super().__init__()
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().execute(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit: every statement is its own short transaction
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL").fetchall()
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _query(self, sql: str, params: tuple) -> list:
+        # Always drain the cursor: a half-read SELECT keeps its read
+        # transaction (and a stale snapshot) open on this connection
+        return self._connection().execute(sql, params).fetchall()
+
+    def load(self, call_id: str) -> Optional[CallContext]:
+        rows = self._query(
+            "SELECT data, version FROM call_sessions WHERE call_id = ? AND expires_at > ?",
+            (call_id, time.time())
+        )
+        if not rows:
+            return None
+        return deserialize_context(rows[0][0], rows[0][1])
+
+    def create(self, context: CallContext) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO call_sessions (call_id, version, expires_at, data) VALUES (?, 1, ?, ?)",
+            (context.call_id, time.time() + self.ttl_seconds, serialize_context(context))
+        )
+        context.version = 1
+
+    def save(self, context: CallContext) -> None:
+        cursor = self._connection().execute(
+            "UPDATE call_sessions SET version = version + 1, expires_at = ?, data = ? "
+            "WHERE call_id = ? AND version = ?",
+            (time.time() + self.ttl_seconds, serialize_context(context), context.call_id, context.version)
+        )
+        if cursor.rowcount != 1:
+            raise SessionConflictError(
+                f"Call {context.call_id} changed or expired since version {context.version} was loaded"
+            )
+        context.version += 1
+
+    def delete(self, call_id: str) -> None:
+        self._connection().execute("DELETE FROM call_sessions WHERE call_id = ?", (call_id,))
+
+    def purge_expired(self) -> int:
+        """Delete expired sessions; returns the number removed"""
+        cursor = self._connection().execute(
+            "DELETE FROM call_sessions WHERE expires_at <= ?", (time.time(),)
+        )
+        return cursor.rowcount
+
+    def __contains__(self, call_id: object) -> bool:
+        # Existence only; don't fetch and deserialize the session
+        return bool(self._query(
+            "SELECT 1 FROM call_sessions WHERE call_id = ? AND expires_at > ? LIMIT 1",
+            (call_id, time.time())
+        ))
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._query("SELECT call_id FROM call_sessions WHERE expires_at > ?", (time.time(),))
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        return self._query("SELECT COUNT(*) FROM call_sessions WHERE expires_at > ?", (time.time(),))[0][0]
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -8,17 +8,42 @@ Enhanced with:
 - Async-ready structure
 """
 
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any
 from enum import Enum
 import json
 import logging
 
-from .call_flows import CallFlow, CallContext, CallState, CallType, get_flow_for_call_type
+from .call_flows import CallFlow, CallContext, CallState, CallType, FlowRegistry, FLOW_REGISTRY
+from .session_store import CallSessionStore, InMemorySessionStore, SessionConflictError
 from .intent_detector import IntentDetector, Intent
+from .opt_out import OPT_OUT_MATCHER
 
 
 logger = logging.getLogger(__name__)
 
+# Turn retries when another worker saved the same call first
+MAX_SAVE_ATTEMPTS = 3
+
+
+# Prompts spoken by the state machine itself (flow prompts live in call_flows)
+CALL_NOT_FOUND_PROMPT = "I'm sorry, I couldn't find your call session. Please call back."
+OPT_OUT_PROMPT = "No problem at all. I'll remove you from our list. Have a great day!"
+TRANSFER_PROMPT = "If a team member is available, I can request a transfer. Please hold."
+EMERGENCY_TRANSFER_PROMPT = "That sounds like an emergency, so I’m connecting you with the on-call team now. If anyone is in danger, hang up and call 911."
+MISSED_COMPLETED_PROMPT = "Perfect — I’ve got this logged. We’ll pass that window to the on-call team for follow-up. If anything changes, just reply to the text or call again."
+COMPLETED_PROMPT = "Perfect! I have everything I need. We aim to send a demo email within about 24 hours. Thanks for your time!"
+DECLINED_PROMPT = "No problem. Have a great day!"
+FIXED_PROMPTS = (
+    CALL_NOT_FOUND_PROMPT, OPT_OUT_PROMPT, TRANSFER_PROMPT, EMERGENCY_TRANSFER_PROMPT,
+    MISSED_COMPLETED_PROMPT, COMPLETED_PROMPT, DECLINED_PROMPT
+)
+
+
+class ResponseMode(Enum):
+    """What process_user_input returns besides prompt/state/intent"""
+    FULL = "full"  # all collected data and the whole conversation history
+    DELTA = "delta"  # only data changed and history added by this turn
+
 
 class VoiceAgentStateMachine:
     """
@@ -30,10 +55,37 @@ class VoiceAgentStateMachine:
     - Better error handling
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        flow_registry: Optional[FlowRegistry] = None,
+        session_store: Optional[CallSessionStore] = None,
+        response_mode: ResponseMode = ResponseMode.FULL
+    ):
         self.intent_detector = IntentDetector()
-        self.active_calls: Dict[str, CallContext] = {}
-        self.flow_cache: Dict[CallType, CallFlow] = {}
+        # Call sessions with per-call locks: in-process by default, or a shared
+        # store (e.g. SQLiteSessionStore) when several workers serve webhooks
+        self.sessions = session_store if session_store is not None else InMemorySessionStore()
+        self.active_calls = self.sessions  # backwards-compatible alias
+        # Flows are shared, read-only instances built once per process
+        self.flows = flow_registry or FLOW_REGISTRY
+        self.flow_cache = self.flows  # backwards-compatible alias
+        self.response_mode = response_mode
+        # Called with the CallContext after start_call and every saved turn,
+        # and with the call_id after end_call (e.g. IdleCallReaper)
+        self._activity_listeners: List[Callable[[CallContext], None]] = []
+        self._end_listeners: List[Callable[[str], None]] = []
+    
+    def add_activity_listener(self, listener: Callable[[CallContext], None]):
+        """Register a callback for call starts and processed turns"""
+        self._activity_listeners.append(listener)
+    
+    def add_end_listener(self, listener: Callable[[str], None]):
+        """Register a callback for ended calls"""
+        self._end_listeners.append(listener)
+    
+    def get_flow(self, call_type: CallType) -> CallFlow:
+        """Get the shared flow for a call type"""
+        return self.flows.get(call_type)
     
     def start_call(self, call_id: str, call_type: CallType, initial_context: Optional[Dict] = None) -> CallContext:
         """
@@ -47,12 +99,6 @@ class VoiceAgentStateMachine:
         Returns:
             CallContext for this call
         """
-        # Get or create flow for this call type
-        if call_type not in self.flow_cache:
-            self.flow_cache[call_type] = get_flow_for_call_type(call_type)
-        
-        flow = self.flow_cache[call_type]
-        
         # Create context
         context = CallContext(
             call_id=call_id,
@@ -67,13 +113,21 @@ class VoiceAgentStateMachine:
                     setattr(context, key, value)
         
         # Store active call
-        self.active_calls[call_id] = context
+        with self.sessions.lock(call_id):
+            self.sessions.create(context)
+        for listener in self._activity_listeners:
+            listener(context)
         
         logger.info(f"Started call {call_id} of type {call_type.value}")
         
         return context
     
-    def process_user_input(self, call_id: str, user_input: str) -> Dict[str, Any]:
+    def process_user_input(
+        self,
+        call_id: str,
+        user_input: str,
+        response_mode: Optional[ResponseMode] = None
+    ) -> Dict[str, Any]:
         """
         Process user input and return next system response
         
@@ -85,6 +139,7 @@ class VoiceAgentStateMachine:
         Args:
             call_id: Call identifier
             user_input: User's speech/text input
+            response_mode: Override the state machine's response_mode for this turn
         
         Returns:
             Dict with:
@@ -95,21 +150,103 @@ class VoiceAgentStateMachine:
             - should_end: Whether to end call
             - data_collected: Extracted data so far
             - missing_fields: Fields that still need to be collected
+            In ResponseMode.DELTA, data_collected and conversation_history are
+            replaced by data_changed (keys set or changed this turn) and
+            history_added (entries added this turn).
         """
-        # Get call context
-        context = self.active_calls.get(call_id)
-        if not context:
-            return {
-                "error": "Call not found",
-                "prompt": "I'm sorry, I couldn't find your call session. Please call back.",
-                "should_end": True
-            }
+        # Turns for one call are serialized; different calls run in parallel
+        with self.sessions.lock(call_id):
+            return self._run_turn(call_id, user_input, response_mode, self.sessions.load(call_id))
+    
+    def handle_turn(
+        self,
+        call_id: str,
+        user_input: str,
+        call_type: CallType,
+        initial_context: Optional[Dict] = None,
+        response_mode: Optional[ResponseMode] = None
+    ) -> Dict[str, Any]:
+        """
+        Process user input, starting the call first if it is unknown
+        
+        Loads the session once (a webhook's first turn doesn't need a separate
+        existence check). Concurrent first turns start the call only once.
+        
+        Args:
+            call_id: Call identifier
+            user_input: User's speech/text input
+            call_type: Call type used if the call has to be started
+            initial_context: Initial data used if the call has to be started
+            response_mode: Override the state machine's response_mode for this turn
         
+        Returns:
+            Same dict as process_user_input
+        """
+        with self.sessions.lock(call_id):
+            context = self.sessions.load(call_id)
+            if context is None:
+                context = self.start_call(call_id, call_type, initial_context)
+            return self._run_turn(call_id, user_input, response_mode, context)
+    
+    def _run_turn(
+        self,
+        call_id: str,
+        user_input: str,
+        response_mode: Optional[ResponseMode],
+        context: Optional[CallContext]
+    ) -> Dict[str, Any]:
+        """Process and save a turn for an already loaded context (caller holds the call's lock)"""
+        delta = (response_mode or self.response_mode) == ResponseMode.DELTA
+        for attempt in range(1, MAX_SAVE_ATTEMPTS + 1):
+            # Reload after a conflicting save
+            if attempt > 1:
+                context = self.sessions.load(call_id)
+            if not context:
+                return {
+                    "error": "Call not found",
+                    "prompt": CALL_NOT_FOUND_PROMPT,
+                    "should_end": True
+                }
+            
+            if delta:
+                data_before = dict(context.collected_data)
+                history_before = context.history_count
+            result = self._process_turn(context, user_input)
+            try:
+                self.sessions.save(context)
+            except SessionConflictError:
+                if attempt == MAX_SAVE_ATTEMPTS:
+                    raise
+                logger.warning(f"Call {call_id} was updated concurrently, retrying turn")
+                continue
+            
+            for listener in self._activity_listeners:
+                listener(context)
+            if delta:
+                return self._delta_result(result, context, data_before, history_before)
+            return result
+    
+    @staticmethod
+    def _delta_result(
+        result: Dict[str, Any],
+        context: CallContext,
+        data_before: Dict[str, Any],
+        history_before: int
+    ) -> Dict[str, Any]:
+        """Replace full data/history in a turn result with what this turn changed"""
+        result.pop("data_collected", None)
+        result.pop("conversation_history", None)
+        result["data_changed"] = {
+            key: value for key, value in context.collected_data.items()
+            if key not in data_before or data_before[key] != value
+        }
+        result["history_added"] = context.history_since(history_before)
+        return result
+    
+    def _process_turn(self, context: CallContext, user_input: str) -> Dict[str, Any]:
+        """Process user input against a loaded context (caller holds the call's lock)"""
         # Get flow for this call
-        flow = self.flow_cache.get(context.call_type)
-        if not flow:
-            flow = get_flow_for_call_type(context.call_type)
-            self.flow_cache[context.call_type] = flow
+        flow = self.flows.get(context.call_type)
         
         # Detect intent
         intent, confidence = self.intent_detector.detect(user_input)
@@ -118,18 +255,13 @@ class VoiceAgentStateMachine:
         if intent == Intent.OPT_OUT:
             # SAFETY: during MISSED calls, ignore false opt-outs like "no AC"
             if context.call_type == CallType.MISSED:
-                text = user_input.lower()
-                explicit_opt_out = any(phrase in text for phrase in [
-                    "remove me", "unsubscribe", "stop calling", "do not call",
-                    "don't call", "no thanks", "not interested"
-                ])
-                if not explicit_opt_out:
+                if not OPT_OUT_MATCHER.match(user_input).explicit:
                     # treat as normal response, continue flow
                     intent = Intent.CONTINUE
                 else:
                     context.current_state = CallState.OPTED_OUT
                     return {
-                        "prompt": "No problem at all. I'll remove you from our list. Have a great day!",
+                        "prompt": OPT_OUT_PROMPT,
                         "state": CallState.OPTED_OUT.value,
                         "intent": intent.value,
                         "should_end": True,
@@ -138,7 +270,7 @@ class VoiceAgentStateMachine:
             else:
                 context.current_state = CallState.OPTED_OUT
                 return {
-                    "prompt": "No problem at all. I'll remove you from our list. Have a great day!",
+                    "prompt": OPT_OUT_PROMPT,
                     "state": CallState.OPTED_OUT.value,
                     "intent": intent.value,
                     "should_end": True,
@@ -148,7 +280,7 @@ class VoiceAgentStateMachine:
         if intent == Intent.TRANSFER:
             context.current_state = CallState.TRANSFERRED
             return {
-                "prompt": "If a team member is available, I can request a transfer. Please hold.",
+                "prompt": TRANSFER_PROMPT,
                 "state": CallState.TRANSFERRED.value,
                 "intent": intent.value,
                 "should_transfer": True,
@@ -174,15 +306,21 @@ class VoiceAgentStateMachine:
         context.current_state = next_state
         
         # Get next prompt
+        should_transfer = False
         if next_state == CallState.COMPLETED:
             if context.call_type == CallType.MISSED:
-                prompt = "Perfect — I’ve got this logged. We’ll pass that window to the on-call team for follow-up. If anything changes, just reply to the text or call again."
+                prompt = MISSED_COMPLETED_PROMPT
             else:
-                prompt = "Perfect! I have everything I need. We aim to send a demo email within about 24 hours. Thanks for your time!"
+                prompt = COMPLETED_PROMPT
             should_end = True
         elif next_state == CallState.OPTED_OUT:
-            prompt = "No problem. Have a great day!"
+            prompt = DECLINED_PROMPT
             should_end = True
+        elif next_state == CallState.TRANSFERRED:
+            # The flow escalated (e.g. a missed call classified as an emergency)
+            prompt = EMERGENCY_TRANSFER_PROMPT
+            should_end = False
+            should_transfer = True
         elif next_state == CallState.CLARIFYING:
             # Get clarifying question
             prompt = flow.get_next_prompt(next_state, context)
@@ -196,7 +334,7 @@ class VoiceAgentStateMachine:
             "state": next_state.value,
             "intent": intent.value,
             "should_end": should_end,
-            "should_transfer": False,
+            "should_transfer": should_transfer,
             "data_collected": context.collected_data,
             "missing_fields": list(context.missing_fields),
             "conversation_history": context.conversation_history
@@ -204,39 +342,32 @@ class VoiceAgentStateMachine:
     
     def get_call_summary(self, call_id: str) -> Optional[Dict[str, Any]]:
         """Get summary of call for storage/processing"""
-        context = self.active_calls.get(call_id)
-        if not context:
-            return None
-        
-        return {
-            "call_id": call_id,
-            "call_type": context.call_type.value,
-            "lead_id": context.lead_id,
-            "business_name": context.business_name,
-            "contact_name": context.contact_name,
-            "final_state": context.current_state.value,
-            "data_collected": context.collected_data,
-            "conversation_history": context.conversation_history,
-            "data_completeness": self._calculate_completeness(context)
-        }
+        with self.sessions.lock(call_id):
+            context = self.sessions.load(call_id)
+            if not context:
+                return None
+            
+            return {
+                "call_id": call_id,
+                "call_type": context.call_type.value,
+                "lead_id": context.lead_id,
+                "business_name": context.business_name,
+                "contact_name": context.contact_name,
+                "final_state": context.current_state.value,
+                "data_collected": context.collected_data,
+                "conversation_history": context.conversation_history,
+                "data_completeness": self._calculate_completeness(context)
+            }
     
     def _calculate_completeness(self, context: CallContext) -> Dict[str, Any]:
         """Calculate data completeness score"""
-        flow = self.flow_cache.get(context.call_type)
-        if not flow:
-            return {"score": 0.0, "missing": []}
-        
-        total_required = 0
-        collected = 0
-        missing = []
-        
-        for state, required_fields in flow.required_fields.items():
-            for field in required_fields:
-                total_required += 1
-                if field in context.collected_data and context.collected_data[field]:
-                    collected += 1
-                else:
-                    missing.append(field)
+        flow = self.flows.get(context.call_type)
+        
+        data = context.collected_data
+        required_fields = flow.table.all_required_fields
+        missing = [field for field in required_fields if not data.get(field)]
+        total_required = len(required_fields)
+        collected = total_required - len(missing)
         
         score = collected / total_required if total_required > 0 else 0.0
         
@@ -249,9 +380,11 @@ class VoiceAgentStateMachine:
     
     def end_call(self, call_id: str) -> Optional[Dict[str, Any]]:
         """End call and return summary"""
-        summary = self.get_call_summary(call_id)
-        if call_id in self.active_calls:
-            del self.active_calls[call_id]
+        with self.sessions.lock(call_id):
+            summary = self.get_call_summary(call_id)
+            self.sessions.delete(call_id)
+        for listener in self._end_listeners:
+            listener(call_id)
         return summary
 
 
@@ -272,7 +405,7 @@ class TwilioAdapter:
             initial_context={"contact_phone": from_number}
         )
         
-        flow = get_flow_for_call_type(CallType.INBOUND)
+        flow = self.state_machine.get_flow(CallType.INBOUND)
         initial_prompt = flow.get_next_prompt(CallState.GREETING, context)
         
         return {
@@ -312,7 +445,7 @@ class VAPIAdapter:
     def create_call_config(self, call_id: str, call_type: CallType, initial_context: Dict) -> Dict:
         """Create VAPI call configuration"""
         context = self.state_machine.start_call(call_id, call_type, initial_context)
-        flow = get_flow_for_call_type(call_type)
+        flow = self.state_machine.get_flow(call_type)
         initial_prompt = flow.get_next_prompt(CallState.GREETING, context)
         
         return {
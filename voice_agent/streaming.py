@@ -0,0 +1,211 @@
+"""
+Streaming Partial-Transcript Processing
+
+With `<Gather input="speech">` a turn is only processed once the caller has
+stopped talking and the final SpeechResult arrives. Some turns are decided
+long before that: "please stop calling me", "can I talk to a person",
+"yes". StreamingTurnProcessor runs the intent detector over the growing
+partial transcript and commits the turn early when a decisive intent is
+stable, so the response is ready before end of speech.
+
+Early commit rules (anything else waits for the final transcript):
+- The intent is in EARLY_COMMIT_INTENTS and was detected on `stability`
+  consecutive partials (partial transcripts are often revised)
+- OPT_OUT needs an explicit phrase (EXPLICIT_OPT_OUT_PHRASES): a bare "no"
+  in "no AC tonight" must not end a call
+- AFFIRMATIVE only commits in states that collect no fields (elsewhere the
+  full answer is stored as data, so it must not be cut short), and only
+  while the partial is nothing but an affirmative ("yes", "sure, ok"):
+  "yes but" may still turn into a decline
+
+A committed turn is processed once with the partial text; the final
+transcript for that turn then returns the same result, unless the final
+text opts out where the committed partial didn't ("yes but not now, call me
+later"). The call is then rewound to before the commit and the turn is
+processed again with the final text. Twilio sends partials
+to `partialResultCallback` (see generate_twiml_response); the media stream
+server can answer as soon as a turn commits.
+"""
+
+import logging
+import re
+import threading
+from typing import Any, Dict, Optional
+
+from .call_flows import CallContext, CallState, CallType
+from .intent_detector import Intent
+from .opt_out import OPT_OUT_MATCHER
+from .session_store import deserialize_context, serialize_context
+from .state_machine import VoiceAgentStateMachine
+
+
+logger = logging.getLogger(__name__)
+
+# Intents that decide a turn on their own
+EARLY_COMMIT_INTENTS = frozenset({Intent.OPT_OUT, Intent.TRANSFER, Intent.AFFIRMATIVE})
+
+# Consecutive partials that must agree before committing
+DEFAULT_STABILITY = 2
+
+# A partial made only of affirmative words (AFFIRMATIVE commits need this)
+AFFIRMATIVE_ONLY = re.compile(
+    r"^\W*(?:(?:yes|yeah|yep|sure|okay|ok|fine|absolutely|definitely|"
+    r"that works|sounds good|perfect|great)\b\W*)+$",
+    re.IGNORECASE
+)
+
+
+class _PartialTurn:
+    """Streaming state of the turn in progress for one call"""
+    __slots__ = ("intent", "stable", "result", "committed_text", "snapshot")
+
+    def __init__(self):
+        self.intent: Optional[Intent] = None
+        self.stable = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.committed_text: Optional[str] = None
+        self.snapshot: Optional[bytes] = None  # serialized context before the commit
+
+
+class StreamingTurnProcessor:
+    """Processes partial transcripts and commits decisive turns early"""
+
+    def __init__(self, state_machine: VoiceAgentStateMachine, stability: int = DEFAULT_STABILITY):
+        """
+        Args:
+            state_machine: State machine that processes committed turns
+            stability: Consecutive partials with the same intent needed to commit
+        """
+        self.state_machine = state_machine
+        self.stability = max(stability, 1)
+        self._turns: Dict[str, _PartialTurn] = {}
+        self._lock = threading.Lock()
+        self.partials_processed = 0
+        self.early_commits = 0
+        self.final_turns = 0
+        self.reprocessed_turns = 0
+        state_machine.add_end_listener(self.reset)
+
+    def _turn(self, call_id: str) -> _PartialTurn:
+        with self._lock:
+            turn = self._turns.get(call_id)
+            if turn is None:
+                turn = self._turns[call_id] = _PartialTurn()
+            return turn
+
+    def feed_partial(self, call_id: str, partial_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Process a partial transcript of the caller's current utterance
+
+        Args:
+            call_id: Call identifier
+            partial_text: Transcript so far (each partial replaces the previous one)
+
+        Returns:
+            The turn result if the turn is committed (now or earlier), else None
+        """
+        sessions = self.state_machine.sessions
+        with sessions.lock(call_id):
+            if call_id not in sessions:
+                return None  # unknown calls are reported when the final transcript arrives
+            turn = self._turn(call_id)
+            if turn.result is not None:
+                return turn.result
+            self.partials_processed += 1
+
+            intent, _ = self.state_machine.intent_detector.detect(partial_text)
+            if intent != turn.intent:
+                turn.intent = intent
+                turn.stable = 0
+            turn.stable += 1
+
+            if turn.stable < self.stability or not self._can_commit(call_id, intent, partial_text):
+                return None
+
+            turn.snapshot = serialize_context(sessions.load(call_id))
+            result = self.state_machine.process_user_input(call_id, partial_text)
+            result["early_commit"] = True
+            turn.result = result
+            turn.committed_text = partial_text
+            self.early_commits += 1
+            logger.info(f"Call {call_id}: committed {intent.value} turn early on '{partial_text}'")
+            return result
+
+    def _can_commit(self, call_id: str, intent: Intent, text: str) -> bool:
+        """Whether a stable intent decides the turn without the rest of the utterance"""
+        if intent not in EARLY_COMMIT_INTENTS:
+            return False
+        if intent == Intent.OPT_OUT:
+            return OPT_OUT_MATCHER.match(text).explicit
+        if intent == Intent.AFFIRMATIVE:
+            if not AFFIRMATIVE_ONLY.match(text):
+                return False
+            context = self.state_machine.sessions.load(call_id)
+            if context is None:
+                return False
+            flow = self.state_machine.get_flow(context.call_type)
+            return not flow.table.fields_to_collect.get(context.current_state)
+        return True
+
+    def finalize(self, call_id: str, final_text: str) -> Dict[str, Any]:
+        """
+        Complete the turn with the final transcript
+
+        Returns the early result if the turn was already committed and the
+        final text doesn't opt out where the partial didn't; otherwise
+        processes final_text. Either way the next partial starts a new turn.
+        """
+        sessions = self.state_machine.sessions
+        with sessions.lock(call_id):
+            with self._lock:
+                turn = self._turns.pop(call_id, None)
+            if turn is not None and turn.result is not None:
+                if final_text == turn.committed_text:
+                    return turn.result
+                logger.debug(f"Call {call_id}: final transcript '{final_text}' after early commit")
+                if turn.intent == Intent.OPT_OUT or not self._rewind(call_id, turn, final_text):
+                    return turn.result
+                self.reprocessed_turns += 1
+                logger.info(f"Call {call_id}: final transcript opts out, reprocessing {turn.intent.value} turn")
+            self.final_turns += 1
+            return self.state_machine.process_user_input(call_id, final_text)
+
+    def _rewind(self, call_id: str, turn: _PartialTurn, final_text: str) -> bool:
+        """
+        Restore the call to before an early commit if the final text opts out
+
+        Returns:
+            True if the call was rewound and the turn must be processed again
+        """
+        current = self.state_machine.sessions.load(call_id)
+        if current is None:
+            return False
+        context = deserialize_context(turn.snapshot, current.version)
+        if not self._opts_out(context, final_text):
+            return False
+        self.state_machine.sessions.save(context)
+        return True
+
+    @staticmethod
+    def _opts_out(context: CallContext, text: str) -> bool:
+        """Whether text ends the call: an explicit opt-out, or declining the outbound greeting"""
+        match = OPT_OUT_MATCHER.match(text)
+        if match.explicit:
+            return True
+        return (match.declined and context.call_type == CallType.OUTBOUND
+                and context.current_state == CallState.GREETING)
+
+    def reset(self, call_id: str):
+        """Drop streaming state for a call (e.g. when it ends)"""
+        with self._lock:
+            self._turns.pop(call_id, None)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Counters for partials seen and turns committed early vs at end of speech"""
+        return {
+            "partials_processed": self.partials_processed,
+            "early_commits": self.early_commits,
+            "final_turns": self.final_turns,
+            "reprocessed_turns": self.reprocessed_turns,
+            "open_turns": len(self._turns),
+        }
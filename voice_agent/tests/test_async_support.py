@@ -0,0 +1,129 @@
+"""
+Unit tests for AsyncVoiceAgent
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.async_support import AsyncVoiceAgent, handle_twilio_webhook_async
+from voice_agent.benchmarks.async_turns import run_load_test
+from voice_agent.call_flows import CallType
+from voice_agent.session_store import SQLiteSessionStore
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Executor that counts submitted jobs"""
+    
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+    
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class TestAsyncVoiceAgent(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncVoiceAgent"""
+    
+    async def asyncSetUp(self):
+        """Set up test fixtures"""
+        self.executor = CountingExecutor()
+        self.agent = AsyncVoiceAgent(executor=self.executor)
+    
+    async def asyncTearDown(self):
+        self.agent.close()
+        self.executor.shutdown()
+    
+    async def test_webhook_turn_runs_inline(self):
+        """Test a webhook turn starts the call and processes input without executor hops"""
+        result = await handle_twilio_webhook_async("CA1", "yes", "+15550001111", self.agent)
+        
+        self.assertIn("prompt", result)
+        self.assertIn("CA1", self.agent.state_machine.active_calls)
+        self.assertEqual(
+            self.agent.state_machine.active_calls["CA1"].contact_phone, "+15550001111"
+        )
+        self.assertEqual(self.executor.submitted, 0)
+    
+    async def test_offloaded_turn_is_one_hop(self):
+        """Test offload_turns runs the whole turn as a single executor job"""
+        agent = AsyncVoiceAgent(executor=self.executor, offload_turns=True)
+        
+        await handle_twilio_webhook_async("CA2", "yes", "+15550001111", agent)
+        await handle_twilio_webhook_async("CA2", "sounds good", "+15550001111", agent)
+        
+        self.assertEqual(self.executor.submitted, 2)
+    
+    async def test_io_backed_store_offloads_turns(self):
+        """Test turns leave the event loop by default when the session store does disk I/O"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteSessionStore(os.path.join(tmp, "sessions.db"))
+            agent = AsyncVoiceAgent(VoiceAgentStateMachine(session_store=store), executor=self.executor)
+            
+            self.assertTrue(agent.offload_turns)
+            self.assertFalse(self.agent.offload_turns)
+            result = await handle_twilio_webhook_async("CA3", "yes", "+15550001111", agent)
+            
+            self.assertIn("prompt", result)
+            self.assertIn("CA3", store)
+            self.assertEqual(self.executor.submitted, 1)
+    
+    async def test_io_backed_store_offloads_call_lifecycle(self):
+        """Test start, turn, summary and end all leave the event loop with an I/O-backed store"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteSessionStore(os.path.join(tmp, "sessions.db"))
+            agent = AsyncVoiceAgent(VoiceAgentStateMachine(session_store=store), executor=self.executor)
+            loop_thread = threading.current_thread()
+            threads = []
+            sessions_load = store.load
+            def load(call_id):
+                threads.append(threading.current_thread())
+                return sessions_load(call_id)
+            store.load = load
+            
+            await agent.start_call_async("CA4", CallType.MISSED)
+            await agent.process_user_input_async("CA4", "my AC stopped")
+            summary = await agent.get_call_summary_async("CA4")
+            await agent.end_call_async("CA4")
+            
+            self.assertEqual(summary["call_id"], "CA4")
+            self.assertNotIn("CA4", store)
+            self.assertEqual(self.executor.submitted, 4)
+            self.assertTrue(threads)
+            self.assertNotIn(loop_thread, threads)
+    
+    async def test_run_blocking_uses_dedicated_pool(self):
+        """Test blocking integrations run on the agent's own threads"""
+        agent = AsyncVoiceAgent(max_workers=1)
+        try:
+            name = await agent.run_blocking(lambda: threading.current_thread().name)
+        finally:
+            agent.close()
+        
+        self.assertTrue(name.startswith("voice-agent-io"))
+
+
+class TestAsyncLoad(unittest.TestCase):
+    """Smoke test for the async load test"""
+    
+    def test_load_test_reports_percentiles(self):
+        """Test the load test measures every turn of every call"""
+        results = run_load_test(calls=50, turns=2, think_ms=1.0, modes=("inline", "offload"))
+        
+        for stats in results.values():
+            self.assertEqual(stats["turns"], 100)
+            self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+
+
+if __name__ == '__main__':
+    unittest.main()
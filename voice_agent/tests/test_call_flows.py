@@ -10,11 +10,17 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from voice_agent.call_flows import (
+    CLARIFICATION_QUESTIONS,
     OutboundDiscoveryFlow,
     InboundFlow,
     CallContext,
     CallState,
     CallType,
+    FlowRegistry,
+    HistoryEntry,
+    MAX_HISTORY_ENTRIES,
+    MissedCallFlow,
+    PromptTemplate,
     get_flow_for_call_type
 )
 
@@ -163,6 +169,136 @@ class TestCallFlows(unittest.TestCase):
         inbound = get_flow_for_call_type(CallType.INBOUND)
         self.assertIsInstance(inbound, InboundFlow)
 
+    def test_flow_registry_shares_instances(self):
+        """Flow lookups return the same shared instance"""
+        self.assertIs(
+            get_flow_for_call_type(CallType.MISSED),
+            get_flow_for_call_type(CallType.MISSED)
+        )
+    
+    def test_registered_flows_are_read_only(self):
+        """Shared flow definitions cannot be mutated"""
+        flow = get_flow_for_call_type(CallType.OUTBOUND)
+        
+        with self.assertRaises(TypeError):
+            flow.states[CallState.GREETING] = {}
+        with self.assertRaises(TypeError):
+            flow.states[CallState.GREETING]["prompt"] = "changed"
+        self.assertIsInstance(flow.required_fields[CallState.BUSINESS_DISCOVERY], tuple)
+    
+    def test_register_custom_flow(self):
+        """Custom flows can be registered and replaced"""
+        registry = FlowRegistry()
+        registry.register(CallType.OUTBOUND, OutboundDiscoveryFlow)
+        custom = registry.register(CallType.INBOUND, InboundFlow)
+        
+        self.assertIs(registry.get(CallType.INBOUND), custom)
+        # Unregistered call types fall back to the default flow
+        self.assertIsInstance(registry.get(CallType.MISSED), OutboundDiscoveryFlow)
+        
+        with self.assertRaises(ValueError):
+            registry.register(CallType.INBOUND, InboundFlow)
+        replaced = registry.register(CallType.INBOUND, OutboundDiscoveryFlow, replace=True)
+        self.assertIs(registry[CallType.INBOUND], replaced)
+    
+    def test_transition_table(self):
+        """Compiled tables follow each flow's state sequence"""
+        table = self.outbound_flow.table
+        
+        self.assertEqual(table.next_state[CallState.GREETING], CallState.BUSINESS_DISCOVERY)
+        self.assertEqual(table.next_state[CallState.CLOSING], CallState.COMPLETED)
+        self.assertEqual(self.outbound_flow.next_state_after(CallState.CLARIFYING), CallState.COMPLETED)
+        self.assertEqual(table.required_fields[CallState.OPERATIONS_ASSESSMENT], ("manual_tasks", "biggest_pain"))
+        self.assertEqual(len(table.all_required_fields), 5)
+        
+        missed = MissedCallFlow(CallType.MISSED)
+        self.assertEqual(missed.next_state_after(CallState.GREETING), CallState.OPERATIONS_ASSESSMENT)
+        self.assertEqual(self.inbound_flow.next_state_after(CallState.BUSINESS_DISCOVERY), CallState.CLOSING)
+    
+    def test_prompt_template(self):
+        """Pre-split templates render like str.format"""
+        values = {"name": "Ann", "business_name": "Acme"}
+        for template in ["Hi {name}, is {business_name} open?", "No fields {{here}}", "{name!r} {name:>5}"]:
+            self.assertEqual(PromptTemplate(template).render(values), template.format(**values))
+        self.assertEqual(PromptTemplate("Hi {name}").fields, frozenset({"name"}))
+    
+    def test_registry_recompiles_table(self):
+        """Definitions changed before registration are compiled into the table"""
+        flow = InboundFlow(CallType.INBOUND)
+        flow.states[CallState.GREETING] = dict(flow.states[CallState.GREETING], prompt="Hello {name}")
+        
+        registered = FlowRegistry().register(CallType.INBOUND, flow)
+        
+        self.assertEqual(registered.table.prompts[CallState.GREETING].fields, frozenset({"name"}))
+    
+    def test_prompt_cache(self):
+        """Prompts are reused until their inputs change"""
+        context = CallContext("test", CallType.OUTBOUND, contact_name="Ann")
+        context.current_state = CallState.BUSINESS_DISCOVERY
+        context.missing_fields = {"business_description"}
+        
+        first = self.outbound_flow.get_next_prompt(CallState.CLARIFYING, context)
+        self.assertEqual(first, CLARIFICATION_QUESTIONS["business_description"])
+        self.assertIs(self.outbound_flow.get_next_prompt(CallState.CLARIFYING, context), first)
+        
+        context.missing_fields = {"timeline"}
+        self.assertEqual(self.outbound_flow.get_next_prompt(CallState.CLARIFYING, context),
+                         CLARIFICATION_QUESTIONS["timeline"])
+        
+        greeting = self.outbound_flow.get_next_prompt(CallState.GREETING, context)
+        context.contact_name = "Bob"
+        self.assertIn("Hi Bob", self.outbound_flow.get_next_prompt(CallState.GREETING, context))
+        self.assertIn("Hi Ann", greeting)
+
+
+class TestCallContext(unittest.TestCase):
+    """Test cases for CallContext history"""
+    
+    def test_slots(self):
+        """Test contexts carry no per-instance __dict__"""
+        context = CallContext("test", CallType.INBOUND)
+        
+        self.assertFalse(hasattr(context, "__dict__"))
+        with self.assertRaises(AttributeError):
+            context.unknown_field = 1
+    
+    def test_history_entries(self):
+        """Test history is stored as tuples and rendered as dicts"""
+        context = CallContext("test", CallType.INBOUND)
+        context.add_to_history(CallState.GREETING, "yes", "Hi!")
+        
+        entry = context.history[0]
+        self.assertIsInstance(entry, HistoryEntry)
+        self.assertEqual(entry[:3], ("greeting", "yes", "Hi!"))
+        self.assertGreaterEqual(entry.elapsed, 0.0)
+        
+        rendered = context.conversation_history[0]
+        self.assertEqual(rendered["state"], "greeting")
+        self.assertEqual(rendered["response"], "yes")
+        self.assertIn("T", rendered["timestamp"])
+    
+    def test_history_bounded(self):
+        """Test the oldest entries are dropped past MAX_HISTORY_ENTRIES"""
+        context = CallContext("test", CallType.INBOUND)
+        for i in range(MAX_HISTORY_ENTRIES + 5):
+            context.add_to_history(CallState.BUSINESS_DISCOVERY, f"turn {i}")
+        
+        self.assertEqual(len(context.history), MAX_HISTORY_ENTRIES)
+        self.assertEqual(context.history_count, MAX_HISTORY_ENTRIES + 5)
+        self.assertEqual(context.history[0].response, "turn 5")
+        self.assertEqual([e["response"] for e in context.history_since(MAX_HISTORY_ENTRIES + 3)],
+                         ["turn 53", "turn 54"])
+    
+    def test_legacy_history_dicts(self):
+        """Test history dicts are still accepted by the constructor"""
+        context = CallContext("test", CallType.INBOUND)
+        context.add_to_history(CallState.GREETING, "yes")
+        
+        copy = CallContext("test", CallType.INBOUND, started_at=context.started_at,
+                           conversation_history=context.conversation_history)
+        
+        self.assertEqual(copy.conversation_history, context.conversation_history)
+
 
 if __name__ == '__main__':
     unittest.main()
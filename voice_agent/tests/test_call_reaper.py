@@ -0,0 +1,149 @@
+"""
+Unit tests for IdleCallReaper
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.call_flows import CallType
+from voice_agent.call_reaper import IdleCallReaper, SummaryFileSink
+from voice_agent.session_store import SQLiteSessionStore
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIdleCallReaper(unittest.TestCase):
+    """Test cases for IdleCallReaper"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.clock = FakeClock()
+        self.expired = []
+        self.sm = VoiceAgentStateMachine()
+        self.reaper = IdleCallReaper(self.sm, idle_timeout=60, on_expire=self.expired.append, clock=self.clock)
+    
+    def test_idle_call_expires_with_summary(self):
+        """Test a call with no turns for idle_timeout is removed and persisted"""
+        self.sm.start_call("CA1", CallType.INBOUND, {"contact_phone": "+15550001111"})
+        self.sm.process_user_input("CA1", "We're a small law firm")
+        
+        self.clock.now += 59
+        self.assertEqual(self.reaper.reap(), 0)
+        self.clock.now += 2
+        self.assertEqual(self.reaper.reap(), 1)
+        
+        self.assertNotIn("CA1", self.sm.active_calls)
+        self.assertEqual(len(self.expired), 1)
+        self.assertEqual(self.expired[0]["call_id"], "CA1")
+        self.assertEqual(self.expired[0]["end_reason"], "idle_timeout")
+        self.assertEqual(self.expired[0]["data_collected"]["industry"], "legal")
+    
+    def test_activity_extends_deadline(self):
+        """Test each turn resets the idle timeout"""
+        self.sm.start_call("CA1", CallType.INBOUND)
+        self.clock.now += 50
+        self.sm.process_user_input("CA1", "yes")
+        self.clock.now += 50
+        
+        self.assertEqual(self.reaper.reap(), 0)
+        self.assertIn("CA1", self.sm.active_calls)
+    
+    def test_ended_calls_are_not_expired(self):
+        """Test end_call stops tracking"""
+        self.sm.start_call("CA1", CallType.INBOUND)
+        self.sm.end_call("CA1")
+        self.clock.now += 120
+        
+        self.assertEqual(self.reaper.reap(), 0)
+        self.assertEqual(self.expired, [])
+        self.assertEqual(self.reaper.get_metrics()["tracked_calls"], 0)
+    
+    def test_heap_stays_bounded(self):
+        """Test stale heap entries from many turns are compacted"""
+        self.sm.start_call("CA1", CallType.INBOUND)
+        for _ in range(1000):
+            self.sm.process_user_input("CA1", "yes")
+        
+        self.assertLess(self.reaper.get_metrics()["heap_entries"], 100)
+    
+    def test_failing_hook_still_evicts(self):
+        """Test calls are removed even if the on_expire hook raises"""
+        def broken(summary):
+            raise IOError("disk full")
+        self.reaper.on_expire = broken
+        self.sm.start_call("CA1", CallType.INBOUND)
+        self.clock.now += 61
+        
+        self.assertEqual(self.reaper.reap(), 1)
+        metrics = self.reaper.get_metrics()
+        self.assertEqual(metrics["expire_hook_errors"], 1)
+        self.assertEqual(metrics["evicted_total"], 1)
+        self.assertEqual(metrics["active_calls"], 0)
+    
+    def test_hook_runs_without_call_lock(self):
+        """Test on_expire runs after the call's lock is released"""
+        acquired = []
+        def hook(summary):
+            def take_lock():
+                with self.sm.sessions.lock(summary["call_id"]):
+                    acquired.append(True)
+            thread = threading.Thread(target=take_lock)
+            thread.start()
+            thread.join(timeout=1.0)
+        self.reaper.on_expire = hook
+        self.sm.start_call("CA1", CallType.INBOUND)
+        self.clock.now += 61
+        
+        self.assertEqual(self.reaper.reap(), 1)
+        self.assertEqual(acquired, [True])
+    
+    def test_turn_on_another_worker_reschedules(self):
+        """Test a call updated by another worker via a shared store is not expired"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sessions.db")
+            worker_a = VoiceAgentStateMachine(session_store=SQLiteSessionStore(path))
+            worker_b = VoiceAgentStateMachine(session_store=SQLiteSessionStore(path))
+            reaper = IdleCallReaper(worker_a, idle_timeout=60, clock=self.clock)
+            
+            worker_a.start_call("CA1", CallType.INBOUND)
+            worker_b.process_user_input("CA1", "yes")
+            self.clock.now += 61
+            
+            self.assertEqual(reaper.reap(), 0)
+            self.assertEqual(reaper.get_metrics()["rescheduled_total"], 1)
+            self.assertIn("CA1", worker_a.active_calls)
+            worker_a.sessions.close()
+            worker_b.sessions.close()
+    
+    def test_summary_file_sink(self):
+        """Test the JSON-lines sink appends one summary per expired call"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "expired", "calls.jsonl")
+            self.reaper.on_expire = SummaryFileSink(path)
+            for call_id in ("CA1", "CA2"):
+                self.sm.start_call(call_id, CallType.MISSED)
+            self.clock.now += 61
+            self.reaper.reap()
+            
+            with open(path, encoding="utf-8") as f:
+                summaries = [json.loads(line) for line in f]
+        
+        self.assertEqual(sorted(s["call_id"] for s in summaries), ["CA1", "CA2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
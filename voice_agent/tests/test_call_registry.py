@@ -0,0 +1,118 @@
+"""
+Unit tests for CallRegistry
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.call_flows import CallContext, CallState, CallType
+from voice_agent.call_registry import CallRegistry
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+def make_context(call_id: str) -> CallContext:
+    return CallContext(call_id=call_id, call_type=CallType.INBOUND, current_state=CallState.GREETING)
+
+
+class TestCallRegistry(unittest.TestCase):
+    """Test cases for CallRegistry"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.registry = CallRegistry(shards=4)
+    
+    def test_mapping_interface(self):
+        """Test the registry behaves like the dict it replaces"""
+        for i in range(10):
+            self.registry[f"CA{i}"] = make_context(f"CA{i}")
+        del self.registry["CA3"]
+        
+        self.assertEqual(len(self.registry), 9)
+        self.assertIn("CA1", self.registry)
+        self.assertNotIn("CA3", self.registry)
+        self.assertIsNone(self.registry.get("CA3"))
+        self.assertEqual(sorted(self.registry), sorted(f"CA{i}" for i in range(10) if i != 3))
+        with self.assertRaises(KeyError):
+            del self.registry["CA3"]
+    
+    def test_call_lock_serializes_and_counts_contention(self):
+        """Test one call's lock excludes other threads and records the wait"""
+        self.registry["CA1"] = make_context("CA1")
+        holding = threading.Event()
+        order = []
+        
+        def holder():
+            with self.registry.lock("CA1"):
+                holding.set()
+                time.sleep(0.05)
+                order.append("holder")
+        
+        thread = threading.Thread(target=holder)
+        thread.start()
+        holding.wait()
+        with self.registry.lock("CA1"):
+            order.append("waiter")
+        thread.join()
+        
+        self.assertEqual(order, ["holder", "waiter"])
+        metrics = self.registry.get_metrics()
+        self.assertEqual(metrics["lock_acquisitions"], 2)
+        self.assertEqual(metrics["lock_contended"], 1)
+        self.assertGreater(metrics["max_lock_wait_seconds"], 0.01)
+    
+    def test_lock_is_reentrant(self):
+        """Test nested lock() calls from the same thread don't deadlock"""
+        with self.registry.lock("CA1"):
+            with self.registry.lock("CA1"):
+                self.registry["CA1"] = make_context("CA1")
+        
+        self.assertIn("CA1", self.registry)
+    
+    def test_locks_for_unknown_calls_are_released(self):
+        """Test locks taken for unregistered call ids don't accumulate"""
+        for i in range(100):
+            with self.registry.lock(f"missing{i}"):
+                pass
+        
+        self.assertEqual(sum(len(shard.call_locks) for shard in self.registry._shards), 0)
+
+
+class TestConcurrentTurns(unittest.TestCase):
+    """Test concurrent turns through VoiceAgentStateMachine"""
+    
+    def test_concurrent_turns_for_one_call_are_serialized(self):
+        """Test no turn is lost when many threads process the same call"""
+        sm = VoiceAgentStateMachine()
+        sm.start_call("CA1", CallType.INBOUND)
+        acquisitions_before = sm.active_calls.get_metrics()["lock_acquisitions"]
+        errors = []
+        
+        def caller():
+            try:
+                for _ in range(25):
+                    sm.process_user_input("CA1", "it's for a small office downtown")
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=caller) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        metrics = sm.active_calls.get_metrics()
+        self.assertEqual(metrics["lock_acquisitions"] - acquisitions_before, 200)
+        self.assertEqual(sm.active_calls["CA1"].version, 201)
+        self.assertIsNotNone(sm.end_call("CA1"))
+        self.assertNotIn("CA1", sm.active_calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Unit tests for per-field extraction in call flows
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.benchmarks.field_extraction import run_benchmark
+from voice_agent.call_flows import (
+    CallContext, CallState, CallType, FlowRegistry, InboundFlow, MissedCallFlow, OutboundDiscoveryFlow
+)
+from voice_agent.field_extractors import (
+    extract_callback_window, extract_contact_name, extract_decision_maker, extract_timeline
+)
+
+
+class TestFieldExtractors(unittest.TestCase):
+    """Test cases for field extractors and CallFlow.collect_fields"""
+
+    def test_extractors(self):
+        """Test individual extractors return the value or None"""
+        self.assertEqual(extract_timeline("Probably next quarter, once hiring settles"), "next quarter")
+        self.assertEqual(extract_callback_window("Tomorrow 9–11am is best."), "Tomorrow 9–11am")
+        self.assertEqual(extract_decision_maker("I’m the owner"), "yes")
+        self.assertEqual(extract_decision_maker("Yes, but I need to check with my wife"), "no")
+        self.assertEqual(extract_contact_name("It’s Sam Lee"), "Sam Lee")
+        self.assertIsNone(extract_timeline("We'll see"))
+
+    def test_business_discovery_stores_values_not_copies(self):
+        """Test only the required field keeps the raw response"""
+        flow = OutboundDiscoveryFlow(CallType.OUTBOUND)
+        context = CallContext("t", CallType.OUTBOUND)
+        response = "We're a law firm with a small team serving families"
+
+        flow.process_response(CallState.BUSINESS_DISCOVERY, response, context)
+
+        self.assertEqual(context.collected_data, {
+            "business_description": response,
+            "industry": "legal",
+            "size": "small",
+            "customers": "residential",
+        })
+
+    def test_required_field_falls_back_to_raw(self):
+        """Test a required field is stored raw when its extractor finds nothing"""
+        flow = OutboundDiscoveryFlow(CallType.OUTBOUND)
+        context = CallContext("t", CallType.OUTBOUND)
+
+        flow.process_response(CallState.TIMELINE_INTEREST, "Whenever the budget frees up", context)
+
+        self.assertEqual(context.collected_data, {"timeline": "Whenever the budget frees up"})
+
+    def test_missed_call_fields(self):
+        """Test missed-call triage fields are extracted"""
+        flow = MissedCallFlow(CallType.MISSED)
+        context = CallContext("t", CallType.MISSED)
+
+        flow.process_response(CallState.TIMELINE_INTEREST, "Tomorrow 9-11am. Please don't text, call me.", context)
+
+        self.assertEqual(context.collected_data, {"callback_window": "Tomorrow 9-11am", "text_ok": "no"})
+
+    def test_flow_override(self):
+        """Test FIELD_EXTRACTORS on a flow class overrides the registry"""
+        class UpperEmailFlow(InboundFlow):
+            FIELD_EXTRACTORS = {"email": lambda text: text.upper()}
+
+        flow = FlowRegistry().register(CallType.INBOUND, UpperEmailFlow)
+        context = CallContext("t", CallType.INBOUND)
+        flow.process_response(CallState.CLOSING, "a@b.co", context)
+
+        self.assertEqual(context.collected_data["email"], "A@B.CO")
+
+    def test_benchmark_payload(self):
+        """Test extraction shrinks collected data per call"""
+        report = run_benchmark(calls=200)
+        self.assertLess(report["extracted"]["data_bytes_per_call"], report["raw"]["data_bytes_per_call"])
+
+
+if __name__ == '__main__':
+    unittest.main()
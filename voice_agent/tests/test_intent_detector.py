@@ -3,13 +3,15 @@ Unit tests for IntentDetector
 """
 
 import unittest
+import json
 import sys
 import os
+import tempfile
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from voice_agent.intent_detector import IntentDetector, Intent
+from voice_agent.intent_detector import IntentDetector, Intent, load_transcript_utterances
 
 
 class TestIntentDetector(unittest.TestCase):
@@ -108,6 +110,85 @@ class TestIntentDetector(unittest.TestCase):
         intent, confidence = self.detector.detect(text)
         self.assertEqual(intent, Intent.CONTINUE)
         self.assertGreater(confidence, 0.5)
+    
+    def test_compiled_patterns_match_sequential_search(self):
+        """Test precompiled classifier returns the same result as per-pattern re.search"""
+        from voice_agent.benchmarks.intent_turn import UTTERANCES, sequential_detect
+        
+        extra = ["WHAT?", "Yes, Stop", "I'm not sure, can you transfer me", "Nah.", "   "]
+        for text in UTTERANCES + extra:
+            self.assertEqual(
+                self.detector.detect(text), sequential_detect(self.detector, text),
+                f"Mismatch for: {text!r}"
+            )
+    
+    def test_patterns_compiled_once(self):
+        """Test detectors share compiled patterns"""
+        other = IntentDetector()
+        for (_, _, a), (_, _, b) in zip(self.detector._compiled_intents, other._compiled_intents):
+            self.assertIs(a, b)
+
+
+
+class TestIntentCache(unittest.TestCase):
+    """Test cases for memoized detection"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.detector = IntentDetector(cache_size=4)
+    
+    def test_hits_keyed_on_normalized_text(self):
+        """Test repeated utterances hit the cache after case/whitespace normalization"""
+        first = self.detector.detect("Yes")
+        second = self.detector.detect("  yes ")
+        
+        self.assertEqual(first, second)
+        stats = self.detector.cache_stats()['detect']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+    
+    def test_cache_is_bounded(self):
+        """Test the cache never holds more than cache_size utterances"""
+        for i in range(10):
+            self.detector.detect(f"utterance number {i}")
+        
+        self.assertEqual(self.detector.cache_stats()['detect']['size'], 4)
+    
+    def test_cached_entities_are_copies(self):
+        """Test mutating a returned entity dict does not affect later calls"""
+        text = "my email is jane@example.com"
+        self.detector.extract_entities(text)['email'] = 'changed'
+        
+        self.assertEqual(self.detector.extract_entities(text)['email'], 'jane@example.com')
+        self.assertEqual(self.detector.cache_stats()['entities']['hits'], 1)
+    
+    def test_cache_disabled(self):
+        """Test cache_size=0 computes every time"""
+        detector = IntentDetector(cache_size=0)
+        detector.detect("yes")
+        detector.detect("yes")
+        
+        self.assertEqual(detector.cache_stats()['detect']['hits'], 0)
+        self.assertEqual(detector.warm_cache(["yes"]), 0)
+    
+    def test_warm_from_transcripts(self):
+        """Test pre-warming from saved simulate_call sessions keeps the most frequent"""
+        with tempfile.TemporaryDirectory() as tmp:
+            for i, caller_lines in enumerate([["yes", "ok", "what?"], ["yes", "ok", "no thanks"], ["yes"]]):
+                session = {"transcript": [{"speaker": "agent", "text": "Hi!"}] + [
+                    {"speaker": "caller", "text": line} for line in caller_lines
+                ]}
+                with open(os.path.join(tmp, f"session_{i}.json"), "w", encoding="utf-8") as f:
+                    json.dump(session, f)
+            with open(os.path.join(tmp, "broken.json"), "w", encoding="utf-8") as f:
+                f.write("{")
+            
+            self.assertEqual(len(load_transcript_utterances(tmp)), 7)
+            detector = IntentDetector(cache_size=2)
+            self.assertEqual(detector.warm_from_transcripts(tmp), 2)
+        
+        detector.detect("yes")
+        detector.detect("ok")
+        self.assertEqual(detector.cache_stats()['detect']['hits'], 2)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,114 @@
+"""
+Unit tests for KeywordMatcher and compiled entity extraction
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.benchmarks.entity_turn import legacy_extract_entities, run_benchmark
+from voice_agent.benchmarks.intent_turn import UTTERANCES
+from voice_agent.intent_detector import IntentDetector
+from voice_agent.keyword_matcher import KeywordMatcher, compile_keywords, match_keywords_reference
+from lead_engine.lead_processor import LeadProcessor
+
+
+# Generous default so slow CI machines don't flake; tighten locally via env var
+ENTITY_BUDGET_US = float(os.getenv("VOICE_AGENT_ENTITY_BUDGET_US", "50"))
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test cases for KeywordMatcher"""
+    
+    def test_first_category_wins_regardless_of_position(self):
+        """Test higher-priority category wins even if it occurs later in the text"""
+        matcher = KeywordMatcher({'legal': ['law'], 'ecommerce': ['shop']})
+        
+        match = matcher.find("shop owner, also a law office")
+        
+        self.assertEqual(match.category, 'legal')
+        self.assertEqual(match.keyword, 'law')
+        self.assertEqual(match.span, (19, 22))
+    
+    def test_substring_semantics(self):
+        """Test keywords match inside words, like `keyword in text`"""
+        matcher = KeywordMatcher({'healthcare': ['health'], 'technology': ['it']})
+        
+        self.assertEqual(matcher.category("healthcare group"), 'healthcare')
+        self.assertEqual(matcher.category("digital agency"), 'technology')
+        self.assertIsNone(matcher.category("bakery"))
+    
+    def test_matches_reference_loop(self):
+        """Test random texts give the same category as the plain loop"""
+        rng = random.Random(7)
+        for mapping in (LeadProcessor.INDUSTRY_MAPPINGS, IntentDetector.INDUSTRY_KEYWORDS):
+            matcher = KeywordMatcher(mapping)
+            vocabulary = [k for keywords in mapping.values() for k in keywords] + ['lawn', 'the', 'x']
+            for _ in range(2000):
+                words = [rng.choice(vocabulary)[:rng.randint(1, 12)] for _ in range(rng.randint(0, 5))]
+                text = ' '.join(words) if rng.random() < 0.5 else ''.join(words)
+                self.assertEqual(matcher.category(text), match_keywords_reference(mapping, text), text)
+    
+    def test_regex_mode(self):
+        """Test regex patterns keep category priority and word boundaries"""
+        matcher = KeywordMatcher(IntentDetector.SIZE_PATTERNS, regex=True)
+        
+        self.assertEqual(matcher.category("medium sized, 12 employees"), 'small')
+        self.assertEqual(matcher.category("growing team, but really just me"), 'solo')
+        self.assertIsNone(matcher.category("consolo"))
+    
+    def test_compiled_matchers_are_shared(self):
+        """Test equal dictionaries share one compiled matcher"""
+        self.assertIs(
+            compile_keywords(dict(LeadProcessor.INDUSTRY_MAPPINGS)),
+            LeadProcessor()._industry_matcher
+        )
+
+
+class TestEntityExtraction(unittest.TestCase):
+    """Test cases for compiled IntentDetector entity extraction"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.detector = IntentDetector()
+    
+    def test_matches_legacy_extraction(self):
+        """Test extract_entities returns the same entities as before"""
+        extra = [
+            "Email ME at Jane.Doe@Example.org or 555.123.4567",
+            "we're a realty shop with 8-staff",
+            "local plumber, one person show",
+        ]
+        for text in UTTERANCES + extra:
+            self.assertEqual(
+                self.detector.extract_entities(text),
+                legacy_extract_entities(self.detector, text),
+                f"Mismatch for: {text!r}"
+            )
+    
+    def test_entity_spans_and_confidence(self):
+        """Test entity matches carry spans into the input and a confidence"""
+        text = "I'm a lawyer, reach me at sam@firm.com"
+        matches = self.detector.extract_entity_matches(text)
+        
+        email = matches['email']
+        self.assertEqual(text[email.span[0]:email.span[1]], "sam@firm.com")
+        industry = matches['industry']
+        self.assertEqual(industry.value, 'legal')
+        self.assertEqual(text[industry.span[0]:industry.span[1]], "lawyer")
+        for match in matches.values():
+            self.assertTrue(0 < match.confidence <= 1)
+    
+    def test_extraction_within_budget(self):
+        """Test mean per-turn extraction time stays within budget"""
+        results = run_benchmark(turns=5000)
+        
+        self.assertLess(results['compiled']['mean_us'], ENTITY_BUDGET_US)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Unit tests for the load simulation harness
+"""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.call_flows import CallType
+from voice_agent.load_simulation import LatencyHistogram, Scenario, load_corpus, run_load_simulation
+from voice_agent.session_log import SessionLogReader
+from voice_agent.simulate_call import SESSION_KEY
+
+
+class TestLoadSimulation(unittest.TestCase):
+    """Test cases for the load simulation"""
+
+    def test_default_corpus(self):
+        """Test the shipped corpus parses and randomized slots pick one line"""
+        scenarios = load_corpus()
+        self.assertIn("missed_call", [scenario.name for scenario in scenarios])
+
+        scenario = Scenario("s", CallType.INBOUND, ["fixed", ["a", "b"]])
+        script = scenario.script(random.Random(1))
+        self.assertEqual(script[0], "fixed")
+        self.assertIn(script[1], ("a", "b"))
+
+    def test_histogram(self):
+        """Test bucket placement and percentiles"""
+        histogram = LatencyHistogram(bounds=(1.0, 10.0))
+        for value in (0.5, 1.0, 5.0, 50.0):
+            histogram.record(value)
+
+        self.assertEqual(histogram.buckets(), {"<=1.0ms": 2, "<=10.0ms": 1, ">10.0ms": 1})
+        self.assertEqual(histogram.percentile(0.5), 5.0)
+
+    def test_run_writes_session_log(self):
+        """Test a concurrent run logs every call to the session log"""
+        with tempfile.TemporaryDirectory() as tmp:
+            report = run_load_simulation(calls=50, arrival_rate=0, think_ms=1, log_dir=tmp, summary_workers=1)
+            sessions = list(SessionLogReader(tmp).iter_records())
+
+        self.assertEqual(report["calls"], 50)
+        self.assertEqual(len(sessions), 50)
+        self.assertEqual(report["turns"], sum(len(s["turn_latency_ms"]) for s in sessions))
+        self.assertGreater(report["peak_active_calls"], 1)
+        self.assertEqual(sum(report["turn_latency_histogram"].values()), report["turns"])
+        # Summaries are a batch stage after the run, not part of the call path
+        self.assertFalse(any("owner_summary" in s for s in sessions))
+        self.assertEqual(report["owner_summaries"], 50)
+
+    def test_runs_sharing_log_dir_keep_call_ids_apart(self):
+        """Test two runs into one directory don't reuse call ids"""
+        with tempfile.TemporaryDirectory() as tmp:
+            for _ in range(2):
+                report = run_load_simulation(calls=5, arrival_rate=0, think_ms=0, log_dir=tmp)
+                self.assertEqual(report["session_log_dropped"], 0)
+            call_ids = [s["session_id"] for s in SessionLogReader(tmp, key=SESSION_KEY).iter_records()]
+
+        self.assertEqual(len(call_ids), 10)
+        self.assertEqual(len(set(call_ids)), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
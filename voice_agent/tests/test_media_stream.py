@@ -0,0 +1,180 @@
+"""
+Unit tests for the media streams WebSocket server
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.async_support import generate_media_stream_twiml
+from voice_agent.benchmarks.media_stream_turns import SILENCE_FRAME, SPEECH_FRAME, FakeMediaClient
+from voice_agent.call_flows import CallType
+from voice_agent.media_stream import (
+    OP_TEXT, MediaStreamServer, ScriptedSpeechToText, WebSocket, accept_key, encode_frame
+)
+from voice_agent.prompt_audio import OfflineTTSBackend, mulaw_payload
+from voice_agent.session_store import SQLiteSessionStore
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+class TestWebSocketProtocol(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the RFC 6455 helpers"""
+
+    def test_accept_key(self):
+        """Test the handshake key from RFC 6455 section 1.3"""
+        self.assertEqual(accept_key("dGhlIHNhbXBsZSBub25jZQ=="), "s3pPLMBiTxaQ9kYGzzhZRbK+xOo=")
+
+    async def test_frame_round_trip(self):
+        """Test masked frames of every length encoding decode back"""
+        for size in (5, 300, 70000):
+            message = "x" * size
+            reader = asyncio.StreamReader()
+            reader.feed_data(encode_frame(OP_TEXT, message.encode(), mask=True))
+            ws = WebSocket(reader, writer=None)
+            self.assertEqual(await ws.recv(), message)
+
+    def test_stream_twiml(self):
+        """Test the TwiML that connects a call to the stream server"""
+        twiml = generate_media_stream_twiml("wss://agent.test/media", {"call_type": "missed"})
+        self.assertIn('<Connect><Stream url="wss://agent.test/media">'
+                      '<Parameter name="call_type" value="missed"/></Stream></Connect>', twiml)
+
+    def test_mulaw_payload(self):
+        """Test prompt WAVs are reduced to their raw mu-law data"""
+        wav = OfflineTTSBackend().synthesize("hello there", "alice")
+        payload = mulaw_payload(wav)
+        self.assertEqual(len(payload), 2 * 0.35 * 8000)
+        self.assertEqual(set(payload), {0xFF})
+
+
+class TestScriptedSpeechToText(unittest.TestCase):
+    """Test cases for the offline STT stub"""
+
+    def test_partials_and_endpoint(self):
+        """Test partials per word and a final transcript after silence"""
+        stt = ScriptedSpeechToText(["stop calling me"], frames_per_word=2, endpoint_frames=3)
+        transcripts = []
+        for frame in [SPEECH_FRAME] * 6 + [SILENCE_FRAME] * 3:
+            transcripts.extend(stt.accept(frame))
+
+        self.assertEqual([t.text for t in transcripts if not t.is_final], ["stop", "stop calling", "stop calling me"])
+        self.assertEqual(transcripts[-1], ("stop calling me", True))
+        self.assertEqual(stt.accept(SPEECH_FRAME), [])
+
+
+class TestMediaStreamServer(unittest.IsolatedAsyncioTestCase):
+    """End-to-end tests with a fake media client"""
+
+    async def asyncSetUp(self):
+        self.server = MediaStreamServer(port=0)
+        self.port = await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_missed_call(self):
+        """Test a full scripted call over the WebSocket"""
+        client = FakeMediaClient("127.0.0.1", self.port, realtime=False)
+        script = [
+            "I'm in Irvine and my AC stopped",
+            "Pretty urgent tonight",
+            "Tomorrow morning works and texting is fine",
+            "Jake",
+        ]
+        latencies = await client.run_call("CA_MISSED", CallType.MISSED, script)
+
+        self.assertEqual(len(latencies), 4)
+        self.assertEqual(client.marks, ["turn-0", "turn-1", "turn-2", "turn-3", "turn-4", "hangup"])
+        self.assertGreater(client.audio_bytes, 0)
+        metrics = self.server.get_metrics()
+        self.assertEqual(metrics["turns"], 4)
+        self.assertIn("turn_latency_p99_ms", metrics)
+        await asyncio.sleep(0.05)
+        self.assertNotIn("CA_MISSED", self.server.state_machine.sessions)
+
+    async def test_early_commit(self):
+        """Test an opt-out is answered from partial transcripts"""
+        client = FakeMediaClient("127.0.0.1", self.port, realtime=False)
+        await client.run_call("CA_OPT_OUT", CallType.OUTBOUND, ["Please stop calling me I told you guys already"])
+
+        self.assertEqual(client.marks, ["turn-0", "turn-1", "hangup"])
+        self.assertEqual(self.server.streaming.get_metrics()["early_commits"], 1)
+
+    async def test_invalid_messages_close_connection(self):
+        """Test malformed events close the connection instead of leaking it"""
+        messages = [
+            "not json",
+            '{"event": "start", "start": {"streamSid": "MZ1"}}',
+            '{"event": "start", "start": {"streamSid": "MZ2", "callSid": "CA_BAD",'
+            ' "customParameters": {"call_type": "bogus"}}}',
+            "[]",
+            '"hi"',
+            '{"event": "start", "start": "x"}',
+            '{"event": "start", "start": {"streamSid": "MZ3", "callSid": "CA_BAD", "customParameters": []}}',
+        ]
+        for message in messages:
+            with self.assertLogs("voice_agent.media_stream", "WARNING"):
+                ws = await WebSocket.connect("127.0.0.1", self.port, "/media")
+                await ws.send(message)
+                self.assertIsNone(await asyncio.wait_for(ws.recv(), timeout=2), message)
+                await ws.close()
+
+    async def test_invalid_media_closes_and_ends_call(self):
+        """Test a malformed media event or a second start closes the connection and ends the call"""
+        start = {"event": "start", "start": {"streamSid": "MZ4", "callSid": "CA_MEDIA"}}
+        for second in ({"event": "media", "media": "x"}, {"event": "media", "media": {"payload": 1}}, start):
+            with self.assertLogs("voice_agent.media_stream", "WARNING"):
+                ws = await WebSocket.connect("127.0.0.1", self.port, "/media")
+                await ws.send_json(start)
+                await ws.send_json(second)
+                while await asyncio.wait_for(ws.recv(), timeout=2) is not None:
+                    pass  # greeting audio and marks
+                await ws.close()
+            await asyncio.sleep(0.05)
+            self.assertNotIn("CA_MEDIA", self.server.state_machine.sessions)
+
+    async def test_io_backed_store_runs_off_the_loop(self):
+        """Test session store access and prompt synthesis use the server's executor"""
+        loop_thread = threading.current_thread()
+        threads = []
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteSessionStore(os.path.join(tmp, "sessions.db"))
+            load = store.load
+            def tracked_load(call_id):
+                threads.append(threading.current_thread())
+                return load(call_id)
+            store.load = tracked_load
+            executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="media-test")
+            server = MediaStreamServer(VoiceAgentStateMachine(session_store=store), port=0, executor=executor)
+            port = await server.start()
+            try:
+                client = FakeMediaClient("127.0.0.1", port, realtime=False)
+                await client.run_call("CA_SQL", CallType.OUTBOUND, ["Please stop calling me I told you guys already"])
+            finally:
+                await server.close()
+                executor.shutdown()
+
+        self.assertEqual(client.marks, ["turn-0", "turn-1", "hangup"])
+        self.assertTrue(threads)
+        self.assertNotIn(loop_thread, threads)
+        self.assertTrue(all(thread.name.startswith("media-test") for thread in threads))
+
+    async def test_rejects_plain_http(self):
+        """Test non-WebSocket requests get a 400"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"GET /media HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 400"))
+
+
+if __name__ == '__main__':
+    unittest.main()
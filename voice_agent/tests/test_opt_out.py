@@ -0,0 +1,93 @@
+"""
+Unit tests for the shared opt-out phrase matcher
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.call_flows import CallContext, CallState, CallType, OutboundDiscoveryFlow
+from voice_agent.opt_out import (
+    EXPLICIT_OPT_OUT_PHRASES, GREETING_DECLINE_PHRASES, OPT_OUT_MATCHER, OptOutMatcher
+)
+from voice_agent.state_machine import VoiceAgentStateMachine
+
+
+UTTERANCES = [
+    "Not interested, please remove me from whatever list this is.",
+    "Wrong number, stop calling.",
+    "No AC tonight and we've got kids.",
+    "No thank you, I'm busy.",
+    "Call me later this week",
+    "no",
+    "  Nope ",
+    "No thanks",
+    "Yes, now is a good time, go ahead.",
+    "Please unsubscribe me",
+    "Don't call this number again",
+    "Do not call me",
+]
+
+
+def legacy_explicit(text: str) -> bool:
+    """Previous state machine check"""
+    return any(phrase in text.lower() for phrase in EXPLICIT_OPT_OUT_PHRASES)
+
+
+def legacy_declined(text: str) -> bool:
+    """Previous OutboundDiscoveryFlow greeting check"""
+    text = text.lower().strip()
+    return any(phrase in text for phrase in GREETING_DECLINE_PHRASES) or text in {"no", "nah", "nope"}
+
+
+class TestOptOutMatcher(unittest.TestCase):
+    """Test cases for OptOutMatcher"""
+
+    def test_matches_previous_checks(self):
+        """Test one pass gives the same answers as the separate phrase loops"""
+        for text in UTTERANCES:
+            match = OPT_OUT_MATCHER.match(text)
+            self.assertEqual(match.explicit, legacy_explicit(text), text)
+            self.assertEqual(match.declined, legacy_declined(text), text)
+
+    def test_overlapping_phrases_match_first_only(self):
+        """Test phrases sharing characters count once, unlike the old checks"""
+        text = "not interestedon't call"
+        match = OPT_OUT_MATCHER.match(text)
+
+        self.assertEqual(match.phrase, "not interested")
+        self.assertTrue(match.explicit)
+        self.assertFalse(match.declined)
+        self.assertTrue(legacy_declined(text))
+        # With a space between them both phrases are found
+        self.assertTrue(OPT_OUT_MATCHER.match("not interested don't call").declined)
+
+    def test_contained_phrase_credits_its_sets(self):
+        """Test a phrase inside a longer one still counts for its own set"""
+        matcher = OptOutMatcher({"a": ["call later"], "b": ["later"]})
+        self.assertEqual(matcher.match("Call later please").phrase_sets, frozenset(("a", "b")))
+
+    def test_outbound_greeting_decline(self):
+        """Test OutboundDiscoveryFlow declines the greeting on a bare no"""
+        flow = OutboundDiscoveryFlow(CallType.OUTBOUND)
+        context = CallContext("o2", CallType.OUTBOUND)
+
+        self.assertEqual(flow.process_response(CallState.GREETING, "nah", context), CallState.OPTED_OUT)
+
+    def test_missed_call_needs_explicit_phrase(self):
+        """Test a bare "no" doesn't end a missed call but an explicit opt-out does"""
+        sm = VoiceAgentStateMachine()
+        sm.start_call("m1", CallType.MISSED)
+
+        result = sm.process_user_input("m1", "No AC tonight, I'm in Irvine")
+        self.assertEqual(result["state"], "operations_assessment")
+
+        result = sm.process_user_input("m1", "Actually, stop calling me")
+        self.assertEqual(result["state"], "opted_out")
+        self.assertTrue(result["should_end"])
+
+
+if __name__ == '__main__':
+    unittest.main()
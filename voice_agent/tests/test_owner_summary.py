@@ -0,0 +1,82 @@
+"""
+Unit tests for owner summary normalization and batch rendering
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.call_flows import CallType
+from voice_agent.owner_summary import (
+    best_city_from_text, build_owner_summary, normalize_missed_fields, summarize_sessions
+)
+from voice_agent import simulate_call
+
+
+MISSED_DATA = {
+    "location": "I'm in Irvine — my AC stopped and the house is getting hot.",
+    "issue": "I'm in Irvine — my AC stopped and the house is getting hot.",
+    "urgency": "Pretty urgent. No AC tonight.",
+    "callback_window": "Tomorrow 9–11am is best. Yes, texting is fine if you can't reach me.",
+    "text_ok": "Tomorrow 9–11am is best. Yes, texting is fine if you can't reach me.",
+    "contact_name": "Jake",
+}
+
+
+def make_session(i: int, call_type: CallType = CallType.MISSED) -> dict:
+    return {
+        "session_id": f"S{i}",
+        "call_type": call_type.value,
+        "caller_phone": "+19495550123",
+        "transcript": [{"speaker": "caller", "text": "long transcript " * 20}],
+        "last_state": "completed",
+        "last_intent": "unknown",
+        "data_collected": dict(MISSED_DATA, contact_name=f"Caller {i}"),
+    }
+
+
+class TestOwnerSummary(unittest.TestCase):
+    """Test cases for owner_summary"""
+
+    def test_normalize_missed_fields(self):
+        """Test polluted raw fields are reduced to a clean summary"""
+        norm = normalize_missed_fields(MISSED_DATA)
+
+        self.assertEqual(norm["location"], "Irvine")
+        self.assertEqual(norm["callback_window"], "tomorrow 9–11am")
+        self.assertEqual(norm["text_ok"], "yes")
+        self.assertEqual(normalize_missed_fields({"text_ok": "texting is fine but no texts after 9"})["text_ok"], "no")
+        self.assertEqual(normalize_missed_fields({})["text_ok"], "yes")
+
+    def test_city_cache(self):
+        """Test city extraction is cached per unique text"""
+        best_city_from_text.cache_clear()
+        for _ in range(3):
+            self.assertEqual(best_city_from_text("We're at Costa Mesa, near the mall"), "Costa Mesa")
+        self.assertEqual(best_city_from_text.cache_info().hits, 2)
+
+    def test_simulate_call_names_still_importable(self):
+        """Test the helpers moved out of simulate_call are re-exported there"""
+        self.assertIs(simulate_call.build_owner_summary, build_owner_summary)
+        self.assertIs(simulate_call.normalize_missed_fields, normalize_missed_fields)
+
+    def test_summarize_sessions(self):
+        """Test batch rendering in order, inline and on a worker pool"""
+        sessions = [make_session(i) for i in range(10)] + [make_session(10, CallType.INBOUND)]
+
+        inline = list(summarize_sessions(iter(sessions)))
+        pooled = list(summarize_sessions(sessions, workers=2, chunk_size=3))
+
+        self.assertEqual([s["session_id"] for s in inline], [f"S{i}" for i in range(11)])
+        self.assertIn("Caller: Caller 3", inline[3]["owner_summary"])
+        self.assertIn("Location: Irvine", inline[0]["owner_summary"])
+        self.assertIn("INBOUND", inline[10]["owner_summary"])
+        self.assertEqual(len({s["owner_summary"].splitlines()[-1] for s in inline}), 1)
+        strip = lambda rows: [row["owner_summary"].rsplit("\n", 1)[0] for row in rows]
+        self.assertEqual(strip(pooled), strip(inline))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the prompt audio cache
+"""
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.async_support import generate_twiml_response
+from voice_agent.call_flows import CallState, CallType, CallContext, FLOW_REGISTRY
+from voice_agent.prompt_audio import OfflineTTSBackend, PromptAudioCache, TTSBackend, iter_static_prompts
+from voice_agent.state_machine import OPT_OUT_PROMPT
+
+
+class CountingBackend(OfflineTTSBackend):
+    """Offline backend that counts synthesis calls"""
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize(self, text: str, voice: str) -> bytes:
+        self.calls += 1
+        return super().synthesize(text, voice)
+
+
+class TestPromptAudioCache(unittest.TestCase):
+    """Test cases for PromptAudioCache"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.backend = CountingBackend()
+        self.cache = PromptAudioCache(self.directory, backend=self.backend, base_url="https://cdn.test/audio/")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_static_prompts(self):
+        """Test static, default-rendered, clarification and fixed prompts are enumerated"""
+        prompts = list(iter_static_prompts())
+
+        self.assertEqual(len(prompts), len(set(prompts)))
+        self.assertIn("Hi, thanks for calling Afterhours. How can I help you today?", prompts)
+        self.assertIn("Great. Let's start with your business. What does your business do?", prompts)
+        self.assertIn(OPT_OUT_PROMPT, prompts)
+        self.assertNotIn("", prompts)
+
+    def test_prewarm_is_idempotent(self):
+        """Test prewarm synthesizes each prompt once, across cache instances"""
+        created = self.cache.prewarm()
+
+        self.assertEqual(created, len(list(iter_static_prompts())))
+        self.assertEqual(self.backend.calls, created)
+
+        other = PromptAudioCache(self.directory, backend=self.backend)
+        self.assertEqual(other.prewarm(), 0)
+        self.assertEqual(self.backend.calls, created)
+
+    def test_content_addressed(self):
+        """Test file names depend on backend, voice and text only"""
+        url = self.cache.synthesize("Hello there")
+        key = self.cache.key("Hello there")
+
+        self.assertEqual(url, f"https://cdn.test/audio/{key[:2]}/{key}.wav")
+        self.assertTrue(os.path.exists(self.cache.path("Hello there")))
+        self.assertNotEqual(PromptAudioCache(self.directory, backend=self.backend, voice="polly").key("Hello there"), key)
+        self.assertNotEqual(self.cache.key("Hello there!"), key)
+
+    def test_lookup_never_synthesizes(self):
+        """Test misses return None without calling the backend"""
+        self.assertIsNone(self.cache.lookup("Something dynamic, Ann"))
+        self.assertEqual(self.backend.calls, 0)
+        self.assertEqual(self.cache.get_metrics()["misses"], 1)
+
+    def test_offline_wav(self):
+        """Test the offline stub writes a mu-law 8 kHz mono WAV"""
+        audio = OfflineTTSBackend().synthesize("one two three four", "alice")
+
+        self.assertEqual(audio[:4], b"RIFF")
+        self.assertEqual(audio[8:12], b"WAVE")
+        fmt_tag, channels, rate = struct.unpack("<HHI", audio[20:28])
+        self.assertEqual((fmt_tag, channels, rate), (7, 1, 8000))
+        self.assertEqual(struct.unpack("<I", audio[4:8])[0], len(audio) - 8)
+
+    def test_twiml_play_for_cached_prompts(self):
+        """Test TwiML uses <Play> for cache hits and <Say> otherwise"""
+        self.cache.prewarm()
+        flow = FLOW_REGISTRY.get(CallType.INBOUND)
+        greeting = flow.get_next_prompt(CallState.GREETING, CallContext("CA1", CallType.INBOUND))
+
+        twiml = generate_twiml_response({"prompt": greeting}, self.cache)
+        self.assertIn(f"<Play>{self.cache.lookup(greeting)}</Play>", twiml)
+        self.assertNotIn("<Say", twiml)
+
+        twiml = generate_twiml_response({"prompt": "Thanks, Ann.", "should_end": True}, self.cache)
+        self.assertIn('<Say voice="alice">Thanks, Ann.</Say>', twiml)
+        self.assertIn("<Hangup/>", twiml)
+
+        self.assertIn("<Say", generate_twiml_response({"prompt": greeting}))
+
+    def test_failing_backend(self):
+        """Test prewarm survives a failing provider"""
+        class BrokenBackend(TTSBackend):
+            name = "broken"
+
+            def synthesize(self, text: str, voice: str) -> bytes:
+                raise RuntimeError("provider down")
+
+        cache = PromptAudioCache(self.directory, backend=BrokenBackend())
+        self.assertEqual(cache.prewarm(), 0)
+        self.assertIsNone(cache.lookup(OPT_OUT_PROMPT))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for the session log writer and reader
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.intent_detector import load_transcript_utterances
+from voice_agent.session_log import SessionLogReader, SessionLogWriter
+from voice_agent.simulate_call import SESSION_KEY, run_simulation
+
+
+def make_record(i: int) -> dict:
+    return {"call_id": f"CA{i:04d}", "transcript": [{"speaker": "caller", "text": f"line {i}"}]}
+
+
+class TestSessionLog(unittest.TestCase):
+    """Test cases for SessionLogWriter / SessionLogReader"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_size_rotation_and_lookup(self):
+        """Test records spread over rotated, indexed segments and are found by call id"""
+        with SessionLogWriter(self.directory, max_bytes=500) as writer:
+            for i in range(40):
+                writer.write(make_record(i))
+
+        self.assertGreater(len(writer.segments), 1)
+        self.assertTrue(all(os.path.exists(path[:-len(".ndjson")] + ".idx") for path in writer.segments))
+        reader = SessionLogReader(self.directory)
+        self.assertEqual(len(reader), 40)
+        self.assertEqual(reader.get("CA0017"), make_record(17))
+        self.assertIsNone(reader.get("missing"))
+        self.assertEqual([r["call_id"] for r in reader.iter_records()], [f"CA{i:04d}" for i in range(40)])
+
+    def test_compressed_segments(self):
+        """Test closed segments are gzipped and still readable by offset"""
+        with SessionLogWriter(self.directory, max_bytes=500, compress=True) as writer:
+            for i in range(20):
+                writer.write(make_record(i))
+
+        self.assertTrue(all(path.endswith(".ndjson.gz") for path in writer.segments))
+        self.assertFalse([name for name in os.listdir(self.directory) if name.endswith(".ndjson")])
+        self.assertEqual(SessionLogReader(self.directory).get("CA0019"), make_record(19))
+
+    def test_concurrent_writers_get_own_segments(self):
+        """Test two writers opened in the same second never share a segment or index"""
+        first = SessionLogWriter(self.directory)
+        second = SessionLogWriter(self.directory)
+        first.write(make_record(1))
+        second.write(make_record(2))
+        first.close()
+        second.close()
+
+        self.assertEqual(len(set(first.segments + second.segments)), 2)
+        reader = SessionLogReader(self.directory)
+        self.assertEqual(len(reader), 2)
+        self.assertEqual(reader.get("CA0001"), make_record(1))
+        self.assertEqual(reader.get("CA0002"), make_record(2))
+
+    def test_open_segment_is_scanned(self):
+        """Test flushed records in the live segment are found without an index"""
+        writer = SessionLogWriter(self.directory)
+        try:
+            writer.write(make_record(1))
+            writer.flush()
+            self.assertEqual(SessionLogReader(self.directory).get("CA0001"), make_record(1))
+        finally:
+            writer.close()
+
+    def test_time_rotation(self):
+        """Test an idle segment older than max_age_s is closed"""
+        writer = SessionLogWriter(self.directory, max_age_s=0.05, flush_interval=0.01)
+        try:
+            writer.write(make_record(1))
+            deadline = time.monotonic() + 2
+            while not writer.segments and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(len(writer.segments), 1)
+        finally:
+            writer.close()
+
+    def test_simulation_and_transcript_warmup(self):
+        """Test run_simulation appends to the log and the intent cache warms from it"""
+        with SessionLogWriter(self.directory, key=SESSION_KEY) as writer:
+            session = run_simulation("inbound", "+19495550123", session_log=writer)
+
+        self.assertEqual(SessionLogReader(self.directory, key=SESSION_KEY).get(session["session_id"]), session)
+        self.assertIn("My email is jake@example.com.", load_transcript_utterances(self.directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,8 +9,19 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from voice_agent.state_machine import VoiceAgentStateMachine
+from voice_agent.state_machine import ResponseMode, VoiceAgentStateMachine
 from voice_agent.call_flows import CallType, CallState
+from voice_agent.session_store import InMemorySessionStore
+
+
+class CountingStore(InMemorySessionStore):
+    """In-memory store that counts session loads"""
+    
+    loads = 0
+    
+    def load(self, call_id):
+        self.loads += 1
+        return super().load(call_id)
 
 
 class TestVoiceAgentStateMachine(unittest.TestCase):
@@ -155,6 +166,41 @@ class TestVoiceAgentStateMachine(unittest.TestCase):
         
         self.assertIsNotNone(summary)
         self.assertNotIn(call_id, self.sm.active_calls)
+    
+    def test_delta_response_mode(self):
+        """Test delta responses carry only what the turn changed"""
+        sm = VoiceAgentStateMachine(response_mode=ResponseMode.DELTA)
+        call_id = "test_call_delta"
+        sm.start_call(call_id, CallType.OUTBOUND)
+        
+        sm.process_user_input(call_id, "yes")
+        result = sm.process_user_input(call_id, "We're a law firm")
+        
+        self.assertNotIn("data_collected", result)
+        self.assertNotIn("conversation_history", result)
+        self.assertIn("industry", result["data_changed"])
+        self.assertEqual([e["response"] for e in result["history_added"]], ["We're a law firm"])
+        
+        result = sm.process_user_input(call_id, "Mostly scheduling by hand")
+        self.assertNotIn("business_description", result["data_changed"])
+        self.assertIn("manual_tasks", result["data_changed"])
+        
+        full = sm.process_user_input(call_id, "about 5 people", response_mode=ResponseMode.FULL)
+        self.assertIn("industry", full["data_collected"])
+        self.assertIn("conversation_history", full)
+    
+    def test_handle_turn_loads_session_once(self):
+        """Test a webhook turn starts unknown calls without a separate existence check"""
+        store = CountingStore()
+        sm = VoiceAgentStateMachine(session_store=store)
+        
+        result = sm.handle_turn("CA1", "yes", CallType.INBOUND, {"contact_phone": "+15550001111"})
+        self.assertIn("prompt", result)
+        self.assertEqual(store.loads, 1)
+        
+        sm.handle_turn("CA1", "We're a law firm", CallType.INBOUND)
+        self.assertEqual(store.loads, 2)
+        self.assertEqual(sm.active_calls["CA1"].contact_phone, "+15550001111")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,134 @@
+"""
+Unit tests for streaming partial-transcript processing
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.async_support import generate_twiml_response
+from voice_agent.benchmarks.streaming_turns import run_benchmark
+from voice_agent.call_flows import CallState, CallType
+from voice_agent.state_machine import VoiceAgentStateMachine
+from voice_agent.streaming import StreamingTurnProcessor
+
+
+def feed_words(processor: StreamingTurnProcessor, call_id: str, text: str):
+    """Feed growing partials word by word; returns (result, words fed) at commit or (None, n)"""
+    words = text.split()
+    for k in range(1, len(words) + 1):
+        result = processor.feed_partial(call_id, " ".join(words[:k]))
+        if result is not None:
+            return result, k
+    return None, len(words)
+
+
+class TestStreamingTurnProcessor(unittest.TestCase):
+    """Test cases for StreamingTurnProcessor"""
+
+    def setUp(self):
+        self.sm = VoiceAgentStateMachine()
+        self.processor = StreamingTurnProcessor(self.sm)
+
+    def test_explicit_opt_out_commits_early(self):
+        """Test an explicit opt-out is committed before the utterance ends"""
+        self.sm.start_call("CA1", CallType.OUTBOUND)
+        text = "Please stop calling me, I already told you guys last week."
+
+        result, fed = feed_words(self.processor, "CA1", text)
+
+        self.assertIsNotNone(result)
+        self.assertLess(fed, len(text.split()))
+        self.assertTrue(result["early_commit"])
+        self.assertEqual(result["state"], CallState.OPTED_OUT.value)
+        # The final transcript returns the committed result without a second turn
+        version = self.sm.sessions.load("CA1").version
+        self.assertIs(self.processor.finalize("CA1", text), result)
+        self.assertEqual(self.sm.sessions.load("CA1").version, version)
+
+    def test_bare_no_does_not_commit(self):
+        """Test "no AC" on a missed call waits for the final transcript"""
+        self.sm.start_call("CA2", CallType.MISSED)
+        text = "No AC tonight and the house is getting really hot"
+
+        result, _ = feed_words(self.processor, "CA2", text)
+        self.assertIsNone(result)
+
+        final = self.processor.finalize("CA2", text)
+        self.assertNotEqual(final["state"], CallState.OPTED_OUT.value)
+        self.assertNotIn("early_commit", final)
+
+    def test_transfer_needs_stable_intent(self):
+        """Test a single transfer partial isn't enough to commit"""
+        self.sm.start_call("CA3", CallType.INBOUND)
+
+        self.assertIsNone(self.processor.feed_partial("CA3", "can I talk to"))
+        result = self.processor.feed_partial("CA3", "can I talk to a")
+
+        self.assertTrue(result["should_transfer"])
+
+    def test_affirmative_only_in_states_without_fields(self):
+        """Test "yes" commits at the greeting but not while collecting answers"""
+        self.sm.start_call("CA4", CallType.OUTBOUND)
+        result, _ = feed_words(self.processor, "CA4", "Yes, sure. Now is a good time, go ahead.")
+        self.assertEqual(result["state"], CallState.BUSINESS_DISCOVERY.value)
+        self.assertIs(self.processor.finalize("CA4", "Yes, sure. Now is a good time, go ahead."), result)
+
+        result, _ = feed_words(self.processor, "CA4", "Sure we are a small law firm downtown")
+        self.assertIsNone(result)
+
+    def test_affirmative_then_decline_reprocesses(self):
+        """Test "yes but not now" doesn't keep an early affirmative commit"""
+        self.sm.start_call("CA6", CallType.OUTBOUND)
+        text = "yes but not now call me later"
+
+        # "yes but" is no longer a bare affirmative, so nothing commits
+        self.assertIsNone(self.processor.feed_partial("CA6", "yes"))
+        self.assertIsNone(self.processor.feed_partial("CA6", "yes but"))
+        self.assertEqual(self.processor.finalize("CA6", text)["state"], CallState.OPTED_OUT.value)
+
+        # Committed on "yes, sure", then the final transcript declines
+        self.sm.start_call("CA7", CallType.OUTBOUND)
+        self.assertIsNone(self.processor.feed_partial("CA7", "yes"))
+        committed = self.processor.feed_partial("CA7", "yes sure")
+        self.assertEqual(committed["state"], CallState.BUSINESS_DISCOVERY.value)
+
+        final = self.processor.finalize("CA7", "yes sure but not now call me later")
+        self.assertEqual(final["state"], CallState.OPTED_OUT.value)
+        self.assertEqual(self.sm.sessions.load("CA7").current_state, CallState.OPTED_OUT)
+        self.assertEqual(self.processor.get_metrics()["reprocessed_turns"], 1)
+
+        # Same answers as processing the final transcripts without streaming
+        reference = VoiceAgentStateMachine()
+        reference.start_call("ref", CallType.OUTBOUND)
+        self.assertEqual(reference.process_user_input("ref", text)["state"], CallState.OPTED_OUT.value)
+
+    def test_unknown_call_and_end(self):
+        """Test unknown calls never commit and ended calls drop their state"""
+        self.assertIsNone(self.processor.feed_partial("missing", "stop calling me"))
+        self.assertIn("error", self.processor.finalize("missing", "stop calling me"))
+
+        self.sm.start_call("CA5", CallType.INBOUND)
+        self.processor.feed_partial("CA5", "hello")
+        self.sm.end_call("CA5")
+        self.assertEqual(self.processor.get_metrics()["open_turns"], 0)
+
+    def test_partial_callback_twiml(self):
+        """Test Gather asks Twilio for partial results when configured"""
+        twiml = generate_twiml_response({"prompt": "Hi"}, partial_result_callback="/twilio/partial")
+        self.assertIn('partialResultCallback="/twilio/partial"', twiml)
+
+    def test_benchmark_latency(self):
+        """Test decisive scripts are ready before end of speech and others are unchanged"""
+        report = run_benchmark(endpoint_s=5.0)
+
+        for name in ("outbound_opt_out", "inbound_transfer", "missed_opt_out"):
+            self.assertEqual(report[name]["early_commits"], 1)
+            self.assertLess(report[name]["streaming_ms"], report[name]["baseline_ms"] - 5000)
+        self.assertEqual(report["missed_call"]["early_commits"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Unit tests for missed-call urgency classification
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from voice_agent.async_support import generate_twiml_response
+from voice_agent.benchmarks.urgency_turn import run_benchmark
+from voice_agent.call_flows import CallType
+from voice_agent.keyword_matcher import compile_alternation
+from voice_agent.owner_summary import build_owner_summary
+from voice_agent.state_machine import EMERGENCY_TRANSFER_PROMPT, VoiceAgentStateMachine
+from voice_agent.urgency import UrgencyClassifier, UrgencyLevel, classify_urgency
+
+
+class TestUrgencyClassifier(unittest.TestCase):
+    """Test cases for UrgencyClassifier"""
+
+    def test_levels(self):
+        """Test hazards, weighted scores and can-wait cues"""
+        self.assertEqual(classify_urgency("I'm in Orange and I smell gas in the kitchen").level, UrgencyLevel.EMERGENCY)
+        self.assertEqual(classify_urgency("water is pouring through the ceiling").level, UrgencyLevel.EMERGENCY)
+        self.assertEqual(classify_urgency("My AC stopped", "Pretty urgent, we’ve got kids").level, UrgencyLevel.HIGH)
+        self.assertEqual(classify_urgency("My AC stopped").level, UrgencyLevel.MEDIUM)
+        self.assertEqual(classify_urgency("My AC stopped", "It can wait until tomorrow").level, UrgencyLevel.LOW)
+        self.assertEqual(classify_urgency("", None).level, UrgencyLevel.MEDIUM)
+
+    def test_longest_phrase_wins(self):
+        """Test negations and detectors aren't scored as their shorter keywords"""
+        result = classify_urgency("Not urgent, the smoke detector keeps chirping")
+        self.assertEqual(result.matches, ("not urgent", "smoke detector"))
+        self.assertEqual(result.level, UrgencyLevel.LOW)
+        # whole words only
+        self.assertEqual(classify_urgency("my firefighter neighbour says hi").matches, ())
+
+    def test_business_keywords(self):
+        """Test business-specific emergency phrases"""
+        classifier = UrgencyClassifier(emergency_keywords=["Walk-in Freezer"])
+        self.assertEqual(classifier.classify("the walk-in freezer is warm").level, UrgencyLevel.EMERGENCY)
+        self.assertEqual(classify_urgency("the walk-in freezer is warm").level, UrgencyLevel.MEDIUM)
+
+    def test_compile_alternation(self):
+        """Test every keyword occurrence is found, longest first"""
+        pattern = compile_alternation(["no heat", "no hot water", "heat"], whole_words=True)
+        self.assertEqual(pattern.findall("no hot water, no heat, heater"), ["no hot water", "no heat"])
+
+    def test_benchmark_runs(self):
+        """Test the benchmark reports all three paths"""
+        results = run_benchmark(turns=200)
+        self.assertEqual(set(results), {"per_keyword", "compiled", "cached"})
+
+
+class TestMissedCallUrgency(unittest.TestCase):
+    """Test cases for urgency in MissedCallFlow"""
+
+    def setUp(self):
+        self.sm = VoiceAgentStateMachine()
+        self.sm.start_call("m1", CallType.MISSED)
+
+    def test_level_stored(self):
+        """Test the level is kept in collected data and the flow continues"""
+        self.sm.process_user_input("m1", "I'm in Irvine, my AC stopped")
+        result = self.sm.process_user_input("m1", "Pretty urgent, no AC tonight and we have kids")
+
+        self.assertEqual(result["data_collected"]["urgency_level"], "HIGH")
+        self.assertEqual(result["state"], "timeline_interest")
+        self.assertFalse(result["should_transfer"])
+
+    def test_emergency_transfers(self):
+        """Test an emergency skips the rest of the flow"""
+        result = self.sm.process_user_input("m1", "A pipe burst and water is everywhere")
+
+        self.assertEqual(result["state"], "transferred")
+        self.assertTrue(result["should_transfer"])
+        self.assertFalse(result["should_end"])
+        self.assertEqual(result["prompt"], EMERGENCY_TRANSFER_PROMPT)
+        self.assertEqual(result["data_collected"]["urgency_level"], "EMERGENCY")
+
+        summary = build_owner_summary(CallType.MISSED, "m1", "+19495550123", result)
+        self.assertIn("Urgency: EMERGENCY", summary)
+        self.assertIn("Transferred to on-call", summary)
+
+    def test_emergency_twiml_speaks_before_dial(self):
+        """Test the 911 prompt is played before the call is transferred"""
+        result = self.sm.process_user_input("m1", "I smell gas in the kitchen")
+        twiml = generate_twiml_response(result)
+
+        self.assertIn(f'<Say voice="alice">{EMERGENCY_TRANSFER_PROMPT}</Say>', twiml)
+        self.assertLess(twiml.index("<Say"), twiml.index("<Dial>"))
+
+
+if __name__ == '__main__':
+    unittest.main()
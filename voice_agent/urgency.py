@@ -0,0 +1,200 @@
+"""
+Urgency classification for missed calls
+
+Scores what the caller said about the issue and its urgency. All keyword
+phrases ("burst pipe", "no heat", "not urgent", ...) are compiled into one
+prefix-factored regex and found in a single pass; a few weighted patterns
+cover phrasings with gaps ("water is pouring through the ceiling"). Each
+category counts once, and the weights add up to a score:
+
+    EMERGENCY  a safety hazard was mentioned (gas, flooding, fire, CO, ...)
+    HIGH       score >= high_threshold (e.g. no heat + kids)
+    LOW        score <= low_threshold (e.g. "it can wait until tomorrow")
+    MEDIUM     anything else
+
+Levels use the same names as the dispatch service's emergency levels.
+Keyword lists follow dispatch_loop/lib/urgencyClassifier.js.
+
+    UrgencyClassifier().classify("I smell gas in the basement").level
+    # UrgencyLevel.EMERGENCY
+"""
+
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+from .keyword_matcher import compile_alternation
+
+
+CLASSIFY_CACHE_SIZE = 4096
+
+
+class UrgencyLevel(Enum):
+    """Urgency of a missed call, lowest first"""
+    LOW = "LOW"
+    MEDIUM = "MEDIUM"
+    HIGH = "HIGH"
+    EMERGENCY = "EMERGENCY"
+
+    @property
+    def rank(self) -> int:
+        return _LEVEL_RANK[self]
+
+
+_LEVEL_RANK = {level: rank for rank, level in enumerate(UrgencyLevel)}
+
+
+class UrgencyCategory(NamedTuple):
+    """Keyword phrases that add `weight` to the score (once per category)"""
+    name: str
+    weight: float
+    keywords: Tuple[str, ...]
+    hazard: bool = False
+
+
+class UrgencyPattern(NamedTuple):
+    """Regex counted towards a category (for phrases keywords can't express)"""
+    category: str
+    pattern: "re.Pattern"
+
+
+class UrgencyResult(NamedTuple):
+    level: UrgencyLevel
+    score: float
+    matches: Tuple[str, ...]  # first matched phrase per category
+
+
+URGENCY_CATEGORIES = (
+    UrgencyCategory("gas", 5, (
+        "gas smell", "gas leak", "leaking gas", "smell gas", "smells like gas", "smell of gas", "rotten eggs",
+    ), hazard=True),
+    UrgencyCategory("flooding", 5, (
+        "burst pipe", "pipe burst", "pipe broke", "broken pipe", "burst line", "broken main", "water main",
+        "flood", "flooding", "flooded", "water everywhere", "gushing", "sewage backup", "sewer backup",
+        "sewage overflow", "sewage coming up",
+    ), hazard=True),
+    UrgencyCategory("fire", 5, (
+        "fire", "smoke", "burning smell", "smells like burning", "sparking", "sparks", "electrical fire",
+    ), hazard=True),
+    UrgencyCategory("carbon_monoxide", 5, (
+        "carbon monoxide", "co alarm", "co detector",
+    ), hazard=True),
+    UrgencyCategory("service_loss", 2, (
+        "no heat", "no water", "no hot water", "no air", "no ac", "no a/c", "ac broken", "ac is broken",
+        "ac stopped", "ac went out", "furnace broken", "furnace is out", "furnace went out",
+        "furnace won't turn on", "heater broken", "heat won't turn on", "frozen pipe", "frozen pipes",
+        "water leak", "leak", "leaking", "water damage", "power outage",
+        "no power", "circuit breaker", "breaker keeps tripping", "sewage smell", "toilet overflowing",
+        "backed up",
+    )),
+    UrgencyCategory("emergency", 2, ("emergency",)),
+    UrgencyCategory("urgent", 1, (
+        "urgent", "asap", "immediately", "right now", "right away", "tonight", "getting worse",
+    )),
+    UrgencyCategory("vulnerable", 1, (
+        "kids", "children", "baby", "infant", "newborn", "elderly", "pregnant", "disabled",
+        "medical condition", "oxygen",
+    )),
+    # A beeping detector is a nuisance, not a fire ("smoke detector" beats "smoke")
+    UrgencyCategory("detector", 0, ("smoke detector", "smoke alarm")),
+    UrgencyCategory("can_wait", -3, (
+        "can wait", "not urgent", "not an emergency", "no rush", "no hurry", "whenever", "not a big deal",
+        "next week", "sometime this week", "tomorrow is fine", "tomorrow's fine", "morning is fine",
+    )),
+)
+
+URGENCY_PATTERNS = (
+    UrgencyPattern("flooding", re.compile(
+        r"\bwater (?:is |keeps )?(?:coming|pouring|spraying|gushing|running) (?:in|out|through|from|down|everywhere)\b"
+    )),
+    UrgencyPattern("flooding", re.compile(r"\bcan(?:no|')?t (?:turn|shut) (?:off )?the water\b")),
+)
+
+DEFAULT_HIGH_THRESHOLD = 3
+DEFAULT_LOW_THRESHOLD = -1
+
+
+class UrgencyClassifier:
+    """Scores caller text into an UrgencyLevel"""
+
+    def __init__(
+        self,
+        categories: Sequence[UrgencyCategory] = URGENCY_CATEGORIES,
+        patterns: Sequence[UrgencyPattern] = URGENCY_PATTERNS,
+        emergency_keywords: Sequence[str] = (),
+        high_threshold: float = DEFAULT_HIGH_THRESHOLD,
+        low_threshold: float = DEFAULT_LOW_THRESHOLD
+    ):
+        """
+        Args:
+            categories: Weighted keyword categories
+            patterns: Extra regexes counted towards a category
+            emergency_keywords: Business-specific phrases that always mean EMERGENCY
+            high_threshold: Minimum score for HIGH
+            low_threshold: Maximum score for LOW
+        """
+        if emergency_keywords:
+            categories = tuple(categories) + (
+                UrgencyCategory("business_emergency", 5, tuple(k.lower() for k in emergency_keywords), hazard=True),
+            )
+        self.weights: Dict[str, float] = {c.name: c.weight for c in categories}
+        self.hazards = frozenset(c.name for c in categories if c.hazard)
+        self.high_threshold = high_threshold
+        self.low_threshold = low_threshold
+
+        # keyword -> category; a keyword listed twice keeps its first category
+        self._categories: Dict[str, str] = {}
+        for category in categories:
+            for keyword in category.keywords:
+                self._categories.setdefault(keyword, category.name)
+        self._keywords = compile_alternation(list(self._categories), whole_words=True)
+        self._patterns = tuple(patterns)
+        for pattern in self._patterns:
+            if pattern.category not in self.weights:
+                raise ValueError(f"Urgency pattern {pattern.pattern.pattern!r} has unknown category {pattern.category!r}")
+        # Callers repeat the same phrasing a lot ("pretty urgent", "it can wait")
+        self._cached_classify = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self._classify)
+
+    def classify(self, *texts: Optional[str]) -> UrgencyResult:
+        """
+        Classify one or more pieces of caller text together
+
+        Args:
+            texts: e.g. the issue description and the answer to "how urgent is this?"
+
+        Returns:
+            UrgencyResult(level, score, matches)
+        """
+        return self._cached_classify(" ".join(text for text in texts if text).lower().replace("’", "'"))
+
+    def _classify(self, text: str) -> UrgencyResult:
+        categories = self._categories
+        seen: Dict[str, str] = {}
+        for match in self._keywords.finditer(text):
+            phrase = match.group()
+            seen.setdefault(categories[phrase], phrase)
+        for category, pattern in self._patterns:
+            if category not in seen:
+                match = pattern.search(text)
+                if match:
+                    seen[category] = match.group()
+
+        score = sum(self.weights[category] for category in seen)
+        if not self.hazards.isdisjoint(seen):
+            level = UrgencyLevel.EMERGENCY
+        elif score >= self.high_threshold:
+            level = UrgencyLevel.HIGH
+        elif score <= self.low_threshold:
+            level = UrgencyLevel.LOW
+        else:
+            level = UrgencyLevel.MEDIUM
+        return UrgencyResult(level, score, tuple(seen.values()))
+
+
+URGENCY_CLASSIFIER = UrgencyClassifier()
+
+
+def classify_urgency(*texts: Optional[str]) -> UrgencyResult:
+    """Classify with the default classifier"""
+    return URGENCY_CLASSIFIER.classify(*texts)